@@ -0,0 +1,251 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+
+class ApiTestCase(TestCase):
+    def post_json(self, url, payload):
+        return self.client.post(url, json.dumps(payload), content_type='application/json')
+
+
+class NewtonRaphsonApiTest(ApiTestCase):
+    url = '/api/v1/newton-raphson/'
+
+    def test_hasil_dengan_trace(self):
+        response = self.post_json(self.url, {'f_expr': 'x**2 - 2', 'x0': 1, 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertAlmostEqual(body['root'], 2 ** 0.5, places=6)
+        self.assertTrue(body['converged'])
+        self.assertEqual(body['f_prime'], '2*x')
+        self.assertEqual(len(body['trace']), body['iterations'])
+
+    def test_tanpa_trace(self):
+        response = self.post_json(self.url, {
+            'f_expr': 'x**2 - 2', 'x0': 1, 'tol': 1e-8, 'max_iter': 50, 'include_trace': False,
+        })
+        self.assertNotIn('trace', response.json())
+
+    def test_validasi_tipe(self):
+        response = self.post_json(self.url, {'f_expr': 'x**2 - 2', 'x0': '1', 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'x0')
+
+    def test_ekspresi_tidak_valid(self):
+        response = self.post_json(self.url, {'f_expr': 'x +', 'x0': 1, 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'f_expr')
+
+    def test_turunan_nol(self):
+        response = self.post_json(self.url, {'f_expr': 'x**2 + 1', 'x0': 0, 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 422)
+
+    def test_iterasi_kompleks_tidak_konvergen(self):
+        response = self.post_json(self.url, {'f_expr': 'x**0.5 - 2', 'x0': -1, 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 200)
+        # parse_constant hanya dipanggil untuk NaN/Infinity, yang bukan JSON valid
+        body = json.loads(response.content, parse_constant=self.fail)
+        self.assertIsNone(body['root'])
+        self.assertFalse(body['converged'])
+
+    def test_pembagian_nol(self):
+        response = self.post_json(self.url, {'f_expr': '1/x', 'x0': 0, 'tol': 1e-8, 'max_iter': 50})
+        self.assertEqual(response.status_code, 422)
+
+    def test_iterasi_non_finite_tidak_konvergen(self):
+        response = self.post_json(self.url, {'f_expr': 'exp(x)', 'x0': 1000, 'tol': 1e-8, 'max_iter': 5})
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.content, parse_constant=self.fail)
+        self.assertIsNone(body['root'])
+        self.assertFalse(body['converged'])
+        self.assertIsNone(body['trace'][0]['f_x'])
+
+    def test_hanya_post_json(self):
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+        response = self.client.post(self.url, 'bukan json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class SecantApiTest(ApiTestCase):
+    def test_hasil(self):
+        response = self.post_json('/api/v1/secant/', {
+            'f_expr': 'x**2 - 2', 'x0': 1, 'x1': 2, 'tol': 1e-8, 'max_iter': 50, 'include_trace': False,
+        })
+        body = response.json()
+        self.assertAlmostEqual(body['root'], 2 ** 0.5, places=6)
+        self.assertTrue(body['converged'])
+
+
+class RegulaFalsiApiTest(ApiTestCase):
+    url = '/api/v1/regula-falsi/'
+
+    def test_hasil_tanpa_trace(self):
+        response = self.post_json(self.url, {
+            'f_expr': 'x**2 - 2', 'a': 0, 'b': 2, 'tol': 1e-8, 'max_iter': 200, 'include_trace': False,
+        })
+        body = response.json()
+        self.assertAlmostEqual(body['root'], 2 ** 0.5, places=6)
+        self.assertTrue(body['converged'])
+        self.assertNotIn('trace', body)
+
+    def test_validasi(self):
+        response = self.post_json(self.url, {'f_expr': 'x', 'a': 0, 'b': '2', 'tol': 1e-8, 'max_iter': 10})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'b')
+        response = self.post_json(self.url, {'f_expr': 'open("f")', 'a': 0, 'b': 2, 'tol': 1e-8, 'max_iter': 10})
+        self.assertEqual(response.json()['field'], 'f_expr')
+        response = self.post_json(self.url, {
+            'f_expr': '1' + '0' * 400 + '*x - 1', 'a': 0, 'b': 2, 'tol': 1e-8, 'max_iter': 10,
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'f_expr')
+
+    def test_interval_tanpa_akar(self):
+        response = self.post_json(self.url, {'f_expr': 'x**2 + 1', 'a': 0, 'b': 2, 'tol': 1e-8, 'max_iter': 10})
+        self.assertEqual(response.status_code, 422)
+        response = self.post_json(self.url, {'f_expr': 'log(x)', 'a': -1, 'b': 2, 'tol': 1e-8, 'max_iter': 10})
+        self.assertEqual(response.status_code, 422)
+
+
+class GaussApiTest(ApiTestCase):
+    url = '/api/v1/gauss/'
+
+    def test_solusi(self):
+        response = self.post_json(self.url, {'matrix': [[1, 1, 1], [1, 2, -1], [2, 1, 2]], 'results': [6, 2, 10]})
+        body = response.json()
+        self.assertEqual([round(v, 9) for v in body['solution']], [1.0, 2.0, 3.0])
+        self.assertIn('steps', body['trace'])
+
+    def test_ukuran_tidak_sesuai(self):
+        response = self.post_json(self.url, {'matrix': [[1, 2], [3, 4]], 'results': [1, 2, 3]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_elemen_tidak_terbatas(self):
+        # NaN, Infinity, dan bilangan bulat di luar jangkauan float ditolak sebelum sampai ke solver
+        for field, body in [
+            ('matrix', '{"matrix": [[NaN, 1], [1, 2]], "results": [1, 2], "engine": "lu"}'),
+            ('matrix', '{"matrix": [[1%s, 1], [1, 2]], "results": [1, 2]}' % ('0' * 400)),
+            ('results', '{"matrix": [[1, 1], [1, 2]], "results": [1e400, 2]}'),
+            ('sparse.values', '{"sparse": {"format": "coo", "rows": [0], "cols": [0], "values": [Infinity]}, '
+                              '"results": [1]}'),
+        ]:
+            response = self.client.post(self.url, body, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['field'], field)
+
+    def test_engine_lu(self):
+        payload = {'matrix': [[1, 1, 1], [1, 2, -1], [2, 1, 2]], 'results': [6, 2, 10], 'engine': 'lu'}
+        body = self.post_json(self.url, payload).json()
+        self.assertEqual([round(v, 9) for v in body['solution']], [1.0, 2.0, 3.0])
+        self.assertNotIn('trace', body)
+        self.assertTrue(self.post_json(self.url, payload).json()['factorization_cached'])
+
+    def test_input_sparse_coo_otomatis(self):
+        n = 1000
+        rows = [i for i in range(n) for _ in (0, 1)][:-1]
+        cols = [j for i in range(n) for j in (i, i + 1)][:-1]
+        values = [4.0 if i == j else -1.0 for i, j in zip(rows, cols)]
+        body = self.post_json(self.url, {
+            'sparse': {'format': 'coo', 'rows': rows, 'cols': cols, 'values': values},
+            'results': [1.0] * n,
+        }).json()
+        self.assertEqual(body['engine'], 'sparse')
+        self.assertEqual(body['method'], 'spsolve')
+        self.assertLess(body['residual'], 1e-12)
+        self.assertEqual(len(body['solution']), n)
+
+    def test_input_sparse_csr_dengan_cg(self):
+        payload = {
+            'sparse': {'format': 'csr', 'data': [2, 1, 1, 3], 'indices': [0, 1, 0, 1], 'indptr': [0, 2, 4]},
+            'results': [3, 5], 'engine': 'sparse', 'sparse_method': 'cg',
+        }
+        body = self.post_json(self.url, payload).json()
+        self.assertEqual([round(v, 9) for v in body['solution']], [0.8, 1.4])
+        self.assertEqual(body['method'], 'cg')
+
+        payload['engine'] = 'langkah'
+        body = self.post_json(self.url, payload).json()
+        self.assertEqual([round(v, 9) for v in body['solution']], [0.8, 1.4])
+
+    def test_engine_iteratif(self):
+        payload = {'matrix': [[4, 1], [1, 3]], 'results': [1, 2], 'engine': 'gauss-seidel', 'tol': 1e-12}
+        body = self.post_json(self.url, payload).json()
+        self.assertTrue(body['converged'])
+        self.assertEqual([round(v, 9) for v in body['solution']], [round(1 / 11, 9), round(7 / 11, 9)])
+        self.assertEqual(len(body['trace']['residuals']), body['iterations'] + 1)
+
+        payload.update(engine='sor', omega=2.5)
+        self.assertEqual(self.post_json(self.url, payload).json()['field'], 'omega')
+
+    def test_input_sparse_besar_ditolak_untuk_engine_dense(self):
+        # Payload COO kecil dengan n besar tidak boleh diubah menjadi matriks dense n x n
+        n = 50_000
+        for engine in ('lu', 'langkah'):
+            response = self.post_json(self.url, {
+                'sparse': {'format': 'coo', 'rows': [0], 'cols': [0], 'values': [1.0]},
+                'results': [1.0] * n, 'engine': engine,
+            })
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()['field'], 'engine')
+        # Mode 'auto' yang memilih LU untuk input sparse yang rapat juga dibatasi
+        with mock.patch('api.views.MAX_SPARSE_DENSE_SIZE', {'lu': 5, 'langkah': 5}):
+            response = self.post_json(self.url, {
+                'sparse': {'format': 'coo', 'rows': [i // 8 for i in range(64)], 'cols': [i % 8 for i in range(64)],
+                           'values': [float(i + 1) for i in range(64)]},
+                'results': [1.0] * 8,
+            })
+        self.assertEqual(response.json()['field'], 'engine')
+
+    def test_input_sparse_tidak_valid(self):
+        response = self.post_json(self.url, {
+            'sparse': {'format': 'coo', 'rows': [0, 3], 'cols': [0, 1], 'values': [1, 1]}, 'results': [1, 2],
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'sparse')
+        response = self.post_json(self.url, {'sparse': {'format': 'dia'}, 'results': [1, 2]})
+        self.assertEqual(response.json()['field'], 'sparse.format')
+
+
+class BatchApiTest(ApiTestCase):
+    url = '/api/v1/batch/'
+
+    def test_newton_dikelompokkan_per_ekspresi(self):
+        problems = [
+            {'f_expr': 'x**2 - 2', 'x0': 1, 'tol': 1e-10, 'max_iter': 50},
+            {'f_expr': 'x**2 + 1', 'x0': 0, 'tol': 1e-10, 'max_iter': 50},
+            {'f_expr': ' x**2  - 2', 'x0': -1, 'tol': 1e-10, 'max_iter': 50},
+            {'f_expr': 'x +', 'x0': 1, 'tol': 1e-10, 'max_iter': 50},
+            {'f_expr': 'x**2 - 2', 'x0': 1, 'tol': 1e-10, 'max_iter': 2},
+        ]
+        response = self.post_json(self.url, {'method': 'newton-raphson', 'problems': problems})
+        results = response.json()['results']
+        self.assertAlmostEqual(results[0]['root'], 2 ** 0.5)
+        self.assertEqual(results[1]['status'], 'zero_derivative')
+        self.assertAlmostEqual(results[2]['root'], -(2 ** 0.5))
+        self.assertEqual(results[3]['status'], 'invalid_expression')
+        self.assertEqual(results[4]['status'], 'max_iter')
+        self.assertEqual(results[4]['iterations'], 2)
+
+    def test_sama_dengan_endpoint_tunggal(self):
+        problem = {'f_expr': 'exp(-x) - x', 'x0': 0, 'x1': 1, 'tol': 1e-9, 'max_iter': 50}
+        single = self.post_json('/api/v1/secant/', problem).json()
+        result = self.post_json(self.url, {'method': 'secant', 'problems': [problem]}).json()['results'][0]
+        self.assertAlmostEqual(result['root'], single['root'])
+        self.assertEqual(result['iterations'], single['iterations'])
+
+    def test_regula_falsi_memakai_interval(self):
+        problems = [
+            {'f_expr': 'x**2 - 2', 'a': 0, 'b': 2, 'tol': 1e-10, 'max_iter': 100},
+            {'f_expr': 'x**2 - 2', 'a': 2, 'b': 3, 'tol': 1e-10, 'max_iter': 100},
+        ]
+        results = self.post_json(self.url, {'method': 'regula-falsi', 'problems': problems}).json()['results']
+        self.assertAlmostEqual(results[0]['root'], 2 ** 0.5)
+        self.assertEqual(results[1]['status'], 'no_sign_change')
+
+    def test_validasi_per_soal(self):
+        response = self.post_json(self.url, {
+            'method': 'secant', 'problems': [{'f_expr': 'x', 'x0': 0, 'tol': 1e-6, 'max_iter': 5}],
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'problems[0].x1')
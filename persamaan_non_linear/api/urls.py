@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import batch, gauss, job_status, job_submit, newton_raphson, regula_falsi, secant
+
+urlpatterns = [
+    path('newton-raphson/', newton_raphson, name='api-newton-raphson'),
+    path('secant/', secant, name='api-secant'),
+    path('regula-falsi/', regula_falsi, name='api-regula-falsi'),
+    path('gauss/', gauss, name='api-gauss'),
+    path('batch/', batch, name='api-batch'),
+    path('jobs/', job_submit, name='api-job-submit'),
+    path('jobs/<uuid:job_id>/', job_status, name='api-job-status'),
+]
@@ -0,0 +1,174 @@
+"""
+Validasi bertipe untuk body JSON pada endpoint API.
+
+Setiap fungsi mengambil satu field dari dict payload, memeriksa tipenya, dan
+melempar ValidationError berisi nama field jika tidak valid.
+"""
+import json
+import math
+
+
+class ValidationError(ValueError):
+    """Input API tidak valid; `field` berisi nama field yang bermasalah (jika ada)."""
+
+    def __init__(self, message, field=None):
+        super().__init__(message)
+        self.message = message
+        self.field = field
+
+    def __reduce__(self):
+        # Agar `field` tetap ada saat exception dikirim balik dari pool proses solver
+        return type(self), (self.message, self.field)
+
+
+def parse_json_body(req):
+    """
+    Mengubah body permintaan menjadi dict.
+
+    Parameters:
+    req (HttpRequest): Objek permintaan dengan body JSON.
+
+    Returns:
+    dict: Payload JSON.
+    """
+    try:
+        payload = json.loads(req.body or b'{}')
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise ValidationError("Body permintaan bukan JSON yang valid.")
+    if not isinstance(payload, dict):
+        raise ValidationError("Body permintaan harus berupa objek JSON.")
+    return payload
+
+
+def is_finite_number(value):
+    """Memeriksa apakah value berupa angka (int/float, bukan bool) yang muat sebagai float terbatas."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    try:
+        # Bilangan bulat yang terlalu besar untuk float melempar OverflowError
+        return math.isfinite(float(value))
+    except OverflowError:
+        return False
+
+
+def get_float(payload, field, required=True, default=None, positive=False):
+    """Mengambil field bertipe angka (int/float) yang terbatas (bukan NaN/inf)."""
+    value = payload.get(field, default)
+    if value is None:
+        if required:
+            raise ValidationError("Field wajib diisi.", field)
+        return default
+    if not is_finite_number(value):
+        raise ValidationError("Harus berupa angka.", field)
+    if positive and value <= 0:
+        raise ValidationError("Harus lebih besar dari nol.", field)
+    return float(value)
+
+
+def get_int(payload, field, required=True, default=None, min_value=None, max_value=None):
+    """Mengambil field bertipe bilangan bulat dengan batas opsional."""
+    value = payload.get(field, default)
+    if value is None:
+        if required:
+            raise ValidationError("Field wajib diisi.", field)
+        return default
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValidationError("Harus berupa bilangan bulat.", field)
+    if min_value is not None and value < min_value:
+        raise ValidationError(f"Minimal {min_value}.", field)
+    if max_value is not None and value > max_value:
+        raise ValidationError(f"Maksimal {max_value}.", field)
+    return value
+
+
+def get_str(payload, field, max_length=1000):
+    """Mengambil field string yang tidak kosong."""
+    value = payload.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise ValidationError("Harus berupa string yang tidak kosong.", field)
+    if len(value) > max_length:
+        raise ValidationError(f"Maksimal {max_length} karakter.", field)
+    return value
+
+
+def get_bool(payload, field, default):
+    """Mengambil field boolean opsional."""
+    value = payload.get(field, default)
+    if not isinstance(value, bool):
+        raise ValidationError("Harus berupa boolean.", field)
+    return value
+
+
+def get_vector(payload, field):
+    """Mengambil list angka terbatas (bukan NaN/inf) satu dimensi."""
+    value = payload.get(field)
+    if not isinstance(value, list) or not value:
+        raise ValidationError("Harus berupa list angka yang tidak kosong.", field)
+    for item in value:
+        if not is_finite_number(item):
+            raise ValidationError("Semua elemen harus berupa angka.", field)
+    return value
+
+
+def get_matrix(payload, field, n_rows=None):
+    """Mengambil matriks persegi berupa list dari list angka terbatas (bukan NaN/inf)."""
+    value = payload.get(field)
+    if not isinstance(value, list) or not value:
+        raise ValidationError("Harus berupa list dari list angka.", field)
+    n = len(value)
+    for row in value:
+        if not isinstance(row, list) or len(row) != n:
+            raise ValidationError("Matriks harus persegi.", field)
+        for item in row:
+            if not is_finite_number(item):
+                raise ValidationError("Semua elemen harus berupa angka.", field)
+    if n_rows is not None and n != n_rows:
+        raise ValidationError("Ukuran matriks tidak sesuai dengan vektor hasil.", field)
+    return value
+
+
+def get_int_list(payload, field):
+    """Mengambil list bilangan bulat (boleh kosong)."""
+    value = payload.get(field)
+    if not isinstance(value, list):
+        raise ValidationError("Harus berupa list bilangan bulat.", field)
+    for item in value:
+        if isinstance(item, bool) or not isinstance(item, int):
+            raise ValidationError("Semua elemen harus berupa bilangan bulat.", field)
+    return value
+
+
+# Field yang wajib ada untuk setiap format matriks sparse
+SPARSE_FIELDS = {
+    'coo': ('rows', 'cols', 'values'),
+    'csr': ('data', 'indices', 'indptr'),
+}
+
+
+def get_sparse(payload, field):
+    """
+    Mengambil matriks sparse berupa objek {"format": "coo", "rows", "cols", "values"}
+    atau {"format": "csr", "data", "indices", "indptr"}.
+
+    Returns:
+    tuple: Nama format dan dict berisi list untuk setiap field format tersebut.
+    """
+    value = payload.get(field)
+    if not isinstance(value, dict):
+        raise ValidationError("Harus berupa objek matriks sparse.", field)
+    sparse_format = value.get('format')
+    if sparse_format not in SPARSE_FIELDS:
+        raise ValidationError(f"Harus salah satu dari: {', '.join(SPARSE_FIELDS)}.", f'{field}.format')
+    arrays = {}
+    for name in SPARSE_FIELDS[sparse_format]:
+        if name in ('values', 'data'):
+            values = value.get(name)
+            if not isinstance(values, list) or not all(is_finite_number(item) for item in values):
+                raise ValidationError("Harus berupa list angka.", f'{field}.{name}')
+            arrays[name] = values
+        else:
+            try:
+                arrays[name] = get_int_list(value, name)
+            except ValidationError as exc:
+                raise ValidationError(exc.message, f'{field}.{name}')
+    return sparse_format, arrays
@@ -0,0 +1,542 @@
+"""
+Endpoint JSON untuk semua solver, terpisah dari rendering HTML dan grafik.
+
+Setiap endpoint menerima body JSON lewat POST dan mengembalikan hasil dalam JSON.
+Field opsional `include_trace` (default true) dapat diset false untuk membuang
+riwayat per iterasi dari respons.
+
+Setiap solver terdiri dari dua fungsi: read_<solver> memvalidasi payload (cepat,
+melempar ValidationError) dan solve_<solver> menjalankan perhitungan lalu
+mengembalikan (body, status). Pasangan ini dipakai oleh endpoint sinkron maupun
+oleh job asinkron di /api/v1/jobs/.
+"""
+from functools import wraps
+import math
+import numbers
+
+from asgiref.sync import iscoroutinefunction
+
+import numpy as np
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from core.instrumentation import phase
+from core.offload import SolverTimeout, call_in_pool, run_in_pool, run_in_thread
+from gaus.views import ENGINES, pilih_engine
+from jobs.models import Job
+from jobs.runner import submit_job
+from solvers.batch import METHODS, solve_batch
+from solvers.gauss import eliminasi_gauss
+from solvers.iterative import DEFAULT_OMEGA, ITERATIVE_METHODS, solve_iterative
+from solvers.lu import solve_lu
+from solvers.math_expression import compile_expression
+from solvers.parsing import MAX_DIMENSION
+from solvers.roots import metode_regula_falsi, metode_secant, newton_rapshon
+from solvers.sparse import SPARSE_METHODS, density, from_coo, from_csr, solve_sparse
+from .validation import (
+    ValidationError, get_bool, get_float, get_int, get_matrix, get_sparse, get_str, get_vector, parse_json_body,
+)
+
+# Batas atas jumlah iterasi yang boleh diminta lewat API
+MAX_ITER = 10 ** 7
+
+# Batas jumlah soal dalam satu permintaan batch
+MAX_BATCH_SIZE = 10000
+
+# Matriks dari field `sparse` diubah ke dense untuk engine 'lu' dan 'langkah'. Ukurannya dibatasi agar
+# payload COO kecil dengan n besar tidak mengalokasikan n² elemen; engine 'langkah' juga menyimpan n matriks n x n
+MAX_SPARSE_DENSE_SIZE = {'lu': MAX_DIMENSION, 'langkah': 100}
+
+# Error yang mungkin muncul saat mem-parse atau mengevaluasi ekspresi dari pengguna
+EXPRESSION_ERRORS = (SyntaxError, NameError, TypeError, ValueError)
+
+# Pesan untuk error aritmatika (pembagian dengan nol, overflow) saat iterasi berjalan
+ARITHMETIC_ERROR = "Fungsi tidak dapat dihitung pada salah satu titik iterasi."
+
+
+def error_response(exc):
+    # ValidationError menjadi 400, solver yang melewati batas waktu menjadi 503
+    if isinstance(exc, ValidationError):
+        return JsonResponse({'error': exc.message, 'field': exc.field}, status=400)
+    return JsonResponse({'error': str(exc)}, status=503)
+
+
+def api_view(view):
+    """
+    Decorator untuk endpoint API: hanya POST, tanpa CSRF, body JSON di-parse,
+    dan ValidationError diubah menjadi respons 400.
+
+    View async (untuk ASGI) menghasilkan wrapper async; body JSON-nya di-parse di thread executor.
+    """
+    if iscoroutinefunction(view):
+        async def wrapper(req):
+            try:
+                with phase('parse'):
+                    payload = await run_in_thread(parse_json_body, req)
+                return await view(req, payload)
+            except (ValidationError, SolverTimeout) as exc:
+                return error_response(exc)
+    else:
+        def wrapper(req):
+            try:
+                return view(req, parse_json_body(req))
+            except (ValidationError, SolverTimeout) as exc:
+                return error_response(exc)
+    return csrf_exempt(require_POST(wraps(view)(wrapper)))
+
+
+def run_solver(func, *args, progress=None):
+    """
+    Menjalankan solver di pool proses (core.offload).
+
+    Dengan callback progres (dari job asinkron) solver dijalankan langsung, karena
+    callback tidak bisa dikirim ke proses lain dan job sudah berjalan di worker sendiri.
+    """
+    if progress is not None:
+        return func(*args, progress=progress)
+    return call_in_pool(func, *args)
+
+
+def is_finite_real(value):
+    # Iterasi yang menjadi bilangan kompleks, tak hingga, atau NaN bukan akar yang valid
+    return isinstance(value, numbers.Real) and math.isfinite(value)
+
+
+def json_safe(value):
+    """
+    Mengganti angka kompleks dan non-finite dengan None agar body tetap JSON yang valid.
+
+    Parameters:
+    value (object): Body respons (dict, list, atau angka) yang akan diperiksa secara rekursif.
+
+    Returns:
+    object: Salinan value tanpa NaN, Infinity, maupun bilangan kompleks.
+    """
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    if isinstance(value, numbers.Number) and not is_finite_real(value):
+        return None
+    return value
+
+
+def root_response(iterations, root_key, converged, include_trace, **extra):
+    """
+    Menyusun body respons untuk metode pencarian akar.
+
+    Akar yang kompleks atau non-finite dilaporkan sebagai null dan tidak dianggap konvergen.
+
+    Parameters:
+    iterations (list): Riwayat iterasi dari solver.
+    root_key (str): Key pada baris iterasi terakhir yang berisi perkiraan akar.
+    converged (bool): Apakah toleransi sudah tercapai.
+    include_trace (bool): Sertakan riwayat iterasi di respons atau tidak.
+
+    Returns:
+    tuple: Body berisi akar, jumlah iterasi, status konvergensi, dan (opsional) riwayat iterasi, serta status 200.
+    """
+    root = iterations[-1][root_key]
+    body = {
+        'root': root,
+        'iterations': len(iterations),
+        'converged': converged and is_finite_real(root),
+        **extra,
+    }
+    if include_trace:
+        body['trace'] = iterations
+    return json_safe(body), 200
+
+
+def read_root_params(payload):
+    # Parameter yang dipakai bersama oleh metode pencarian akar
+    return {
+        'f_expr': get_str(payload, 'f_expr'),
+        'tol': get_float(payload, 'tol', positive=True),
+        'max_iter': get_int(payload, 'max_iter', min_value=1, max_value=MAX_ITER),
+        'include_trace': get_bool(payload, 'include_trace', True),
+    }
+
+
+def read_newton_raphson(payload):
+    return {**read_root_params(payload), 'x0': get_float(payload, 'x0')}
+
+
+def solve_newton_raphson(params, progress=None):
+    try:
+        iterations, error_message, f_prime = run_solver(
+            newton_rapshon, params['f_expr'], params['x0'], params['tol'], params['max_iter'], progress=progress,
+        )
+    except EXPRESSION_ERRORS:
+        raise ValidationError("Ekspresi fungsi tidak valid.", 'f_expr')
+    except ArithmeticError:
+        return {'error': ARITHMETIC_ERROR}, 422
+    if error_message:
+        return {'error': error_message}, 422
+
+    return root_response(
+        iterations, 'x', iterations[-1]['status'] == 'Berhenti', params['include_trace'], f_prime=str(f_prime),
+    )
+
+
+@api_view
+async def newton_raphson(req, payload):
+    """
+    POST /api/v1/newton-raphson/
+
+    Body: {"f_expr": str, "x0": float, "tol": float, "max_iter": int, "include_trace": bool}
+    """
+    with phase('parse'):
+        params = read_newton_raphson(payload)
+    with phase('solve'):
+        body, status = await run_in_pool(solve_newton_raphson, params)
+    return JsonResponse(body, status=status)
+
+
+def read_secant(payload):
+    return {**read_root_params(payload), 'x0': get_float(payload, 'x0'), 'x1': get_float(payload, 'x1')}
+
+
+def solve_secant(params, progress=None):
+    try:
+        iterations, error_message = run_solver(
+            metode_secant, params['f_expr'], params['x0'], params['x1'], params['tol'], params['max_iter'],
+            progress=progress,
+        )
+    except EXPRESSION_ERRORS:
+        raise ValidationError("Ekspresi fungsi tidak valid.", 'f_expr')
+    except ArithmeticError:
+        return {'error': ARITHMETIC_ERROR}, 422
+    if error_message:
+        return {'error': error_message}, 422
+
+    return root_response(iterations, 'x1', iterations[-1]['status'] == 'Berhenti', params['include_trace'])
+
+
+@api_view
+async def secant(req, payload):
+    """
+    POST /api/v1/secant/
+
+    Body: {"f_expr": str, "x0": float, "x1": float, "tol": float, "max_iter": int, "include_trace": bool}
+    """
+    with phase('parse'):
+        params = read_secant(payload)
+    with phase('solve'):
+        body, status = await run_in_pool(solve_secant, params)
+    return JsonResponse(body, status=status)
+
+
+def read_regula_falsi(payload):
+    params = {**read_root_params(payload), 'a': get_float(payload, 'a'), 'b': get_float(payload, 'b')}
+    # Ekspresi diperiksa di sini (whitelist AST, cepat dan di-cache) agar error evaluasi seperti
+    # log dari bilangan negatif tidak ikut dilaporkan sebagai ekspresi yang tidak valid
+    try:
+        compile_expression(params['f_expr'])
+    except (SyntaxError, NameError):
+        raise ValidationError("Ekspresi fungsi tidak valid.", 'f_expr')
+    return params
+
+
+def solve_regula_falsi(params, progress=None):
+    try:
+        iterations, error_message = run_solver(
+            metode_regula_falsi, params['f_expr'], params['a'], params['b'], params['tol'], params['max_iter'],
+            progress=progress,
+        )
+    except (ArithmeticError, ValueError, TypeError):
+        return {'error': "Fungsi tidak dapat dihitung pada interval tersebut."}, 422
+    if error_message:
+        return {'error': error_message}, 422
+
+    return root_response(
+        iterations, 'xr', abs(iterations[-1]['f_xr']) < params['tol'], params['include_trace'],
+    )
+
+
+@api_view
+async def regula_falsi(req, payload):
+    """
+    POST /api/v1/regula-falsi/
+
+    Body: {"f_expr": str, "a": float, "b": float, "tol": float, "max_iter": int, "include_trace": bool}
+
+    Ekspresi memakai sintaks Regula Falsi (solvers.math_expression): fungsi math seperti sin(x)
+    atau math.sin(x), konstanta pi dan e, serta ^ sebagai pangkat.
+    """
+    with phase('parse'):
+        params = read_regula_falsi(payload)
+    with phase('solve'):
+        body, status = await run_in_pool(solve_regula_falsi, params)
+    return JsonResponse(body, status=status)
+
+
+def read_sparse_matrix(payload, n):
+    # Membangun matriks CSR dari field `sparse` (format COO atau CSR)
+    sparse_format, arrays = get_sparse(payload, 'sparse')
+    try:
+        if sparse_format == 'coo':
+            return from_coo(n, arrays['rows'], arrays['cols'], arrays['values'])
+        return from_csr(n, arrays['data'], arrays['indices'], arrays['indptr'])
+    except ValueError as exc:
+        raise ValidationError(str(exc), 'sparse')
+
+
+def check_sparse_dense_size(engine, n):
+    # Dipanggil untuk input `sparse` sebelum matriksnya diubah ke dense
+    limit = MAX_SPARSE_DENSE_SIZE.get(engine)
+    if limit is not None and n > limit:
+        raise ValidationError(
+            f"Input sparse dengan engine '{engine}' maksimal {limit} x {limit}; gunakan engine 'sparse'.", 'engine',
+        )
+
+
+def read_gauss(payload):
+    results = get_vector(payload, 'results')
+    if 'sparse' in payload:
+        matrix = read_sparse_matrix(payload, len(results))
+    else:
+        matrix = get_matrix(payload, 'matrix', n_rows=len(results))
+    engine = payload.get('engine', 'auto')
+    if engine not in ENGINES:
+        raise ValidationError(f"Harus salah satu dari: {', '.join(ENGINES)}.", 'engine')
+    if 'sparse' in payload:
+        check_sparse_dense_size(engine, len(results))
+    sparse_method = payload.get('sparse_method', 'auto')
+    if sparse_method not in SPARSE_METHODS:
+        raise ValidationError(f"Harus salah satu dari: {', '.join(SPARSE_METHODS)}.", 'sparse_method')
+    omega = get_float(payload, 'omega', required=False, default=DEFAULT_OMEGA)
+    if not 0 < omega < 2:
+        raise ValidationError("Harus di antara 0 dan 2.", 'omega')
+    return {
+        'matrix': matrix,
+        'results': results,
+        'engine': engine,
+        'include_trace': get_bool(payload, 'include_trace', True),
+        'sparse_method': sparse_method,
+        'tol': get_float(payload, 'tol', required=False, default=1e-10, positive=True),
+        'max_iter': get_int(payload, 'max_iter', required=False, default=1000, min_value=1, max_value=MAX_ITER),
+        'omega': omega,
+    }
+
+
+def solve_gauss(params, progress=None):
+    matrix, results, include_trace = params['matrix'], params['results'], params['include_trace']
+    matrix_density = density(matrix)
+    engine = pilih_engine(params['engine'], len(results), matrix_density, matrix)
+
+    if engine == 'sparse':
+        try:
+            output = solve_sparse(matrix, results, params['sparse_method'], params['tol'])
+        except np.linalg.LinAlgError as exc:
+            return {'error': str(exc)}, 422
+        return {
+            'solution': output.x.tolist(),
+            'engine': engine,
+            'method': output.method,
+            'iterations': output.iterations,
+            'residual': output.residual,
+            'density': matrix_density,
+        }, 200
+
+    if engine in ITERATIVE_METHODS:
+        try:
+            output = solve_iterative(engine, matrix, results, params['tol'], params['max_iter'], params['omega'])
+        except np.linalg.LinAlgError as exc:
+            return {'error': str(exc)}, 422
+        body = {
+            'solution': output.x.tolist(),
+            'engine': engine,
+            'iterations': output.iterations,
+            'converged': output.converged,
+            'residual': output.residuals[-1],
+        }
+        if include_trace:
+            body['trace'] = {'residuals': output.residuals}
+        return body, 200
+
+    if not isinstance(matrix, list):
+        # Matriks dari field `sparse` diubah ke dense untuk engine 'langkah' dan 'lu' (termasuk hasil mode 'auto')
+        check_sparse_dense_size(engine, len(results))
+        matrix = matrix.toarray()
+
+    if engine == 'lu':
+        try:
+            solution, cached = solve_lu(matrix, results)
+        except np.linalg.LinAlgError as exc:
+            return {'error': str(exc)}, 422
+        return {'solution': solution.tolist(), 'engine': engine, 'factorization_cached': cached}, 200
+
+    # Eliminasi langkah demi langkah berupa loop Python, jadi dijalankan di pool proses.
+    # LU, sparse, dan iteratif tidak perlu: LAPACK/BLAS melepas GIL selama perhitungan.
+    output = run_solver(eliminasi_gauss, matrix, results)
+    if output[0] is None:
+        return {'error': output[1]}, 422
+    steps, descriptions, solution, back_sub_steps = output
+
+    body = {'solution': solution.tolist(), 'engine': engine}
+    if include_trace:
+        body['trace'] = {
+            'steps': [step.tolist() for step in steps],
+            'descriptions': descriptions,
+            'back_substitution': back_sub_steps,
+        }
+    return body, 200
+
+
+@api_view
+async def gauss(req, payload):
+    """
+    POST /api/v1/gauss/
+
+    Body: {"matrix": [[float]], "results": [float],
+           "engine": "auto" | "langkah" | "lu" | "sparse" | "jacobi" | "gauss-seidel" | "sor" | "cg",
+           "include_trace": bool}
+
+    Sebagai ganti `matrix`, matriks dapat dikirim dalam format sparse lewat field `sparse`:
+    {"format": "coo", "rows": [int], "cols": [int], "values": [float]} atau
+    {"format": "csr", "data": [float], "indices": [int], "indptr": [int]}.
+    Field opsional `sparse_method` ("auto" | "spsolve" | "cg" | "gmres") dan `tol` berlaku untuk engine 'sparse'.
+
+    Engine iteratif menerima field opsional `tol`, `max_iter`, dan `omega` (SOR); trace-nya berisi riwayat residual relatif.
+
+    Engine 'lu' memakai faktorisasi LU yang di-cache dan tidak menghasilkan trace langkah.
+    Pada engine 'auto', matriks besar dengan kepadatan rendah diselesaikan lewat engine 'sparse',
+    dan matriks besar yang dominan diagonal lewat metode iteratif.
+    """
+    # LU, sparse, dan iteratif melepas GIL sehingga cukup di thread; engine 'langkah' dikirim ke pool proses
+    # dari dalam solve_gauss. Cache faktorisasi LU tetap di proses web.
+    with phase('parse'):
+        params = await run_in_thread(read_gauss, payload)
+    with phase('solve'):
+        body, status = await run_in_thread(solve_gauss, params)
+    return JsonResponse(body, status=status)
+
+
+def read_batch(payload):
+    method = payload.get('method')
+    if method not in METHODS:
+        raise ValidationError(f"Harus salah satu dari: {', '.join(METHODS)}.", 'method')
+    problems = payload.get('problems')
+    if not isinstance(problems, list) or not problems:
+        raise ValidationError("Harus berupa list soal yang tidak kosong.", 'problems')
+    if len(problems) > MAX_BATCH_SIZE:
+        raise ValidationError(f"Maksimal {MAX_BATCH_SIZE} soal per permintaan.", 'problems')
+
+    validated = []
+    for index, problem in enumerate(problems):
+        try:
+            if not isinstance(problem, dict):
+                raise ValidationError("Harus berupa objek JSON.")
+            item = {
+                'f_expr': get_str(problem, 'f_expr'),
+                'tol': get_float(problem, 'tol', positive=True),
+                'max_iter': get_int(problem, 'max_iter', min_value=1, max_value=MAX_ITER),
+            }
+            if method == 'regula-falsi':
+                item['a'] = get_float(problem, 'a')
+                item['b'] = get_float(problem, 'b')
+            else:
+                item['x0'] = get_float(problem, 'x0')
+            if method == 'secant':
+                item['x1'] = get_float(problem, 'x1')
+        except ValidationError as exc:
+            field = f'problems[{index}]' + (f'.{exc.field}' if exc.field else '')
+            raise ValidationError(exc.message, field)
+        validated.append(item)
+    return {'method': method, 'problems': validated}
+
+
+def solve_batch_params(params, progress=None):
+    results = call_in_pool(solve_batch, params['method'], params['problems'])
+    return {'method': params['method'], 'results': results}, 200
+
+
+@api_view
+async def batch(req, payload):
+    """
+    POST /api/v1/batch/
+
+    Body: {"method": "newton-raphson" | "secant" | "regula-falsi",
+           "problems": [{"f_expr": str, "x0": float, "x1": float, "tol": float, "max_iter": int}, ...]}
+
+    Soal regula-falsi berisi interval "a" dan "b" sebagai ganti "x0" dan "x1".
+
+    Soal dengan ekspresi yang sama dikompilasi sekali dan diiterasi bersamaan.
+    Hasil dikembalikan sesuai urutan soal, masing-masing dengan status konvergensinya sendiri.
+    """
+    with phase('parse'):
+        params = read_batch(payload)
+    with phase('solve'):
+        body, status = await run_in_pool(solve_batch_params, params)
+    return JsonResponse(body, status=status)
+
+
+# Pasangan (validasi, perhitungan) untuk setiap jenis solver yang bisa dijalankan sebagai job
+SOLVERS = {
+    'newton-raphson': (read_newton_raphson, solve_newton_raphson),
+    'secant': (read_secant, solve_secant),
+    'regula-falsi': (read_regula_falsi, solve_regula_falsi),
+    'gauss': (read_gauss, solve_gauss),
+    'batch': (read_batch, solve_batch_params),
+}
+
+
+def job_body(job):
+    # Representasi JSON dari sebuah job untuk endpoint status
+    body = {
+        'id': str(job.id),
+        'kind': job.kind,
+        'status': job.status,
+        'progress': job.progress,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+    if job.status == Job.DONE:
+        body['result'] = job.result
+    elif job.status == Job.FAILED:
+        body['error'] = job.error
+        body['result'] = job.result
+    return body
+
+
+@api_view
+def job_submit(req, payload):
+    """
+    POST /api/v1/jobs/
+
+    Body: {"kind": "newton-raphson" | "secant" | "regula-falsi" | "gauss" | "batch", "payload": {...}}
+
+    `payload` sama dengan body endpoint sinkron untuk solver tersebut dan divalidasi
+    saat job dikirim. Respons 202 berisi id job; status dan hasilnya diambil dengan
+    GET /api/v1/jobs/<id>/.
+    """
+    kind = payload.get('kind')
+    if kind not in SOLVERS:
+        raise ValidationError(f"Harus salah satu dari: {', '.join(SOLVERS)}.", 'kind')
+    job_payload = payload.get('payload')
+    if not isinstance(job_payload, dict):
+        raise ValidationError("Harus berupa objek JSON.", 'payload')
+    try:
+        SOLVERS[kind][0](job_payload)
+    except ValidationError as exc:
+        raise ValidationError(exc.message, 'payload' + (f'.{exc.field}' if exc.field else ''))
+
+    job = submit_job(kind, job_payload)
+    return JsonResponse(job_body(job), status=202)
+
+
+@require_GET
+def job_status(req, job_id):
+    """
+    GET /api/v1/jobs/<id>/
+
+    Mengembalikan status job (pending, running, done, failed), progres 0..1,
+    dan hasilnya jika sudah selesai.
+    """
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None:
+        return JsonResponse({'error': "Job tidak ditemukan."}, status=404)
+    return JsonResponse(job_body(job))
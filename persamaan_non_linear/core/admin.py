@@ -0,0 +1,63 @@
+from django.contrib import admin
+from django.utils.html import format_html
+
+from .models import ProfileRecord, SolveRecord
+
+
+@admin.register(ProfileRecord)
+class ProfileRecordAdmin(admin.ModelAdmin):
+    """Daftar request yang diprofil, dari yang paling lambat; halaman detail menampilkan fungsi teratas."""
+    list_display = ('method', 'durasi_ms', 'status', 'hash_input', 'sampled', 'path', 'created_at')
+    list_filter = ('method', 'sampled', 'status')
+    search_fields = ('input_hash', 'path')
+    readonly_fields = (
+        'method', 'path', 'input_hash', 'duration', 'status', 'sampled', 'profile_file', 'created_at', 'statistik',
+    )
+
+    @admin.display(description='Durasi (ms)', ordering='duration')
+    def durasi_ms(self, obj):
+        return f'{obj.duration * 1000:.1f}'
+
+    @admin.display(description='Hash input')
+    def hash_input(self, obj):
+        return obj.input_hash[:12]
+
+    @admin.display(description='Fungsi teratas (cumulative)')
+    def statistik(self, obj):
+        return format_html('<pre style="font-size: 11px">{}</pre>', obj.top_functions())
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def delete_queryset(self, request, queryset):
+        # Satu per satu agar file .prof ikut terhapus
+        for record in queryset:
+            record.delete()
+
+
+@admin.register(SolveRecord)
+class SolveRecordAdmin(admin.ModelAdmin):
+    """Riwayat solve; kolom biner (trace dan entri cache) tidak ditampilkan."""
+    list_display = ('method', 'hash_input', 'iterations', 'root', 'durasi_ms', 'created_at')
+    list_filter = ('method',)
+    search_fields = ('input_hash',)
+    date_hierarchy = 'created_at'
+    exclude = ('trace', 'entry')
+    readonly_fields = ('method', 'input_hash', 'params', 'iterations', 'root', 'duration', 'error', 'created_at')
+
+    @admin.display(description='Durasi (ms)', ordering='duration')
+    def durasi_ms(self, obj):
+        return f'{obj.duration * 1000:.1f}'
+
+    @admin.display(description='Hash input')
+    def hash_input(self, obj):
+        return obj.input_hash[:12]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
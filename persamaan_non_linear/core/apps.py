@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.core.signals import request_finished
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from .history import solve_history
+
+        # Buffer riwayat solve ditulis setelah response terkirim, bukan di dalam request
+        request_finished.connect(solve_history.maybe_flush, dispatch_uid='core.solve_history')
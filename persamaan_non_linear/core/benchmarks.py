@@ -0,0 +1,421 @@
+"""
+Suite benchmark untuk solver dan view, dijalankan lewat `python manage.py benchmark`.
+
+Empat kelompok benchmark:
+- roots: Newton Raphson, Secant, Regula Falsi, batch, dan mode cari semua akar pada korpus fungsi uji standar,
+  serta waktu kompilasi ekspresi (sympify, diff, lambdify) tanpa cache.
+- gauss: setiap engine Gauss pada matriks berukuran 10 sampai 2000.
+- views: latensi end-to-end lewat Django test client, termasuk rendering grafik dan template.
+- startup: waktu `manage.py check` dan latensi request pertama di proses Python baru,
+  yaitu biaya cold start yang dibayar setiap worker server sebelum melayani request.
+
+Setiap benchmark dijalankan beberapa kali; yang dicatat adalah waktu minimum, median,
+dan rata-rata dalam detik. Perbandingan dengan baseline memakai waktu minimum, yang paling
+sedikit terpengaruh beban lain di mesin yang sama.
+"""
+from collections import namedtuple
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+import numpy as np
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from scipy.sparse import diags_array
+
+from gaus.views import elimination_cache
+from solvers.batch import solve_batch
+from solvers.expression import compile_expression, get_compiled
+from solvers.gauss import eliminasi_gauss
+from solvers.iterative import solve_iterative
+from solvers.lu import factorization_cache, solve_lu
+from solvers.math_expression import compile_expression as compile_math_expression
+from solvers.roots import metode_regula_falsi, metode_secant, newton_rapshon
+from solvers.sparse import solve_sparse
+from solvers.vectorized import find_all_roots
+from .result_cache import result_cache
+
+GROUPS = ('roots', 'gauss', 'views', 'startup')
+
+# Fungsi uji: ekspresi, x0 (Newton), x0 dan x1 (Secant, dan Regula Falsi jika tandanya berbeda),
+# dan interval untuk mode cari semua akar
+TestFunction = namedtuple('TestFunction', ['f_expr', 'x0', 'x1', 'lo', 'hi'])
+
+ROOT_CORPUS = (
+    TestFunction('x**2 - 2', 1.0, 2.0, -3.0, 3.0),
+    TestFunction('x**3 - 2*x - 5', 2.0, 3.0, -3.0, 3.0),  # Contoh klasik Wallis
+    TestFunction('cos(x) - x', 0.5, 1.0, -2.0, 2.0),
+    TestFunction('x - exp(-x)', 0.0, 1.0, -1.0, 2.0),
+    TestFunction('exp(x) - 3*x', 0.0, 1.0, -1.0, 2.0),
+    TestFunction('log(x) - 1', 2.0, 3.0, 0.5, 5.0),
+    TestFunction('sin(x) - x/2', 2.0, 2.5, -3.0, 3.0),
+    TestFunction('x**10 - 1', 1.5, 2.0, -2.0, 2.0),  # Newton lambat dari titik awal yang jauh
+    TestFunction('(x - 1)**3', 2.0, 3.0, -1.0, 3.0),  # Akar kembar tiga, konvergensi linear
+    TestFunction('atan(x)', 1.0, 1.3, -2.0, 2.0),
+)
+
+ROOT_TOL = 1e-10
+ROOT_MAX_ITER = 200
+
+# Ukuran matriks Gauss; eliminasi langkah demi langkah (O(n³) dengan log langkah) dibatasi
+GAUSS_SIZES = (10, 50, 100, 500, 1000, 2000)
+QUICK_GAUSS_SIZES = (10, 100)
+LANGKAH_MAX_SIZE = 500
+
+# Hasil satu benchmark
+Timing = namedtuple('Timing', ['min', 'median', 'mean', 'repeat'])
+
+
+def summarize(samples):
+    return Timing(min(samples), statistics.median(samples), statistics.fmean(samples), len(samples))
+
+
+def collect(func, repeat=5, max_time=10.0):
+    """
+    Memanggil func() sekali sebagai pemanasan, lalu sampai `repeat` kali lagi.
+
+    Parameters:
+    func (callable): Fungsi tanpa argumen.
+    repeat (int): Jumlah pemanggilan maksimum setelah pemanasan.
+    max_time (float): Batas waktu total; minimal satu pemanggilan tetap dilakukan.
+
+    Returns:
+    list: Nilai kembalian setiap pemanggilan setelah pemanasan.
+    """
+    func()
+    values = []
+    started = perf_counter()
+    while len(values) < repeat and (not values or perf_counter() - started < max_time):
+        values.append(func())
+    return values
+
+
+def measure(func, repeat=5, max_time=10.0, setup=None):
+    """
+    Mengukur waktu func() setelah satu kali pemanasan.
+
+    Parameters:
+    func (callable): Fungsi tanpa argumen yang diukur.
+    repeat (int): Jumlah pengukuran maksimum.
+    max_time (float): Batas waktu total pengukuran; minimal satu pengukuran tetap dilakukan.
+    setup (callable): Dipanggil sebelum setiap pengukuran (tidak ikut diukur), misalnya untuk mengosongkan cache.
+
+    Returns:
+    Timing: Waktu minimum, median, dan rata-rata (detik) serta jumlah pengukuran.
+    """
+    def timed():
+        if setup:
+            setup()
+        start = perf_counter()
+        func()
+        return perf_counter() - start
+
+    return summarize(collect(timed, repeat, max_time))
+
+
+def brackets(case):
+    # Regula Falsi hanya diukur pada fungsi uji yang tanda f(x0) dan f(x1)-nya berbeda
+    f = compile_math_expression(case.f_expr)
+    return f(case.x0) * f(case.x1) < 0
+
+
+def root_benchmarks():
+    """
+    Returns:
+    list: Pasangan (nama, func, setup) untuk kelompok roots.
+    """
+    cases = []
+    for case in ROOT_CORPUS:
+        cases.append((
+            f'roots/newton-raphson/{case.f_expr}',
+            lambda case=case: newton_rapshon(case.f_expr, case.x0, ROOT_TOL, ROOT_MAX_ITER), None,
+        ))
+        cases.append((
+            f'roots/secant/{case.f_expr}',
+            lambda case=case: metode_secant(case.f_expr, case.x0, case.x1, ROOT_TOL, ROOT_MAX_ITER), None,
+        ))
+        if brackets(case):
+            cases.append((
+                f'roots/regula-falsi/{case.f_expr}',
+                lambda case=case: metode_regula_falsi(case.f_expr, case.x0, case.x1, ROOT_TOL, ROOT_MAX_ITER), None,
+            ))
+
+    def all_roots():
+        for case in ROOT_CORPUS:
+            compiled = get_compiled(case.f_expr)
+            find_all_roots(compiled.f, compiled.f_prime_fn, case.lo, case.hi, ROOT_TOL, ROOT_MAX_ITER)
+
+    def compile_corpus():
+        for case in ROOT_CORPUS:
+            compile_expression(case.f_expr)
+
+    problems = [
+        {'f_expr': case.f_expr, 'x0': case.x0 + shift, 'x1': case.x1 + shift, 'tol': ROOT_TOL, 'max_iter': ROOT_MAX_ITER}
+        for case in ROOT_CORPUS for shift in np.linspace(0.0, 0.1, 100)
+    ]
+    bracket_problems = [
+        {'f_expr': case.f_expr, 'a': case.x0 - shift, 'b': case.x1 + shift, 'tol': ROOT_TOL, 'max_iter': ROOT_MAX_ITER}
+        for case in ROOT_CORPUS if brackets(case) for shift in np.linspace(0.0, 0.1, 100)
+    ]
+    cases += [
+        ('roots/compile/korpus', compile_corpus, None),
+        ('roots/all-roots/korpus', all_roots, None),
+        ('roots/batch-newton-raphson/korpus-x100', lambda: solve_batch('newton-raphson', problems), None),
+        ('roots/batch-secant/korpus-x100', lambda: solve_batch('secant', problems), None),
+        ('roots/batch-regula-falsi/korpus-x100', lambda: solve_batch('regula-falsi', bracket_problems), None),
+    ]
+    return cases
+
+
+def test_system(n, seed=0):
+    """
+    Membuat sistem uji n x n yang dominan diagonal dan simetris (dapat diselesaikan semua engine).
+
+    Returns:
+    tuple: Matriks dense, matriks tridiagonal sparse (CSR), dan vektor hasil.
+    """
+    rng = np.random.default_rng(seed)
+    dense = rng.random((n, n))
+    dense = (dense + dense.T) / 2 + n * np.eye(n)
+    tridiagonal = diags_array([-1.0, 4.0, -1.0], offsets=[-1, 0, 1], shape=(n, n)).tocsr()
+    return dense, tridiagonal, rng.random(n)
+
+
+def gauss_benchmarks(sizes=GAUSS_SIZES):
+    """
+    Returns:
+    list: Pasangan (nama, func, setup) untuk kelompok gauss.
+    """
+    cases = []
+    for n in sizes:
+        dense, tridiagonal, results = test_system(n)
+        if n <= LANGKAH_MAX_SIZE:
+            cases.append((f'gauss/langkah/{n}', lambda a=dense, b=results: eliminasi_gauss(a, b), None))
+        # Faktorisasi LU diukur tanpa cache, lalu penyelesaian ulang dengan faktorisasi dari cache
+        cases.append((f'gauss/lu/{n}', lambda a=dense, b=results: solve_lu(a, b), factorization_cache.clear))
+        cases.append((f'gauss/lu-cached/{n}', lambda a=dense, b=results: solve_lu(a, b), None))
+        cases.append((f'gauss/sparse/{n}', lambda a=tridiagonal, b=results: solve_sparse(a, b), None))
+        for method in ('jacobi', 'gauss-seidel', 'cg'):
+            cases.append((
+                f'gauss/{method}/{n}', lambda a=dense, b=results, m=method: solve_iterative(m, a, b), None,
+            ))
+    return cases
+
+
+def view_benchmarks(quick=False):
+    """
+    Returns:
+    list: Pasangan (nama, func, setup) untuk kelompok views. Cache hasil dan cache eliminasi
+    dikosongkan sebelum setiap pengukuran kecuali pada benchmark '*-cache-hit' dan API.
+    """
+    client = Client()
+    n = 100 if quick else 500
+    # Matriks teks 100 x 100 lewat form, dan matriks n x n lewat unggahan .npy (jalur untuk sistem besar)
+    text_matrix, _, text_results = test_system(100)
+    dense, _, results = test_system(n)
+    matrix_text = '\n'.join(' '.join(repr(value) for value in row) for row in text_matrix.tolist())
+    results_text = ' '.join(repr(value) for value in text_results.tolist())
+
+    newton = {'f_expr': 'x**3 - 2*x - 5', 'x': '2', 'tol': '1e-10', 'max_iter': '100'}
+    secant = {'f_expr': 'x**3 - 2*x - 5', 'x0': '2', 'x1': '3', 'tol': '1e-10', 'max_iter': '100'}
+    regula_falsi = {'f_expr': 'x**3 - 2*x - 5', 'a': '2', 'b': '3', 'tol': '1e-10', 'max_iter': '100'}
+    all_roots = {'f_expr': 'sin(x) - x/2', 'tol': '1e-10', 'max_iter': '100', 'mode': 'all', 'lo': '-3', 'hi': '3'}
+    gauss_small = {'matrix': '[[2, 1, -1], [-3, -1, 2], [-2, 1, 2]]', 'results': '[8, -11, -3]'}
+    gauss_lu = {'matrix': matrix_text, 'results': results_text, 'engine': 'lu'}
+    api_secant = json.dumps({'f_expr': secant['f_expr'], 'x0': 2.0, 'x1': 3.0, 'tol': 1e-10, 'max_iter': 100})
+
+    def npy(name, array):
+        buffer = io.BytesIO()
+        np.save(buffer, array)
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def gauss_upload():
+        # File unggahan habis dibaca setelah satu request, jadi dibuat ulang setiap kali
+        return client.post('/gaus/', {
+            'engine': 'lu', 'matrix_file': npy('matrix.npy', dense), 'results_file': npy('results.npy', results),
+        })
+
+    def post(path, data, **extra):
+        return lambda: client.post(path, data, **extra)
+
+    def clear():
+        result_cache().clear()
+        elimination_cache.clear()
+
+    return [
+        ('views/newton-raphson', post('/newton-raphson/', newton), clear),
+        ('views/newton-raphson-chart-json', post('/newton-raphson/?chart=json', newton), clear),
+        ('views/newton-raphson-cache-hit', post('/newton-raphson/', newton), None),
+        ('views/newton-raphson-all-roots', post('/newton-raphson/', all_roots), clear),
+        ('views/secant', post('/secant/', secant), clear),
+        ('views/secant-all-roots', post('/secant/', all_roots), clear),
+        ('views/regula-falsi', post('/regula-falsi/', regula_falsi), clear),
+        ('views/gaus-langkah-3', post('/gaus/', gauss_small), clear),
+        ('views/gaus-lu-100', post('/gaus/', gauss_lu), clear),
+        (f'views/gaus-lu-npy-{n}', gauss_upload, clear),
+        ('views/api-secant', post('/api/v1/secant/', api_secant, content_type='application/json'), None),
+    ]
+
+
+# Library berat yang dimuat lazy; first_request melaporkan mana yang sudah terimpor setelah request
+HEAVY_MODULES = ('sympy', 'plotly.graph_objs', 'scipy.linalg', 'scipy.sparse')
+
+# Dijalankan di proses Python baru: django.setup() lalu satu request lewat test client.
+# Pool proses solver punya biaya start sendiri, jadi offload dimatikan dan yang diukur hanya proses web.
+FIRST_REQUEST_SCRIPT = """
+import json
+import sys
+from time import perf_counter
+
+started = perf_counter()
+import django
+django.setup()
+setup = perf_counter() - started
+
+from django.test import Client
+from django.test.utils import override_settings
+
+method, path, data, content_type = sys.argv[1], sys.argv[2], json.loads(sys.argv[3]), sys.argv[4]
+HEAVY_MODULES = json.loads(sys.argv[5])
+extra = {'content_type': content_type} if content_type else {}
+with override_settings(ALLOWED_HOSTS=['testserver'], SOLVE_HISTORY=False, SOLVER_OFFLOAD=False):
+    client = Client()
+    started = perf_counter()
+    response = getattr(client, method)(path, json.dumps(data) if content_type else data, **extra)
+    elapsed = perf_counter() - started
+loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+print(json.dumps({'setup': setup, 'first_request': elapsed, 'status': response.status_code, 'loaded': loaded}))
+"""
+
+# Request pertama yang diukur: (nama, metode HTTP, path, data, content type untuk body JSON)
+FIRST_REQUESTS = (
+    ('newton-raphson-form', 'get', '/newton-raphson/', None, ''),
+    ('newton-raphson', 'post', '/newton-raphson/', {'f_expr': 'x**3 - 2*x - 5', 'x': '2', 'tol': '1e-10', 'max_iter': '100'}, ''),
+    ('gaus-langkah-3', 'post', '/gaus/', {'matrix': '[[2, 1, -1], [-3, -1, 2], [-2, 1, 2]]', 'results': '[8, -11, -3]'}, ''),
+    (
+        'api-regula-falsi', 'post', '/api/v1/regula-falsi/',
+        {'f_expr': 'x**3 - 2*x - 5', 'a': 2, 'b': 3, 'tol': 1e-10, 'max_iter': 100}, 'application/json',
+    ),
+)
+
+
+def run_python(*args, env=None):
+    """
+    Menjalankan Python di proses baru dari direktori proyek; DJANGO_SETTINGS_MODULE diwarisi dari proses ini.
+
+    Parameters:
+    env (dict): Variabel lingkungan tambahan untuk proses baru.
+
+    Returns:
+    tuple: Lama proses (detik, termasuk start-up interpreter) dan stdout-nya.
+    """
+    started = perf_counter()
+    completed = subprocess.run(
+        [sys.executable, *args], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        env={**os.environ, **(env or {})},
+    )
+    return perf_counter() - started, completed.stdout
+
+
+def first_request(method, path, data=None, content_type='', warm=False):
+    """
+    Mengukur satu request di proses Python baru.
+
+    Dengan warm=True proses tersebut menjalankan warmup (core.warmup) di django.setup(),
+    seperti proses master gunicorn sebelum fork.
+
+    Returns:
+    dict: Waktu django.setup() ('setup') dan latensi request pertama ('first_request') dalam detik,
+        serta modul HEAVY_MODULES yang sudah dimuat setelah request ('loaded').
+    """
+    _, stdout = run_python(
+        '-c', FIRST_REQUEST_SCRIPT, method, path, json.dumps(data), content_type, json.dumps(HEAVY_MODULES),
+        env={'SOLVER_WARMUP': '1' if warm else '0'},
+    )
+    result = json.loads(stdout.splitlines()[-1])
+    if result['status'] >= 400:
+        raise RuntimeError(f"{method.upper()} {path} menghasilkan status {result['status']}.")
+    return result
+
+
+def startup_benchmarks(repeat=5, max_time=10.0):
+    """
+    Setiap pengukuran memakai proses baru sehingga tidak ada modul yang sudah dimuat.
+
+    Setiap request pertama diukur dua kali: di proses dingin, dan di proses yang
+    menjalankan warmup saat django.setup() (nama berakhiran '-warm').
+
+    Yields:
+    tuple: (nama, Timing) untuk `manage.py check`, setiap request pertama, dan django.setup().
+    """
+    yield 'startup/check', summarize(collect(lambda: run_python('manage.py', 'check')[0], repeat, max_time))
+    for suffix, warm in (('', False), ('-warm', True)):
+        setups = []
+        for name, method, path, data, content_type in FIRST_REQUESTS:
+            results = collect(lambda: first_request(method, path, data, content_type, warm), repeat, max_time)
+            setups += [result['setup'] for result in results]
+            yield f'startup/first-request{suffix}/{name}', summarize([result['first_request'] for result in results])
+        yield f'startup/django-setup{suffix}', summarize(setups)
+
+
+def run(groups=GROUPS, quick=False, repeat=5, max_time=10.0, report=None):
+    """
+    Menjalankan kelompok benchmark yang dipilih.
+
+    Parameters:
+    groups (iterable): Nama kelompok dari GROUPS.
+    quick (bool): Ukuran dan jumlah kasus yang lebih kecil (untuk CI).
+    repeat (int), max_time (float): Diteruskan ke measure.
+    report (callable): Dipanggil dengan (nama, Timing) setelah setiap benchmark selesai.
+
+    Returns:
+    dict: Nama benchmark -> Timing.
+    """
+    builders = {
+        'roots': root_benchmarks,
+        'gauss': lambda: gauss_benchmarks(QUICK_GAUSS_SIZES if quick else GAUSS_SIZES),
+        'views': lambda: view_benchmarks(quick),
+    }
+    timings = {}
+    for group in groups:
+        if group == 'startup':
+            results = startup_benchmarks(repeat, max_time)
+        else:
+            results = (
+                (name, measure(func, repeat=repeat, max_time=max_time, setup=setup))
+                for name, func, setup in builders[group]()
+            )
+        for name, timing in results:
+            timings[name] = timing
+            if report:
+                report(name, timing)
+    return timings
+
+
+def compare(timings, baseline, tolerance=0.5, noise_floor=0.002):
+    """
+    Membandingkan hasil benchmark dengan baseline berdasarkan waktu minimum.
+
+    Parameters:
+    timings (dict): Nama -> Timing (atau dict dengan key 'min') dari run saat ini.
+    baseline (dict): Nama -> dict dengan key 'min' dari file baseline.
+    tolerance (float): Kenaikan relatif yang masih dianggap wajar (0.5 = 50%).
+    noise_floor (float): Selisih absolut (detik) di bawah ini tidak dianggap regresi.
+
+    Returns:
+    list: Tuple (nama, waktu baseline, waktu sekarang, rasio) untuk setiap regresi.
+    """
+    regressions = []
+    for name, timing in timings.items():
+        if name not in baseline:
+            continue
+        current = timing['min'] if isinstance(timing, dict) else timing.min
+        previous = baseline[name]['min']
+        if current > previous * (1 + tolerance) and current - previous > noise_floor:
+            regressions.append((name, previous, current, current / previous))
+    return regressions
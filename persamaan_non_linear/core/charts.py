@@ -0,0 +1,283 @@
+"""
+Modul bersama untuk merender grafik Plotly di semua aplikasi solver.
+
+plotly.js tidak lagi disisipkan ke setiap respons. Library-nya dilayani sekali
+lewat URL yang mengandung hash isinya (bisa di-cache browser selamanya), dan
+setiap respons hanya membawa JSON figure beserta sedikit skrip untuk menggambarnya.
+
+Plotly tidak diimpor di level modul, baik di sini maupun di view: graph_objs dan
+plotly.io (beserta validatornya) baru dimuat saat grafik pertama dibuat. Proses
+yang melayani request tanpa grafik, cache hit, atau API JSON tidak membayarnya.
+
+Riwayat iterasi yang panjang (misalnya Regula Falsi yang konvergen lambat dengan
+max_iter ratusan ribu) dicuplik di server dengan LTTB menjadi paling banyak
+settings.CHART_MAX_POINTS titik, sehingga ukuran JSON figure tetap terbatas
+berapa pun jumlah iterasinya sementara bentuk kurva konvergensinya tetap terlihat.
+"""
+import hashlib
+from importlib.util import find_spec
+import os
+import uuid
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.safestring import mark_safe
+
+from solvers.vectorized import evaluate
+
+# Lokasi paket plotly dicari tanpa mengimpornya
+PLOTLY_JS_PATH = os.path.join(find_spec('plotly').submodule_search_locations[0], 'package_data', 'plotly.min.js')
+
+# Jumlah titik maksimum per trace jika settings.CHART_MAX_POINTS tidak diisi
+DEFAULT_MAX_POINTS = 2000
+
+# Karakter yang harus di-escape agar JSON aman diletakkan di dalam tag <script>
+_JSON_SCRIPT_ESCAPES = {
+    ord('>'): '\\u003E',
+    ord('<'): '\\u003C',
+    ord('&'): '\\u0026',
+}
+
+
+@lru_cache(maxsize=None)
+def plotly_js_digest():
+    """
+    Menghitung hash isi plotly.min.js sekali per proses.
+
+    Returns:
+    str: 12 karakter pertama hash SHA-256 dari file plotly.min.js.
+    """
+    digest = hashlib.sha256()
+    with open(PLOTLY_JS_PATH, 'rb') as js_file:
+        for chunk in iter(lambda: js_file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def plotly_js_url():
+    """Mengembalikan URL plotly.js yang mengandung hash sehingga aman di-cache jangka panjang."""
+    return reverse('plotly-js', args=[plotly_js_digest()])
+
+
+def figure_to_json(fig):
+    """
+    Mengubah figure Plotly menjadi string JSON tanpa validasi ulang.
+
+    Parameters:
+    fig (go.Figure): Figure yang akan diserialisasi.
+
+    Returns:
+    str: JSON figure (data dan layout).
+    """
+    import plotly.io as pio
+
+    return pio.to_json(fig, validate=False)
+
+
+def build_figure_json(build, *args):
+    """
+    Membangun figure dengan build(*args) lalu langsung mengubahnya menjadi JSON.
+
+    Dipanggil lewat run_in_thread sehingga pembuatan figure (validasi Plotly) dan
+    serialisasinya sama-sama berjalan di luar event loop.
+
+    Parameters:
+    build (function): Fungsi yang mengembalikan go.Figure.
+    *args: Argumen untuk build.
+
+    Returns:
+    str: JSON figure (data dan layout).
+    """
+    return figure_to_json(build(*args))
+
+
+def render_chart(fig):
+    """
+    Menyiapkan figure untuk dirender oleh template tag `plotly_chart`.
+
+    Parameters:
+    fig (go.Figure atau str): Figure yang akan ditampilkan, atau JSON-nya (misalnya dari cache hasil).
+
+    Returns:
+    dict: ID elemen div dan JSON figure yang sudah aman untuk disisipkan ke HTML.
+    """
+    figure_json = fig if isinstance(fig, str) else figure_to_json(fig)
+    return {
+        'id': f'chart-{uuid.uuid4().hex[:8]}',
+        'json': mark_safe(figure_json.translate(_JSON_SCRIPT_ESCAPES)),
+    }
+
+
+def wants_chart_json(request):
+    """
+    Memeriksa apakah klien meminta mode JSON saja (`?chart=json`).
+
+    Pada mode ini view mengembalikan JSON figure dan klien merender grafiknya sendiri.
+    """
+    return request.GET.get('chart') == 'json'
+
+
+def chart_json_response(fig):
+    """Mengembalikan figure Plotly (go.Figure atau JSON-nya) sebagai respons application/json."""
+    figure_json = fig if isinstance(fig, str) else figure_to_json(fig)
+    return HttpResponse(figure_json, content_type='application/json')
+
+
+def roots_figure(f, lo, hi, found, title):
+    """
+    Membuat grafik f(x) pada [lo, hi] beserta akar-akar yang ditemukan.
+
+    Parameters:
+    f (function): f(x) yang menerima array NumPy.
+    lo, hi (float): Batas interval.
+    found (RootSet): Akar unik hasil solvers.vectorized.find_all_roots.
+    title (str): Judul grafik.
+
+    Returns:
+    go.Figure: Kurva f(x) dan titik-titik akarnya.
+    """
+    import plotly.graph_objs as go
+
+    xs = np.linspace(lo, hi, 400)
+    ys = evaluate(f, xs)
+
+    curve = go.Scatter(x=xs, y=ys, mode='lines', name='f(x)', line=dict(color='royalblue', width=2))
+    roots = go.Scatter(
+        x=found.roots, y=found.f_roots, mode='markers', name='Akar',
+        marker=dict(size=9, color='crimson'),
+    )
+    layout = go.Layout(
+        title=title,
+        xaxis=dict(title='x'),
+        yaxis=dict(title='f(x)'),
+        template='plotly_white'
+    )
+    return go.Figure(data=[curve, roots], layout=layout)
+
+
+def chart_max_points():
+    return getattr(settings, 'CHART_MAX_POINTS', DEFAULT_MAX_POINTS)
+
+
+def lttb_indices(x, y, max_points):
+    """
+    Memilih titik yang ditampilkan dengan algoritma Largest-Triangle-Three-Buckets (LTTB).
+
+    Titik pertama dan terakhir selalu dipertahankan. Titik di antaranya dibagi ke
+    max_points - 2 bucket, dan dari setiap bucket dipilih titik yang membentuk segitiga
+    terbesar dengan titik terpilih sebelumnya dan rata-rata bucket berikutnya, sehingga
+    lonjakan dan perubahan kemiringan tidak hilang seperti pada pencuplikan berjarak tetap.
+
+    Parameters:
+    x, y (ndarray): Koordinat titik, x terurut naik dan semua nilainya berhingga.
+    max_points (int): Jumlah titik maksimum (minimal 3).
+
+    Returns:
+    ndarray: Indeks titik terpilih, terurut naik.
+    """
+    n = len(x)
+    max_points = max(int(max_points), 3)
+    if n <= max_points:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Batas bucket untuk titik-titik di antara titik pertama dan terakhir
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for i in range(max_points - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Titik ketiga segitiga: rata-rata bucket berikutnya (untuk bucket terakhir: titik terakhir)
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def downsample(x, y, max_points=None):
+    """
+    Mencuplik titik berhingga dari sebuah deret untuk ditampilkan di grafik.
+
+    Parameters:
+    x, y (ndarray): Koordinat titik, x terurut naik.
+    max_points (int): Jumlah titik maksimum; default settings.CHART_MAX_POINTS.
+
+    Returns:
+    ndarray: Indeks titik terpilih pada x dan y. NaN dan inf (misalnya log 0) dibuang.
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    return finite[lttb_indices(x[finite], y[finite], max_points or chart_max_points())]
+
+
+def convergence_figure(result, key, title, label):
+    """
+    Membuat grafik konvergensi dari riwayat iterasi solver akar.
+
+    Grafik memiliki dua tampilan yang dapat dipilih dengan tombol: nilai f per
+    iterasi, dan |f| dengan sumbu y logaritmik yang memperlihatkan orde konvergensi.
+    Setiap tampilan dicuplik terpisah (tampilan log pada log10 |f|) sehingga
+    masing-masing paling banyak berisi settings.CHART_MAX_POINTS titik.
+
+    Parameters:
+    result (list): Riwayat iterasi berisi 'iteration' dan nilai fungsi di key.
+    key (str): Nama field nilai fungsi, misalnya 'f_x' atau 'f_xr'.
+    title (str): Judul grafik.
+    label (str): Label nilai fungsi, misalnya 'f(x)'.
+
+    Returns:
+    go.Figure: Grafik f dan log |f| terhadap iterasi.
+    """
+    import plotly.graph_objs as go
+
+    iterations = np.array([info['iteration'] for info in result], dtype=float)
+    values = np.array([info[key] for info in result], dtype=float)
+    with np.errstate(divide='ignore'):
+        log_abs = np.log10(np.abs(values))
+
+    linear = downsample(iterations, values)
+    logarithmic = downsample(iterations, log_abs)
+    # Marker hanya berguna selama setiap iterasi masih ditampilkan
+    mode = 'lines+markers' if len(linear) == len(values) else 'lines'
+
+    traces = [
+        go.Scatter(
+            x=iterations[linear], y=values[linear], mode=mode, name=label,
+            line=dict(color='royalblue', width=2), marker=dict(size=6),
+        ),
+        go.Scatter(
+            x=iterations[logarithmic], y=np.abs(values[logarithmic]), mode=mode, name=f'|{label}|',
+            line=dict(color='royalblue', width=2), marker=dict(size=6), visible=False,
+        ),
+    ]
+    buttons = [
+        dict(label=label, method='update',
+             args=[{'visible': [True, False]}, {'yaxis.type': 'linear', 'yaxis.title.text': label}]),
+        dict(label=f'log |{label}|', method='update',
+             args=[{'visible': [False, True]}, {'yaxis.type': 'log', 'yaxis.title.text': f'|{label}|'}]),
+    ]
+    xaxis_title = 'Iterasi'
+    if len(linear) < len(values):
+        xaxis_title = f'Iterasi ({len(linear)} dari {len(values)} titik ditampilkan)'
+
+    layout = go.Layout(
+        title=title,
+        xaxis=dict(title=xaxis_title),
+        yaxis=dict(title=label),
+        updatemenus=[dict(type='buttons', direction='right', buttons=buttons,
+                          x=1, xanchor='right', y=1.15, yanchor='bottom')],
+        template='plotly_white'
+    )
+    return go.Figure(data=traces, layout=layout)
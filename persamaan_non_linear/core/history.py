@@ -0,0 +1,261 @@
+"""
+Riwayat solve persisten yang sekaligus menjadi cache hasil tingkat kedua.
+
+Setiap solve baru dari cached_result (core.result_cache) dicatat sebagai SolveRecord.
+Catatan itu berisi metode, hash input yang sudah dinormalisasi, parameter, jumlah
+iterasi, akar, dan durasi. Riwayat iterasinya disimpan sebagai satu array NumPy
+terstruktur (np.save) di kolom biner. Entri cache hasilnya disimpan terkompresi
+(pickle + zlib).
+
+Penulisan ke database tidak dilakukan di thread request. Catatan ditampung di
+buffer, lalu dikemas dan ditulis dengan satu bulk_create oleh satu thread
+latar belakang. Setelah response terkirim (sinyal request_finished), flush
+dijadwalkan ke thread tersebut jika buffer mencapai SOLVE_HISTORY_BATCH_SIZE atau
+SOLVE_HISTORY_FLUSH_INTERVAL detik sudah lewat. Catatan yang masih di buffer saat
+proses berhenti tidak ditulis; hasilnya akan dihitung ulang dan dicatat pada
+request berikutnya.
+
+Jika cache hasil (tingkat pertama, di memori) tidak memuat sebuah kunci, catatan
+terbaru dengan hash yang sama dibaca dari tabel ini. Hasil solve karena itu tetap
+tersedia setelah restart, selama umurnya belum melewati RESULT_CACHE_TIMEOUT.
+
+Pengaturan (settings):
+- SOLVE_HISTORY (bool): False untuk mematikan pencatatan dan cache tingkat kedua.
+- SOLVE_HISTORY_BATCH_SIZE (int): Jumlah catatan per bulk insert.
+- SOLVE_HISTORY_FLUSH_INTERVAL (float): Jeda maksimum (detik) sebelum buffer ditulis.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import io
+import logging
+import numbers
+import pickle
+import threading
+from time import monotonic
+import zlib
+
+import numpy as np
+from django.conf import settings
+from django.db import DatabaseError, connection, connections, router
+from django.utils import timezone
+
+from .models import SolveRecord
+
+logger = logging.getLogger(__name__)
+
+# Kolom iterasi yang berisi akar, dicari berurutan pada baris iterasi terakhir
+ROOT_FIELDS = ('x', 'x1', 'xr')
+
+
+def history_enabled():
+    return getattr(settings, 'SOLVE_HISTORY', True)
+
+
+def is_real(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def rows_to_array(rows):
+    """
+    Mengubah list dict (satu dict per iterasi atau per akar) menjadi array terstruktur float64.
+
+    Hanya kolom yang bernilai real di setiap baris yang disimpan; kolom teks seperti status,
+    dan kolom yang menjadi bilangan kompleks di tengah iterasi, diabaikan.
+
+    Returns:
+    ndarray: Array terstruktur dengan satu field per kolom numerik.
+    """
+    fields = [name for name in rows[0] if all(is_real(row.get(name)) for row in rows)]
+    return np.array(
+        [tuple(float(row[name]) for name in fields) for row in rows],
+        dtype=[(name, 'f8') for name in fields],
+    )
+
+
+def pack_trace(array):
+    if array is None:
+        return None
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def unpack_trace(data):
+    if data is None:
+        return None
+    return np.load(io.BytesIO(bytes(data)), allow_pickle=False)
+
+
+def pack_entry(entry):
+    return zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def unpack_entry(data):
+    return pickle.loads(zlib.decompress(bytes(data)))
+
+
+def summarize(entry):
+    """
+    Mengambil ringkasan solve dari entri cache hasil.
+
+    Returns:
+    dict: iterations, root, trace (ndarray atau None), dan error.
+    """
+    summary = {'iterations': None, 'root': None, 'trace': None, 'error': entry.get('error_message') or ''}
+    result = entry.get('result')
+    if isinstance(result, list) and result:
+        # Newton Raphson/Secant/Regula Falsi: list dict per iterasi
+        last = result[-1]
+        root = next((last[name] for name in ROOT_FIELDS if name in last), None)
+        summary.update(
+            iterations=len(result), trace=rows_to_array(result), root=float(root) if is_real(root) else None,
+        )
+    elif entry.get('roots'):
+        # Mode cari semua akar: trace berisi akar-akar yang ditemukan
+        roots = entry['roots']
+        summary.update(trace=rows_to_array(roots), root=roots[0]['root'] if len(roots) == 1 else None)
+    elif entry.get('iterative_solution'):
+        solution = entry['iterative_solution']
+        summary.update(iterations=solution.iterations, trace=np.asarray(solution.residuals, dtype=np.float64))
+    elif entry.get('sparse_solution'):
+        summary['iterations'] = entry['sparse_solution'].iterations
+    return summary
+
+
+class SolveHistory:
+    """Buffer catatan solve yang ditulis ke database secara batch, aman dipakai dari banyak thread."""
+
+    def __init__(self):
+        self._pending = []
+        self._lock = threading.Lock()
+        self._last_flush = monotonic()
+        # Satu thread penulis, dibuat saat flush pertama dijadwalkan
+        self._flusher = None
+        self._scheduled = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, solve, entry, duration):
+        """
+        Menambahkan satu solve ke buffer. Pengemasan entri dan trace ditunda sampai flush.
+
+        Parameters:
+        solve (SolveInput): Metode, parameter, dan hash input dari core.result_cache.solve_input.
+        entry (dict): Entri cache hasil.
+        duration (float): Lama solve dalam detik.
+        """
+        with self._lock:
+            self._pending.append((solve, entry, duration, timezone.now()))
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self):
+        """
+        Menulis semua catatan di buffer dengan satu bulk_create.
+
+        Catatan yang gagal diringkas atau dikemas dicatat ke log dan dilewati tanpa membuang
+        catatan lain. Kegagalan database dicatat ke log dan batch itu dibuang, agar request
+        berikutnya tidak ikut gagal.
+
+        Returns:
+        int: Jumlah catatan yang ditulis.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = monotonic()
+        if not pending:
+            return 0
+        records = []
+        for solve, entry, duration, created_at in pending:
+            try:
+                summary = summarize(entry)
+                records.append(SolveRecord(
+                    method=solve.method, input_hash=solve.digest, params=solve.params,
+                    iterations=summary['iterations'], root=summary['root'], duration=duration,
+                    error=summary['error'], trace=pack_trace(summary['trace']), entry=pack_entry(entry),
+                    created_at=created_at,
+                ))
+            except Exception:
+                logger.exception("Gagal mengemas catatan riwayat solve %s %s", solve.method, solve.digest)
+        if not records:
+            return 0
+        try:
+            SolveRecord.objects.bulk_create(records, batch_size=getattr(settings, 'SOLVE_HISTORY_BATCH_SIZE', 100))
+        except DatabaseError:
+            logger.exception("Gagal menulis %d catatan riwayat solve", len(records))
+            return 0
+        return len(records)
+
+    def maybe_flush(self, **kwargs):
+        """Receiver request_finished: menjadwalkan flush jika buffer sudah penuh atau sudah terlalu lama."""
+        if not self._pending:
+            return
+        full = len(self._pending) >= getattr(settings, 'SOLVE_HISTORY_BATCH_SIZE', 100)
+        due = monotonic() - self._last_flush >= getattr(settings, 'SOLVE_HISTORY_FLUSH_INTERVAL', 5.0)
+        if full or due:
+            self.schedule_flush()
+
+    def schedule_flush(self):
+        """
+        Menjalankan flush di thread penulis sehingga pengemasan dan bulk_create tidak menahan thread request.
+
+        Database SQLite in-memory (database test) tidak bisa ditulis dari koneksi thread
+        lain selama transaksinya terbuka, jadi untuk database seperti itu flush langsung dijalankan.
+
+        Returns:
+        Future: Flush yang dijadwalkan, atau None jika flush langsung dijalankan.
+        """
+        database = connections[router.db_for_write(SolveRecord)]
+        if getattr(database, 'is_in_memory_db', lambda: False)():
+            self.flush()
+            return None
+        with self._lock:
+            # Flush yang belum mulai akan ikut menulis catatan yang baru masuk
+            if self._scheduled is None or self._scheduled.done():
+                if self._flusher is None:
+                    self._flusher = ThreadPoolExecutor(max_workers=1, thread_name_prefix='solve-history')
+                self._scheduled = self._flusher.submit(self._flush_in_thread)
+                self._scheduled.add_done_callback(log_flush_failure)
+            return self._scheduled
+
+    def _flush_in_thread(self):
+        try:
+            return self.flush()
+        finally:
+            # Koneksi database milik thread penulis ditutup setiap selesai
+            connection.close()
+
+
+def log_flush_failure(future):
+    # Hasil flush di thread penulis tidak pernah ditunggu request, jadi exception-nya dicatat di sini
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Flush riwayat solve gagal", exc_info=future.exception())
+
+
+# Buffer bersama untuk seluruh proses
+solve_history = SolveHistory()
+
+
+async def load_entry(digest):
+    """
+    Membaca entri cache hasil terbaru untuk hash input ini dari database (cache tingkat kedua).
+
+    Catatan yang lebih lama dari RESULT_CACHE_TIMEOUT tidak dipakai, sama seperti
+    entri cache tingkat pertama yang sudah kedaluwarsa.
+
+    Returns:
+    dict: Entri cache hasil, atau None jika belum pernah dicatat atau sudah kedaluwarsa.
+    """
+    records = SolveRecord.objects.filter(input_hash=digest, entry__isnull=False)
+    timeout = getattr(settings, 'RESULT_CACHE_TIMEOUT', None)
+    if timeout is not None:
+        records = records.filter(created_at__gte=timezone.now() - timedelta(seconds=timeout))
+    try:
+        record = await records.only('entry').afirst()
+    except DatabaseError:
+        logger.exception("Gagal membaca riwayat solve")
+        return None
+    return unpack_entry(record.entry) if record else None
@@ -0,0 +1,152 @@
+"""
+Pengukuran waktu per request dan per fase perhitungan.
+
+View dan solver menandai fase-fasenya dengan `with phase('solve'):`. Fase yang
+dipakai: parse (membaca input), compile (sympify/lambdify), cache (cache hasil),
+solve (iterasi solver), chart (membuat grafik Plotly), dan render (template).
+Fase bisa bersarang: solve mencakup compile jika ekspresinya belum ada di cache.
+collect() dan phase() sendiri ada di solvers.timing dan diimpor ulang di sini.
+
+TimingMiddleware mengumpulkan waktu fase untuk setiap request lalu
+- menambahkan header `Server-Timing` (dapat dilihat di DevTools browser),
+- menulis satu baris log JSON ke logger `core.instrumentation`, dan
+- mencatatnya ke histogram yang dilayani dalam format teks Prometheus di /metrics.
+
+Histogram disimpan di memori proses, sehingga setiap proses server punya
+angkanya sendiri (Prometheus menjumlahkannya per instance). Endpoint /metrics
+ada di core.views dan hanya melayani alamat di METRICS_ALLOWED_IPS serta pengguna staff.
+"""
+from bisect import bisect_left
+import json
+import logging
+import threading
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Fase diukur di solvers.timing agar solver tidak bergantung pada Django
+from solvers.timing import collect, phase, record  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# Batas atas bucket histogram, dalam detik
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+class Histogram:
+    """Histogram kumulatif bergaya Prometheus dengan label, aman dipakai dari banyak thread."""
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, seconds):
+        with self._lock:
+            counts, total = self._series.get(labels, ([0] * (len(BUCKETS) + 1), 0.0))
+            counts[bisect_left(BUCKETS, seconds)] += 1
+            self._series[labels] = (counts, total + seconds)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def exposition(self):
+        """
+        Returns:
+        list: Baris-baris format teks Prometheus untuk histogram ini.
+        """
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        for labels, counts, total in series:
+            label_text = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ('+Inf',), counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {total!r}')
+            lines.append(f'{self.name}_count{{{label_text}}} {cumulative}')
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+REQUEST_DURATION = Histogram(
+    'solver_request_duration_seconds', 'Waktu total request per metode.', ('method', 'status'),
+)
+PHASE_DURATION = Histogram(
+    'solver_phase_duration_seconds', 'Waktu setiap fase perhitungan per metode.', ('method', 'phase'),
+)
+
+
+def method_label(request):
+    """
+    Nama metode untuk label metrik: '<app>:<nama url>', misalnya 'secant:index' atau 'api:api-gauss'.
+    """
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return f"{match.func.__module__.split('.')[0]}:{match.url_name}"
+
+
+def server_timing(timings, total):
+    """Menyusun nilai header Server-Timing (durasi dalam milidetik)."""
+    entries = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in timings.items()]
+    entries.append(f'total;dur={total * 1000:.2f}')
+    return ', '.join(entries)
+
+
+def _finish(request, response, timings, total):
+    method = method_label(request)
+    response['Server-Timing'] = server_timing(timings, total)
+    REQUEST_DURATION.observe((method, str(response.status_code)), total)
+    for name, seconds in timings.items():
+        PHASE_DURATION.observe((method, name), seconds)
+
+    slow = total >= getattr(settings, 'TIMING_SLOW_REQUEST', 1.0)
+    level = logging.WARNING if slow else logging.INFO
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps({
+            'method': method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 2),
+            'phases_ms': {name: round(seconds * 1000, 2) for name, seconds in timings.items()},
+        }))
+    return response
+
+
+class TimingMiddleware:
+    """
+    Middleware yang mengukur setiap request beserta fase-fasenya.
+
+    Dipasang paling atas di MIDDLEWARE agar waktu total mencakup semua middleware lain.
+    Mendukung view sinkron maupun async.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = perf_counter()
+        with collect() as timings:
+            response = self.get_response(request)
+        return _finish(request, response, timings, perf_counter() - start)
+
+    async def __acall__(self, request):
+        start = perf_counter()
+        with collect() as timings:
+            response = await self.get_response(request)
+        return _finish(request, response, timings, perf_counter() - start)
+
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+import platform
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils import timezone
+import numpy as np
+
+from core import benchmarks
+from core.offload import get_pool, offload_enabled
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'baseline.json'
+
+
+class Command(BaseCommand):
+    help = (
+        'Menjalankan benchmark solver, eliminasi Gauss, view, dan start-up proses, menyimpan hasilnya ke JSON, '
+        'lalu membandingkannya dengan baseline. Keluar dengan error jika ada regresi.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only', default=','.join(benchmarks.GROUPS),
+            help=f"Kelompok benchmark dipisah koma ({', '.join(benchmarks.GROUPS)}).",
+        )
+        parser.add_argument('--quick', action='store_true', help='Ukuran matriks dan jumlah pengulangan lebih kecil.')
+        parser.add_argument('--repeat', type=int, default=None, help='Jumlah pengukuran per benchmark.')
+        parser.add_argument('--output', help='File JSON tempat hasil run ini disimpan.')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='File JSON baseline pembanding.')
+        parser.add_argument('--save-baseline', action='store_true', help='Menimpa baseline dengan hasil run ini.')
+        parser.add_argument(
+            '--tolerance', type=float, default=0.5,
+            help='Kenaikan waktu minimum relatif terhadap baseline yang masih diterima (default 0.5 = 50%%).',
+        )
+        parser.add_argument(
+            '--min-delta', type=float, default=2.0,
+            help='Kenaikan waktu minimum absolut (ms) di bawah ini tidak dianggap regresi (default 2 ms).',
+        )
+
+    def handle(self, *args, **options):
+        groups = [group.strip() for group in options['only'].split(',') if group.strip()]
+        unknown = set(groups) - set(benchmarks.GROUPS)
+        if unknown:
+            raise CommandError(f"Kelompok benchmark tidak dikenal: {', '.join(sorted(unknown))}.")
+        quick = options['quick']
+        repeat = options['repeat'] or (3 if quick else 5)
+
+        if 'views' in groups and offload_enabled():
+            # Pool proses solver dibuat dan dipanaskan lebih dulu agar tidak ikut terukur
+            get_pool()
+
+        def report(name, timing):
+            self.stdout.write(
+                f'{name:<50} median {timing.median * 1000:10.3f} ms   min {timing.min * 1000:10.3f} ms   n={timing.repeat}'
+            )
+
+        # Test client memakai host 'testserver'; riwayat solve dimatikan agar benchmark tidak mengisi
+        # tabel SolveRecord dan view yang diukur tanpa cache tidak terbaca dari cache tingkat kedua
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'], SOLVE_HISTORY=False):
+            timings = benchmarks.run(groups, quick=quick, repeat=repeat, max_time=2.0 if quick else 10.0, report=report)
+
+        data = {
+            'meta': {
+                'created': timezone.now().isoformat(),
+                'python': sys.version.split()[0],
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'quick': quick,
+            },
+            'results': {name: timing._asdict() for name, timing in timings.items()},
+        }
+        if options['output']:
+            self.write_json(Path(options['output']), data)
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            self.write_json(baseline_path, data)
+            self.stdout.write(self.style.SUCCESS(f'Baseline disimpan ke {baseline_path}.'))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f'Baseline {baseline_path} tidak ditemukan, perbandingan dilewati.'))
+            return
+        baseline = json.loads(baseline_path.read_text())
+        if baseline['meta'].get('quick') != quick:
+            self.stdout.write(self.style.WARNING('Mode --quick berbeda dengan baseline; ukuran yang sama tetap dibandingkan.'))
+
+        regressions = benchmarks.compare(
+            timings, baseline['results'], tolerance=options['tolerance'], noise_floor=options['min_delta'] / 1000,
+        )
+        for name, previous, current, ratio in regressions:
+            self.stderr.write(
+                f'REGRESI {name}: {previous * 1000:.3f} ms -> {current * 1000:.3f} ms ({ratio:.2f}x)'
+            )
+        if regressions:
+            raise CommandError(f'{len(regressions)} benchmark lebih lambat dari baseline.')
+        self.stdout.write(self.style.SUCCESS('Tidak ada regresi dibanding baseline.'))
+
+    def write_json(self, path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + '\n')
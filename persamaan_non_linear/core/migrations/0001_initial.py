@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(db_index=True, max_length=64)),
+                ('path', models.CharField(max_length=255)),
+                ('input_hash', models.CharField(db_index=True, max_length=64)),
+                ('duration', models.FloatField(db_index=True)),
+                ('status', models.PositiveSmallIntegerField()),
+                ('sampled', models.BooleanField(default=False)),
+                ('profile_file', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-duration'],
+            },
+        ),
+    ]
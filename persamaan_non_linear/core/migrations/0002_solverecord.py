@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:47
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolveRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('method', models.CharField(max_length=32)),
+                ('input_hash', models.CharField(max_length=64)),
+                ('params', models.JSONField()),
+                ('iterations', models.PositiveIntegerField(blank=True, null=True)),
+                ('root', models.FloatField(blank=True, null=True)),
+                ('duration', models.FloatField()),
+                ('error', models.TextField(blank=True)),
+                ('trace', models.BinaryField(blank=True, null=True)),
+                ('entry', models.BinaryField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['input_hash', '-created_at'], name='solve_hash_created_idx'), models.Index(fields=['created_at'], name='solve_created_idx'), models.Index(fields=['method', 'created_at'], name='solve_method_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,93 @@
+import io
+from pathlib import Path
+import pstats
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class ProfileRecord(models.Model):
+    """
+    Satu request yang diprofil dengan cProfile (lihat core.profiling).
+
+    Statistiknya disimpan sebagai file .prof di PROFILING_DIR; tabel ini hanya
+    menyimpan metadata agar request paling lambat mudah dicari.
+    """
+    method = models.CharField(max_length=64, db_index=True)
+    path = models.CharField(max_length=255)
+    input_hash = models.CharField(max_length=64, db_index=True)
+    duration = models.FloatField(db_index=True)
+    status = models.PositiveSmallIntegerField()
+    sampled = models.BooleanField(default=False)
+    profile_file = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-duration']
+
+    def __str__(self):
+        return f'{self.method} {self.duration * 1000:.1f} ms ({self.input_hash[:12]})'
+
+    @property
+    def profile_path(self):
+        return Path(settings.PROFILING_DIR) / self.profile_file
+
+    def top_functions(self, limit=40, sort='cumulative'):
+        """
+        Returns:
+        str: Tabel pstats untuk `limit` fungsi teratas, atau pesan jika file profil sudah tidak ada.
+        """
+        if not self.profile_path.exists():
+            return 'File profil tidak ditemukan.'
+        stream = io.StringIO()
+        stats = pstats.Stats(str(self.profile_path), stream=stream)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def delete(self, *args, **kwargs):
+        # File .prof ikut dihapus bersama catatannya
+        self.profile_path.unlink(missing_ok=True)
+        return super().delete(*args, **kwargs)
+
+
+class SolveRecord(models.Model):
+    """
+    Satu solve yang tercatat (lihat core.history).
+
+    Riwayat iterasi disimpan sebagai satu array NumPy biner di kolom `trace`,
+    bukan satu baris per iterasi. Kolom `entry` berisi entri cache hasil yang
+    dikompresi, sehingga tabel ini sekaligus menjadi cache hasil tingkat kedua
+    yang tetap ada setelah server restart.
+    """
+    method = models.CharField(max_length=32)
+    input_hash = models.CharField(max_length=64)
+    params = models.JSONField()
+    iterations = models.PositiveIntegerField(null=True, blank=True)
+    root = models.FloatField(null=True, blank=True)
+    duration = models.FloatField()
+    error = models.TextField(blank=True)
+    trace = models.BinaryField(null=True, blank=True)
+    entry = models.BinaryField(null=True, blank=True)
+    # Waktu solve, bukan waktu baris ditulis: catatan ditulis belakangan secara batch
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # Lookup cache tingkat kedua: hash input, yang terbaru lebih dulu
+            models.Index(fields=['input_hash', '-created_at'], name='solve_hash_created_idx'),
+            models.Index(fields=['created_at'], name='solve_created_idx'),
+            models.Index(fields=['method', 'created_at'], name='solve_method_created_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.method} {self.input_hash[:12]} ({self.created_at:%Y-%m-%d %H:%M:%S})'
+
+    def trace_array(self):
+        """
+        Returns:
+        ndarray: Riwayat iterasi (array terstruktur dengan nama kolom), atau None jika tidak ada.
+        """
+        from .history import unpack_trace
+        return unpack_trace(self.trace)
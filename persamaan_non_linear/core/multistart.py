@@ -0,0 +1,66 @@
+"""
+Mode "cari semua akar di [lo, hi]" yang dipakai bersama oleh view Newton Raphson dan Secant.
+
+Iterasi grid titik awal dijalankan di pool proses solver (core.offload), sehingga
+dibatasi SOLVER_TIMEOUT seperti mode satu akar. Biayanya n_starts x max_iter, jadi
+max_iter untuk mode ini dibatasi MAX_ITER.
+"""
+from solvers.expression import get_compiled
+from solvers.vectorized import find_all_roots
+
+from .charts import roots_figure
+from .instrumentation import phase
+from .offload import run_in_pool, run_in_thread
+
+# Batas jumlah titik awal yang boleh diminta dari form
+DEFAULT_STARTS = 200
+MAX_STARTS = 10000
+
+# Batas iterasi per titik awal pada mode ini
+MAX_ITER = 500
+
+
+def find_roots(f_expr, method, lo, hi, tol, max_iter, n_starts):
+    """
+    Mencari semua akar dengan grid titik awal; dijalankan di worker pool solver.
+
+    Returns:
+    RootSet: Akar unik beserta f(akar) dan jumlah titik awal yang konvergen ke sana.
+    """
+    with phase('compile'):
+        compiled = get_compiled(f_expr)
+    return find_all_roots(compiled.f, compiled.f_prime_fn, lo, hi, tol, max_iter, n_starts, method)
+
+
+async def solve_all_roots(post, method, f_expr, tol, max_iter, title):
+    """
+    Membaca batas interval dari form lalu mencari semua akar dengan grid titik awal.
+
+    Parameters:
+    post (QueryDict): Data POST berisi lo, hi, dan n_starts (opsional).
+    method (str): 'newton-raphson' atau 'secant'.
+    f_expr (str): Ekspresi fungsi sebagai string.
+    tol (float): Toleransi error.
+    max_iter (int): Jumlah iterasi maksimum per titik awal (paling banyak MAX_ITER).
+    title (str): Judul grafik.
+
+    Returns:
+    tuple: List akar (dict root, f_root, count), ekspresi terkompilasi, dan figure Plotly.
+    """
+    lo = float(post.get('lo'))
+    hi = float(post.get('hi'))
+    if lo >= hi:
+        raise ValueError("Batas bawah harus lebih kecil dari batas atas.")
+    n_starts = min(max(int(post.get('n_starts') or DEFAULT_STARTS), 2), MAX_STARTS)
+
+    with phase('solve'):
+        found = await run_in_pool(find_roots, f_expr, method, lo, hi, tol, min(max_iter, MAX_ITER), n_starts)
+    roots = [
+        {'root': root, 'f_root': f_root, 'count': count}
+        for root, f_root, count in zip(found.roots.tolist(), found.f_roots.tolist(), found.counts.tolist())
+    ]
+    # Kurva f(x) untuk grafik dievaluasi di proses web; ekspresinya diambil dari cache
+    compiled = await run_in_thread(get_compiled, f_expr)
+    with phase('chart'):
+        fig = await run_in_thread(roots_figure, compiled.f, lo, hi, found, title)
+    return roots, compiled, fig
@@ -0,0 +1,210 @@
+"""
+Menjalankan pemanggilan solver di pool proses terpisah.
+
+Solver berupa loop Python murni sehingga request yang berjalan bersamaan di
+server threaded saling menunggu GIL. Dengan mengirim pemanggilan solver ke
+ProcessPoolExecutor, setiap solve berjalan di inti CPU sendiri sementara thread
+web hanya menunggu hasilnya.
+
+Worker di pool sudah memuat NumPy, SymPy, dan SciPy saat dibuat, dan setiap
+worker menyimpan cache ekspresinya sendiri (solvers.expression.expression_cache).
+
+View async (ASGI) memakai run_in_pool untuk solver dan run_in_thread untuk
+pekerjaan yang melepas GIL (LAPACK/BLAS) atau rendering template, sehingga
+event loop tidak pernah terblokir oleh perhitungan.
+
+Pengaturan (settings):
+- SOLVER_OFFLOAD (bool): False untuk menjalankan solver langsung di proses web.
+- SOLVER_POOL_SIZE (int): Jumlah proses worker.
+- SOLVER_TIMEOUT (float): Batas waktu per pemanggilan, dalam detik.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import logging
+import multiprocessing
+import os
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .instrumentation import collect, record
+from .profiling import add_stats, call_profiled, profiled, profiling_active
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# True di dalam proses worker (pool ini maupun worker job), agar pemanggilan bersarang langsung dijalankan
+_in_worker = False
+
+
+class SolverTimeout(Exception):
+    """Pemanggilan solver melebihi SOLVER_TIMEOUT."""
+
+
+def mark_worker():
+    """Menandai proses ini sebagai worker sehingga offload dijalankan langsung di proses ini."""
+    global _in_worker
+    _in_worker = True
+
+
+def in_worker():
+    return _in_worker
+
+
+def _init_worker():
+    # Worker dibuat dengan 'spawn': Django di-setup ulang, lalu library berat dimuat sekali di awal
+    # Ditandai sebelum setup agar warmup di AppConfig.ready tahu ia berjalan di worker
+    mark_worker()
+    import django
+    django.setup()
+
+    import numpy  # noqa: F401
+    import scipy.linalg  # noqa: F401
+    from solvers.expression import get_compiled
+    # Memanaskan sympify, diff, dan lambdify agar solve pertama tidak membayar biaya import-nya
+    get_compiled('x**2 - 2')
+
+
+def _call_timed(func, args, kwargs, profile=False):
+    # Dijalankan di worker: waktu fase di dalam solver (misalnya compile), dan statistik cProfile
+    # jika request-nya diprofil, dikirim balik bersama hasilnya
+    stats = None
+    with collect() as timings:
+        if profile:
+            result, stats = call_profiled(func, args, kwargs)
+        else:
+            result = func(*args, **kwargs)
+    return result, timings, stats
+
+
+def _run_profiled(func, *args, **kwargs):
+    with profiled():
+        return func(*args, **kwargs)
+
+
+def _ping():
+    return os.getpid()
+
+
+def pool_size():
+    return getattr(settings, 'SOLVER_POOL_SIZE', None) or min(4, os.cpu_count() or 1)
+
+
+def get_pool():
+    """
+    Membuat (sekali) pool proses solver dan menyalakan semua worker-nya.
+
+    Returns:
+    ProcessPoolExecutor: Pool yang dipakai bersama oleh semua request.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            size = pool_size()
+            _pool = ProcessPoolExecutor(
+                max_workers=size,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+            # Worker dibuat sekarang, bukan saat request pertama datang
+            for _ in range(size):
+                _pool.submit(_ping)
+        return _pool
+
+
+def _restart_pool(pool):
+    # Worker yang melewati batas waktu tidak bisa dibatalkan, jadi pool lama dimatikan dan dibuat ulang
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    for process in list(getattr(pool, '_processes', {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def offload_enabled():
+    return getattr(settings, 'SOLVER_OFFLOAD', True) and not _in_worker
+
+
+def timeout_message(timeout):
+    return f"Perhitungan melebihi batas waktu {timeout:g} detik."
+
+
+def call_in_pool(func, *args, **kwargs):
+    """
+    Memanggil func(*args, **kwargs) di pool proses dan menunggu hasilnya.
+
+    Fungsi dan argumennya harus bisa di-pickle. Jika offload dimatikan, atau
+    pemanggilan terjadi di dalam worker, func langsung dijalankan di proses ini.
+
+    Returns:
+    object: Nilai kembalian func; exception dari func dilempar ulang di sini.
+    """
+    if not offload_enabled():
+        return _run_profiled(func, *args, **kwargs)
+    timeout = getattr(settings, 'SOLVER_TIMEOUT', 30)
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            future = pool.submit(_call_timed, func, args, kwargs, profiling_active())
+            result, timings, stats = future.result(timeout=timeout)
+            record(timings)
+            add_stats(stats)
+            return result
+        except FutureTimeoutError:
+            _restart_pool(pool)
+            raise SolverTimeout(timeout_message(timeout))
+        except BrokenProcessPool:
+            # Pool dimatikan oleh request lain yang timeout; dicoba sekali lagi di pool baru
+            _restart_pool(pool)
+            if attempt:
+                raise
+            logger.warning("Pool solver rusak, membuat pool baru")
+
+
+def run_in_thread(func, *args, **kwargs):
+    """
+    Menjalankan fungsi sinkron di thread executor dari view async.
+
+    Dipakai untuk pekerjaan yang tidak perlu (atau tidak bisa) dikirim ke pool
+    proses: solver NumPy/SciPy yang melepas GIL, parsing input, dan rendering.
+
+    Returns:
+    awaitable: Nilai kembalian func.
+    """
+    if profiling_active():
+        func = partial(_run_profiled, func)
+    return sync_to_async(func, thread_sensitive=False)(*args, **kwargs)
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Versi async dari call_in_pool untuk view ASGI: event loop tidak terblokir selama solver berjalan.
+    """
+    if not offload_enabled():
+        return await run_in_thread(func, *args, **kwargs)
+    timeout = getattr(settings, 'SOLVER_TIMEOUT', 30)
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            result, timings, stats = await asyncio.wait_for(
+                loop.run_in_executor(pool, _call_timed, func, args, kwargs, profiling_active()), timeout,
+            )
+            record(timings)
+            add_stats(stats)
+            return result
+        except asyncio.TimeoutError:
+            _restart_pool(pool)
+            raise SolverTimeout(timeout_message(timeout))
+        except BrokenProcessPool:
+            _restart_pool(pool)
+            if attempt:
+                raise
+            logger.warning("Pool solver rusak, membuat pool baru")
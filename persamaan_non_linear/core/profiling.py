@@ -0,0 +1,228 @@
+"""
+Profiling cProfile opsional untuk request solver.
+
+Sebuah request diprofil jika
+- pengguna staff menambahkan `?profile=1` atau header `X-Profile: 1`, atau
+- request POST terpilih oleh sampling acak dengan peluang PROFILING_SAMPLE_RATE.
+
+Pekerjaan satu request tersebar di beberapa tempat: thread request itu sendiri
+(view sinkron), thread executor (run_in_thread), dan proses worker pool solver
+(run_in_pool). Ketiganya diprofil terpisah lalu statistiknya digabung menjadi
+satu file .prof di PROFILING_DIR. Setiap profil dicatat sebagai ProfileRecord
+(metode, hash input, durasi) dan dapat dilihat di admin, diurutkan dari request
+yang paling lambat. File .prof juga bisa dibuka dengan snakeviz atau pstats.
+
+Event loop ASGI sendiri tidak diprofil karena dipakai bersama oleh request lain;
+semua perhitungan di view async sudah berjalan di thread executor atau pool.
+
+Modul ini tidak mengimpor model di level atas agar aman dimuat di proses worker.
+"""
+import cProfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+import hashlib
+import json
+from pathlib import Path
+import pstats
+import random
+import threading
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http.request import RawPostDataException
+
+from .instrumentation import method_label
+
+# Profil request yang sedang berjalan, atau None jika request ini tidak diprofil
+_profile = ContextVar('profiling_profile', default=None)
+
+# Menandai thread yang sudah berada di bawah cProfile; profiler tidak boleh bersarang dalam satu thread
+_local = threading.local()
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+class _RawStats:
+    # Pembungkus dict Profile.stats (misalnya dari worker) agar bisa diterima pstats.Stats.add
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class RequestProfile:
+    """Statistik cProfile dari semua thread dan worker yang mengerjakan satu request."""
+
+    def __init__(self):
+        self._stats = []
+        self._lock = threading.Lock()
+
+    def add(self, stats):
+        with self._lock:
+            self._stats.append(stats)
+
+    def merged(self):
+        """
+        Returns:
+        pstats.Stats: Gabungan semua statistik yang terkumpul.
+        """
+        merged = pstats.Stats()
+        with self._lock:
+            for stats in self._stats:
+                merged.add(_RawStats(stats))
+        return merged
+
+
+def profiling_active():
+    return _profile.get() is not None
+
+
+def add_stats(stats):
+    """Menambahkan statistik yang diukur di tempat lain (misalnya di proses worker) ke profil request ini."""
+    request_profile = _profile.get()
+    if request_profile is not None and stats:
+        request_profile.add(stats)
+
+
+@contextmanager
+def profiled():
+    """Memprofil blok ini dengan cProfile jika request ini diprofil; tidak melakukan apa-apa jika tidak."""
+    request_profile = _profile.get()
+    if request_profile is None or getattr(_local, 'active', False):
+        yield
+        return
+    profiler = cProfile.Profile()
+    _local.active = True
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _local.active = False
+        profiler.create_stats()
+        request_profile.add(profiler.stats)
+
+
+def call_profiled(func, args, kwargs):
+    """
+    Memanggil func di bawah cProfile (dipakai di proses worker).
+
+    Returns:
+    tuple: Nilai kembalian func dan dict statistik mentahnya (bisa di-pickle).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    profiler.create_stats()
+    return result, profiler.stats
+
+
+def wants_profile(request):
+    # Flag eksplisit dari query string atau header; izin staff diperiksa terpisah
+    flag = request.GET.get('profile') or request.headers.get('X-Profile') or ''
+    return flag.lower() in TRUE_VALUES
+
+
+def sampled(request):
+    rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+    return request.method == 'POST' and rate > 0 and random.random() < rate
+
+
+def input_hash(request):
+    """
+    Hash SHA-256 dari input request, untuk mengelompokkan profil dengan input yang sama.
+    """
+    if request.content_type in ('application/x-www-form-urlencoded', 'multipart/form-data'):
+        data = json.dumps(sorted(request.POST.lists())).encode()
+    else:
+        try:
+            data = request.body
+        except RawPostDataException:
+            data = b''
+    return hashlib.sha256(request.get_full_path().encode() + b'\n' + data).hexdigest()
+
+
+def save_profile(request, response, request_profile, duration, was_sampled):
+    """
+    Menyimpan profil gabungan ke PROFILING_DIR dan mencatatnya sebagai ProfileRecord.
+
+    Hanya PROFILING_MAX_RECORDS profil paling lambat yang disimpan; sisanya dihapus beserta filenya.
+
+    Returns:
+    ProfileRecord: Catatan profil yang baru dibuat.
+    """
+    from .models import ProfileRecord
+
+    method = method_label(request)
+    digest = input_hash(request)
+    directory = Path(settings.PROFILING_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    filename = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{method.replace(':', '-')}-{digest[:12]}.prof"
+    request_profile.merged().dump_stats(directory / filename)
+
+    record = ProfileRecord.objects.create(
+        method=method, path=request.path[:255], input_hash=digest, duration=duration,
+        status=response.status_code, sampled=was_sampled, profile_file=filename,
+    )
+    for old in ProfileRecord.objects.order_by('-duration')[getattr(settings, 'PROFILING_MAX_RECORDS', 500):]:
+        old.delete()
+    return record
+
+
+class ProfilingMiddleware:
+    """
+    Middleware yang memprofil request terpilih dan menyimpan hasilnya.
+
+    Dipasang setelah AuthenticationMiddleware karena flag profil hanya berlaku untuk staff.
+    Request yang diprofil atas permintaan staff mendapat header `X-Profile-Id` berisi id ProfileRecord.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        requested = wants_profile(request) and request.user.is_staff
+        was_sampled = not requested and sampled(request)
+        if not (requested or was_sampled):
+            return self.get_response(request)
+
+        request_profile = RequestProfile()
+        token = _profile.set(request_profile)
+        start = perf_counter()
+        try:
+            with profiled():
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        record = save_profile(request, response, request_profile, perf_counter() - start, was_sampled)
+        if requested:
+            response['X-Profile-Id'] = str(record.pk)
+        return response
+
+    async def __acall__(self, request):
+        requested = wants_profile(request) and (await request.auser()).is_staff
+        was_sampled = not requested and sampled(request)
+        if not (requested or was_sampled):
+            return await self.get_response(request)
+
+        request_profile = RequestProfile()
+        token = _profile.set(request_profile)
+        start = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _profile.reset(token)
+        record = await sync_to_async(save_profile)(
+            request, response, request_profile, perf_counter() - start, was_sampled,
+        )
+        if requested:
+            response['X-Profile-Id'] = str(record.pk)
+        return response
@@ -0,0 +1,124 @@
+"""
+Cache hasil perhitungan untuk permintaan solve yang identik.
+
+Kunci cache adalah hash SHA-256 dari nama metode dan input yang sudah
+dinormalisasi: ekspresi dengan spasi berurutan diringkas menjadi satu (seperti
+solvers.expression), angka sebagai float, dan matriks sebagai hash isinya. Dengan
+begitu " x**2  - 2" dan "x**2 - 2", atau "1" dan "1.0", memakai entri yang sama.
+Spasi tidak dibuang seluruhnya agar "x - 1 0" tidak bertabrakan dengan "x - 10". Entri berisi semua data yang dibutuhkan template,
+termasuk JSON grafik, sehingga cache hit tidak menjalankan solver maupun membuat
+grafik.
+
+Backend, TTL, dan jumlah entri maksimum diatur lewat alias cache 'results' di
+settings.CACHES (lihat RESULT_CACHE_BACKEND di settings).
+
+Cache ini adalah tingkat pertama. Setiap solve baru juga dicatat di tabel
+SolveRecord (core.history), yang dibaca sebagai cache tingkat kedua saat kunci
+tidak ada di cache tingkat pertama, misalnya setelah server restart.
+"""
+from collections import namedtuple
+import hashlib
+import json
+from time import perf_counter
+
+import numpy as np
+from django.core.cache import caches
+
+from solvers.lu import matrix_key
+from .history import history_enabled, load_entry, solve_history
+from .instrumentation import phase
+
+# Alias di settings.CACHES yang dipakai untuk hasil solve
+RESULT_CACHE_ALIAS = 'results'
+
+# Dinaikkan jika format entri berubah agar entri lama (misalnya di cache file/database) tidak terbaca
+KEY_VERSION = 2
+
+
+def normalize(value):
+    """
+    Mengubah satu input menjadi bentuk kanonik yang bisa di-serialisasi ke JSON.
+
+    Returns:
+    object: String dengan spasi yang diringkas, float, hash matriks, atau nilai aslinya (None/bool).
+    """
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return matrix_key(value)
+    raise TypeError(f"Input bertipe {type(value).__name__} tidak bisa dijadikan kunci cache.")
+
+
+class SolveInput(namedtuple('SolveInput', ['method', 'params', 'digest'])):
+    """Metode, input yang sudah dinormalisasi, dan hash SHA-256-nya."""
+
+    @property
+    def key(self):
+        return 'solve:' + self.digest
+
+
+def solve_input(method, **inputs):
+    """
+    Menormalisasi input solver dan menghitung hash-nya.
+
+    Parameters:
+    method (str): Nama metode (dan mode) solver, misalnya 'newton-raphson' atau 'gauss-lu'.
+    **inputs: Input solver; urutan argumen tidak berpengaruh.
+
+    Returns:
+    SolveInput: Dipakai sebagai kunci cached_result dan dicatat di riwayat solve.
+    """
+    params = {name: normalize(value) for name, value in inputs.items()}
+    canonical = json.dumps([KEY_VERSION, method, params], sort_keys=True)
+    return SolveInput(method, params, hashlib.sha256(canonical.encode()).hexdigest())
+
+
+def result_key(method, **inputs):
+    """
+    Menghitung kunci cache dari nama metode dan inputnya.
+
+    Returns:
+    str: Kunci cache 'solve:<sha256>'.
+    """
+    return solve_input(method, **inputs).key
+
+
+def result_cache():
+    return caches[RESULT_CACHE_ALIAS]
+
+
+async def cached_result(solve, compute):
+    """
+    Mengambil entri dari cache hasil, atau menghitung dan menyimpannya jika belum ada.
+
+    Urutan pencarian: cache hasil (tingkat pertama), lalu riwayat solve di database
+    (tingkat kedua). Solve baru dimasukkan ke buffer riwayat, yang ditulis setelah response.
+
+    Parameters:
+    solve (SolveInput): Hasil solve_input.
+    compute (callable): Fungsi async tanpa argumen yang mengembalikan entri (dict yang bisa di-pickle).
+
+    Returns:
+    tuple: Entri dan True jika diambil dari cache.
+    """
+    cache = result_cache()
+    with phase('cache'):
+        entry = await cache.aget(solve.key)
+        if entry is None and history_enabled():
+            entry = await load_entry(solve.digest)
+            if entry is not None:
+                await cache.aset(solve.key, entry)
+    if entry is not None:
+        return entry, True
+    start = perf_counter()
+    entry = await compute()
+    duration = perf_counter() - start
+    with phase('cache'):
+        await cache.aset(solve.key, entry)
+    if history_enabled():
+        solve_history.add(solve, entry, duration)
+    return entry, False
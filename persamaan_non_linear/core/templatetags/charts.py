@@ -0,0 +1,18 @@
+from django import template
+from django.utils.html import format_html
+
+from core.charts import plotly_js_url
+
+register = template.Library()
+
+
+@register.simple_tag
+def plotly_js():
+    # Tag script untuk plotly.js yang di-cache browser, cukup dipanggil sekali per halaman
+    return format_html('<script src="{}"></script>', plotly_js_url())
+
+
+@register.inclusion_tag('core/chart.html')
+def plotly_chart(chart):
+    # Merender div grafik beserta JSON figure hasil core.charts.render_chart
+    return {'chart': chart}
@@ -0,0 +1,539 @@
+import asyncio
+from datetime import timedelta
+import gc
+from importlib import import_module
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from newton_raphson import views as newton_views
+from solvers.expression import expression_cache
+from solvers.roots import newton_rapshon
+from solvers.vectorized import find_all_roots
+from .benchmarks import compare, first_request
+from .charts import convergence_figure, lttb_indices, plotly_js_digest, plotly_js_url
+from .instrumentation import BUCKETS, Histogram
+from .history import solve_history
+from .models import ProfileRecord, SolveRecord
+from .multistart import MAX_ITER
+from .offload import SolverTimeout, call_in_pool
+from .result_cache import result_cache, result_key, solve_input
+from .warmup import warm_app
+
+
+class PlotlyJsTest(TestCase):
+    def test_dilayani_dengan_cache_jangka_panjang(self):
+        response = self.client.get(plotly_js_url())
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['ETag'], f'"{plotly_js_digest()}"')
+        response.close()
+
+    def test_hash_salah_404(self):
+        response = self.client.get(reverse('plotly-js', args=['000000000000']))
+        self.assertEqual(response.status_code, 404)
+
+    def test_if_none_match(self):
+        response = self.client.get(plotly_js_url(), HTTP_IF_NONE_MATCH=f'"{plotly_js_digest()}"')
+        self.assertEqual(response.status_code, 304)
+
+
+class ChartRenderingTest(TestCase):
+    data = {'f_expr': 'x**2 - 2', 'x': '1', 'tol': '1e-6', 'max_iter': '20'}
+
+    def test_halaman_tidak_menyisipkan_plotly_js(self):
+        response = self.client.post('/newton-raphson/', self.data)
+        self.assertContains(response, plotly_js_url())
+        self.assertContains(response, 'Plotly.newPlot')
+        self.assertLess(len(response.content), 100_000)
+
+    def test_mode_json(self):
+        response = self.client.post('/newton-raphson/?chart=json', self.data)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        figure = json.loads(response.content)
+        self.assertEqual(figure['data'][0]['type'], 'scatter')
+
+    def test_gaus_mode_json(self):
+        response = self.client.post('/gaus/?chart=json', {'matrix': '[[2, 1], [1, 3]]', 'results': '[3, 5]'})
+        self.assertEqual(json.loads(response.content)['data'][0]['type'], 'heatmap')
+
+    def test_grafik_dibuat_di_luar_event_loop(self):
+        result_cache().clear()
+        requests = [
+            ('newton_raphson.views.grafik_konvergensi', '/newton-raphson/', self.data),
+            ('secant.views.grafik_konvergensi', '/secant/',
+             {'f_expr': 'x**2 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-6', 'max_iter': '20'}),
+            ('regula_falsi.views.grafik_konvergensi', '/regula-falsi/',
+             {'f_expr': 'x**2 - 2', 'a': '0', 'b': '2', 'tol': '1e-6', 'max_iter': '20'}),
+            ('gaus.views.grafik_residual', '/gaus/',
+             {'matrix': '[[4, 1], [1, 3]]', 'results': '[1, 2]', 'engine': 'jacobi', 'tol': '1e-8'}),
+            ('gaus.views.grafik_eliminasi', '/gaus/?chart=json', {'matrix': '[[2, 1], [1, 3]]', 'results': '[3, 5]'}),
+        ]
+        for target, url, data in requests:
+            module, name = target.rsplit('.', 1)
+            loops = []
+
+            def build(*args, original=getattr(import_module(module), name), loops=loops):
+                # Mencatat apakah figure dibangun di thread yang sedang menjalankan event loop
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    loops.append(False)
+                else:
+                    loops.append(True)
+                return original(*args)
+
+            with self.subTest(target), mock.patch(target, side_effect=build):
+                self.assertEqual(self.client.post(url, data).status_code, 200)
+                self.assertEqual(loops, [False])
+
+
+class ChartDownsamplingTest(TestCase):
+    def test_lttb_mempertahankan_ujung_dan_puncak(self):
+        x = np.arange(100_000, dtype=float)
+        y = np.sin(x / 1000)
+        y[54_321] = 5.0
+        indices = lttb_indices(x, y, 500)
+        self.assertEqual(len(indices), 500)
+        self.assertEqual((indices[0], indices[-1]), (0, 99_999))
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(54_321, indices)
+        np.testing.assert_array_equal(lttb_indices(x[:10], y[:10], 500), np.arange(10))
+
+    def test_grafik_konvergensi_terbatas(self):
+        result = [{'iteration': i, 'f_x': 10.0 ** -(i / 1000)} for i in range(1, 50_001)]
+        result[-1]['f_x'] = 0.0
+        with override_settings(CHART_MAX_POINTS=300):
+            linear, logarithmic = convergence_figure(result, 'f_x', 'Konvergensi', 'f(x)').data
+        self.assertEqual((len(linear.x), len(logarithmic.x)), (300, 300))
+        self.assertEqual(linear.x[-1], 50_000)
+        # f = 0 tidak bisa ditampilkan di sumbu log, jadi titik terakhir tampilan log adalah iterasi sebelumnya
+        self.assertEqual(logarithmic.x[-1], 49_999)
+        self.assertFalse(logarithmic.visible)
+
+    @override_settings(CHART_MAX_POINTS=100)
+    def test_view_regula_falsi(self):
+        response = self.client.post('/regula-falsi/?chart=json', {
+            'f_expr': 'x**10 - 0.001', 'a': '0', 'b': '3', 'tol': '1e-12', 'max_iter': '3000',
+        })
+        figure = response.json()
+        self.assertEqual(figure['layout']['xaxis']['title']['text'], 'Iterasi (100 dari 3000 titik ditampilkan)')
+        self.assertEqual([button['label'] for button in figure['layout']['updatemenus'][0]['buttons']],
+                         ['f(xr)', 'log |f(xr)|'])
+
+
+class AllRootsModeTest(TestCase):
+    def test_newton_semua_akar(self):
+        response = self.client.post('/newton-raphson/', {
+            'f_expr': 'x**3 - x', 'tol': '1e-10', 'max_iter': '50', 'lo': '-2', 'hi': '2', 'mode': 'all',
+        })
+        roots = [row['root'] for row in response.context['roots']]
+        self.assertEqual(len(roots), 3)
+        self.assertAlmostEqual(roots[1], 0.0)
+        self.assertContains(response, 'Plotly.newPlot')
+
+    def test_secant_semua_akar_mode_json(self):
+        response = self.client.post('/secant/?chart=json', {
+            'f_expr': 'cos(x)', 'tol': '1e-10', 'max_iter': '50', 'lo': '0', 'hi': '7', 'mode': 'all',
+        })
+        figure = json.loads(response.content)
+        self.assertEqual(len(figure['data'][1]['x']), 2)
+
+    def test_interval_tidak_valid(self):
+        response = self.client.post('/secant/', {
+            'f_expr': 'x', 'tol': '1e-10', 'max_iter': '50', 'lo': '2', 'hi': '1', 'mode': 'all',
+        })
+        self.assertIsNotNone(response.context['error_message'])
+
+    def test_dibatasi_solver_timeout(self):
+        data = {'f_expr': 'sin(1/x)', 'tol': '1e-15', 'max_iter': '100000', 'lo': '0.01', 'hi': '2',
+                'mode': 'all', 'n_starts': '10000'}
+        with override_settings(SOLVER_TIMEOUT=0.005):
+            response = self.client.post('/newton-raphson/', data)
+        self.assertIn('batas waktu', response.context['error_message'])
+
+    @override_settings(SOLVER_OFFLOAD=False)
+    def test_max_iter_dibatasi(self):
+        with mock.patch('core.multistart.find_all_roots', wraps=find_all_roots) as solver:
+            self.client.post('/secant/', {
+                'f_expr': 'x**2 - 1', 'tol': '1e-10', 'max_iter': '1000000', 'lo': '-2', 'hi': '2', 'mode': 'all',
+            })
+        self.assertEqual(solver.call_args.args[5], MAX_ITER)
+
+
+class OffloadTest(TestCase):
+    def test_dijalankan_di_proses_lain(self):
+        self.assertNotEqual(call_in_pool(os.getpid), os.getpid())
+
+    def test_hasil_sama_dengan_pemanggilan_langsung(self):
+        args = ('x**2 - 2', 1.0, 1e-10, 50)
+        self.assertEqual(call_in_pool(newton_rapshon, *args)[0], newton_rapshon(*args)[0])
+
+    def test_timeout(self):
+        with override_settings(SOLVER_TIMEOUT=0.5), self.assertRaises(SolverTimeout):
+            call_in_pool(time.sleep, 10)
+        # Pool dibuat ulang sehingga pemanggilan berikutnya tetap berhasil
+        self.assertNotEqual(call_in_pool(os.getpid), os.getpid())
+
+    @override_settings(SOLVER_OFFLOAD=False)
+    def test_offload_dimatikan(self):
+        self.assertEqual(call_in_pool(os.getpid), os.getpid())
+
+
+class AsyncViewTest(TestCase):
+    async def test_request_bersamaan(self):
+        responses = await asyncio.gather(
+            self.async_client.post('/newton-raphson/', {'f_expr': 'x**2 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50'}),
+            self.async_client.post('/secant/', {
+                'f_expr': 'x**2 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-8', 'max_iter': '50',
+            }),
+            self.async_client.post('/gaus/', {'matrix': '[[2, 1], [1, 3]]', 'results': '[3, 5]'}),
+            self.async_client.post('/api/v1/newton-raphson/', json.dumps({
+                'f_expr': 'x**2 - 2', 'x0': 1, 'tol': 1e-8, 'max_iter': 50,
+            }), content_type='application/json'),
+        )
+        self.assertEqual([response.status_code for response in responses], [200] * 4)
+        self.assertAlmostEqual(responses[-1].json()['root'], 2 ** 0.5)
+
+    async def test_validasi_dari_pool(self):
+        # ValidationError dari solver di pool proses tetap membawa nama field-nya
+        response = await self.async_client.post('/api/v1/secant/', json.dumps({
+            'f_expr': 'x +* 2', 'x0': 1, 'x1': 2, 'tol': 1e-8, 'max_iter': 50,
+        }), content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'f_expr')
+
+
+class ResultCacheTest(TestCase):
+    data = {'f_expr': 'x**2 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50'}
+
+    def setUp(self):
+        result_cache().clear()
+
+    def test_kunci_kanonik(self):
+        key = result_key('newton-raphson', f_expr='x**2 - 2', x0=1, tol=1e-6)
+        self.assertEqual(key, result_key('newton-raphson', tol=1e-6, x0=1.0, f_expr=' x**2  -\t2 '))
+        self.assertNotEqual(key, result_key('secant', f_expr='x**2-2', x0=1, tol=1e-6))
+        self.assertNotEqual(key, result_key('newton-raphson', f_expr='x**2-2', x0=1.5, tol=1e-6))
+
+    def test_spasi_tidak_dibuang_seluruhnya(self):
+        # Spasi memisahkan token: "x - 1 0" bukan ekspresi yang sama dengan "x - 10"
+        self.assertNotEqual(result_key('regula-falsi', f_expr='x - 1 0'), result_key('regula-falsi', f_expr='x - 10'))
+
+    def test_hit_melewati_solver_dan_grafik(self):
+        first = self.client.post('/newton-raphson/', self.data)
+        with mock.patch('newton_raphson.views.run_in_pool') as solver, \
+                mock.patch('newton_raphson.views.build_figure_json') as chart:
+            second = self.client.post('/newton-raphson/', {**self.data, 'f_expr': ' x**2  - 2', 'x': '1.0'})
+        solver.assert_not_called()
+        chart.assert_not_called()
+        self.assertEqual(second.context['result'], first.context['result'])
+        self.assertContains(second, 'Plotly.newPlot')
+
+    def test_mode_json_dari_cache(self):
+        self.client.post('/secant/', {'f_expr': 'x**2 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-8', 'max_iter': '50'})
+        with mock.patch('secant.views.run_in_pool') as solver:
+            response = self.client.post('/secant/?chart=json', {
+                'f_expr': 'x**2 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-8', 'max_iter': '50',
+            })
+        solver.assert_not_called()
+        self.assertEqual(json.loads(response.content)['data'][0]['type'], 'scatter')
+
+    def test_gaus_lu(self):
+        data = {'matrix': '\n'.join(' '.join(str(float(i == j) * 10 + 1) for j in range(8)) for i in range(8)),
+                'results': ' '.join(['1'] * 8), 'engine': 'lu'}
+        self.assertFalse(self.client.post('/gaus/', data).context['from_cache'])
+        self.assertTrue(self.client.post('/gaus/', data).context['from_cache'])
+
+    def test_backend_file_dan_database(self):
+        backends = [
+            {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': tempfile.mkdtemp()},
+            {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'solver_result_cache'},
+        ]
+        for backend in backends:
+            with self.subTest(backend=backend['BACKEND']), override_settings(CACHES={
+                'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}, 'results': backend,
+            }):
+                call_command('createcachetable', verbosity=0)
+                self.client.post('/newton-raphson/', self.data)
+                with mock.patch('newton_raphson.views.run_in_pool') as solver:
+                    response = self.client.post('/newton-raphson/', self.data)
+                solver.assert_not_called()
+                self.assertAlmostEqual(response.context['result'][-1]['x'], 2 ** 0.5)
+
+
+class SolveHistoryTest(TestCase):
+    data = {'f_expr': 'x**3 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50'}
+
+    def setUp(self):
+        result_cache().clear()
+        solve_history.clear()
+
+    def test_catatan_solve(self):
+        response = self.client.post('/newton-raphson/', self.data)
+        self.assertEqual(solve_history.flush(), 1)
+        record = SolveRecord.objects.get()
+        self.assertEqual(record.method, 'newton-raphson')
+        self.assertEqual(record.params['f_expr'], 'x**3 - 2')
+        self.assertEqual(record.iterations, len(response.context['result']))
+        self.assertAlmostEqual(record.root, 2 ** (1 / 3))
+        trace = record.trace_array()
+        self.assertEqual(trace.dtype.names, ('iteration', 'x', 'f_x', 'f_prime_x'))
+        self.assertEqual(trace['x'][-1], record.root)
+
+    def test_cache_tingkat_kedua(self):
+        first = self.client.post('/newton-raphson/', self.data)
+        solve_history.flush()
+        # Seperti setelah restart: cache hasil di memori kosong, riwayat di database masih ada
+        result_cache().clear()
+        with mock.patch('newton_raphson.views.run_in_pool') as solver:
+            second = self.client.post('/newton-raphson/', self.data)
+        solver.assert_not_called()
+        self.assertEqual(second.context['result'], first.context['result'])
+        self.assertContains(second, 'Plotly.newPlot')
+
+    def test_bulk_insert_setelah_response(self):
+        with override_settings(SOLVE_HISTORY_BATCH_SIZE=3):
+            for x in ('1', '2'):
+                self.client.post('/newton-raphson/', {**self.data, 'x': x})
+            self.assertFalse(SolveRecord.objects.exists())
+            self.client.post('/secant/', {'f_expr': 'x**3 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-8', 'max_iter': '50'})
+        self.assertEqual(len(solve_history), 0)
+        self.assertEqual(SolveRecord.objects.filter(method='newton-raphson').count(), 2)
+        self.assertEqual(SolveRecord.objects.get(method='secant').trace_array().dtype.names[1:], ('x0', 'x1', 'f_x0', 'f_x1'))
+
+    def test_flush_di_thread_penulis(self):
+        self.client.post('/newton-raphson/', self.data)
+        threads = []
+        # Database test in-memory selalu ditulis langsung; di sini seolah-olah memakai file SQLite
+        with mock.patch('django.db.backends.sqlite3.base.DatabaseWrapper.is_in_memory_db', return_value=False), \
+                mock.patch.object(solve_history, 'flush', side_effect=lambda: threads.append(threading.get_ident())):
+            solve_history.schedule_flush().result(timeout=5)
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    def test_iterasi_kompleks_tidak_membuang_batch(self):
+        result, _, _ = newton_rapshon('x**0.5 - 2', -1.0, 1e-8, 50)
+        solve_history.add(solve_input('newton-raphson', f_expr='x**0.5 - 2', x0=-1.0), {'result': result}, 0.1)
+        self.client.post('/newton-raphson/', self.data)
+        self.assertEqual(solve_history.flush(), 2)
+        record = SolveRecord.objects.get(params__f_expr='x**0.5 - 2')
+        self.assertIsNone(record.root)
+        # x menjadi bilangan kompleks setelah iterasi pertama, jadi kolomnya tidak disimpan
+        self.assertEqual(record.trace_array().dtype.names, ('iteration',))
+
+    def test_catatan_gagal_dilewati(self):
+        self.client.post('/newton-raphson/', self.data)
+        # Entri yang tidak bisa di-pickle hanya membuang catatannya sendiri
+        solve_history.add(solve_input('newton-raphson', f_expr='x', x0=0.0), {'chart': lambda: None}, 0.1)
+        with self.assertLogs('core.history', 'ERROR'):
+            self.assertEqual(solve_history.flush(), 1)
+        self.assertEqual(SolveRecord.objects.get().params['f_expr'], 'x**3 - 2')
+
+    def test_flush_gagal_di_thread_dicatat(self):
+        with mock.patch('django.db.backends.sqlite3.base.DatabaseWrapper.is_in_memory_db', return_value=False), \
+                mock.patch.object(solve_history, 'flush', side_effect=RuntimeError('gagal')), \
+                self.assertLogs('core.history', 'ERROR') as logs:
+            future = solve_history.schedule_flush()
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+            # Callback selesai dijalankan oleh thread penulis setelah result tersedia
+            solve_history._flusher.submit(lambda: None).result(timeout=5)
+        self.assertIn('Flush riwayat solve gagal', logs.output[0])
+
+    def test_cache_tingkat_kedua_mengikuti_timeout(self):
+        self.client.post('/newton-raphson/', self.data)
+        solve_history.flush()
+        result_cache().clear()
+        SolveRecord.objects.update(created_at=timezone.now() - timedelta(seconds=settings.RESULT_CACHE_TIMEOUT + 1))
+        with mock.patch('newton_raphson.views.hitung', wraps=newton_views.hitung) as hitung:
+            self.client.post('/newton-raphson/', self.data)
+        hitung.assert_called_once()
+
+    def test_iteratif_gaus(self):
+        self.client.post('/gaus/', {
+            'matrix': '4 1 0\n1 4 1\n0 1 4', 'results': '1 2 3', 'engine': 'jacobi', 'tol': '1e-10', 'max_iter': '200',
+        })
+        solve_history.flush()
+        record = SolveRecord.objects.get(method='gauss-jacobi')
+        # Residual dicatat untuk tebakan awal dan setelah setiap iterasi
+        self.assertEqual(len(record.trace_array()), record.iterations + 1)
+
+    def test_dimatikan(self):
+        with override_settings(SOLVE_HISTORY=False):
+            self.client.post('/newton-raphson/', self.data)
+        self.assertEqual(len(solve_history), 0)
+
+
+class InstrumentationTest(TestCase):
+    data = {'f_expr': 'x**3 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50'}
+
+    def setUp(self):
+        result_cache().clear()
+
+    def test_header_server_timing(self):
+        response = self.client.post('/newton-raphson/', self.data)
+        phases = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        # compile diukur di worker pool lalu digabung ke request ini
+        for name in ('parse', 'cache', 'solve', 'compile', 'chart', 'render', 'total'):
+            self.assertIn(name, phases)
+
+    def test_metrics_prometheus(self):
+        self.client.post('/api/v1/secant/', json.dumps({
+            'f_expr': 'x**2 - 2', 'x0': 1, 'x1': 2, 'tol': 1e-8, 'max_iter': 50,
+        }), content_type='application/json')
+        response = self.client.get('/metrics')
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        text = response.content.decode()
+        self.assertIn('# TYPE solver_phase_duration_seconds histogram', text)
+        self.assertIn('solver_phase_duration_seconds_count{method="api:api-secant",phase="solve"}', text)
+        self.assertIn('solver_request_duration_seconds_bucket{method="api:api-secant",status="200",le="+Inf"}', text)
+
+    def test_metrics_dibatasi(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.7').status_code, 403)
+        with override_settings(METRICS_ALLOWED_IPS=['203.0.113.7']):
+            self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.7').status_code, 200)
+        self.client.force_login(User.objects.create_user('admin', is_staff=True))
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.7').status_code, 200)
+
+    def test_log_json(self):
+        with self.assertLogs('core.instrumentation', 'INFO') as logs:
+            self.client.post('/newton-raphson/', self.data)
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record['method'], 'newton_raphson:index')
+        self.assertIn('solve', record['phases_ms'])
+
+    def test_histogram_kumulatif(self):
+        histogram = Histogram('contoh_seconds', 'Contoh.', ('method',))
+        for seconds in (0.0005, 0.003, 100.0):
+            histogram.observe(('a',), seconds)
+        lines = histogram.exposition()
+        self.assertIn(f'contoh_seconds_bucket{{method="a",le="{BUCKETS[0]}"}} 1', lines)
+        self.assertIn('contoh_seconds_bucket{method="a",le="0.005"} 2', lines)
+        self.assertIn('contoh_seconds_bucket{method="a",le="+Inf"} 3', lines)
+        self.assertIn('contoh_seconds_count{method="a"} 3', lines)
+
+
+class BenchmarkCommandTest(TestCase):
+    def test_hasil_json_dan_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'hasil.json')
+            baseline = os.path.join(directory, 'baseline.json')
+            call_command('benchmark', '--quick', '--only', 'roots', '--repeat', '1',
+                         '--baseline', baseline, '--save-baseline', stdout=io.StringIO())
+            call_command('benchmark', '--quick', '--only', 'roots', '--repeat', '1',
+                         '--baseline', baseline, '--output', output, '--tolerance', '100', stdout=io.StringIO())
+            with open(output) as f:
+                data = json.load(f)
+        self.assertTrue(data['meta']['quick'])
+        self.assertIn('roots/newton-raphson/cos(x) - x', data['results'])
+        self.assertEqual(set(data['results']['roots/compile/korpus']), {'min', 'median', 'mean', 'repeat'})
+
+    def test_regresi(self):
+        baseline = {'a': {'min': 0.010}, 'b': {'min': 0.010}, 'c': {'min': 0.0001}}
+        timings = {'a': {'min': 0.011}, 'b': {'min': 0.030}, 'c': {'min': 0.001}, 'baru': {'min': 1.0}}
+        # c naik 10x tetapi di bawah noise floor; benchmark baru tidak punya pembanding
+        self.assertEqual([name for name, *_ in compare(timings, baseline)], ['b'])
+
+    def test_kelompok_tidak_dikenal(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark', '--only', 'roots,lambat')
+
+    def test_request_pertama_tanpa_library_berat(self):
+        # Proses baru yang hanya melayani API Regula Falsi tidak perlu memuat SymPy, Plotly, maupun SciPy
+        result = first_request('post', '/api/v1/regula-falsi/', {
+            'f_expr': 'x**2 - 2', 'a': 0, 'b': 2, 'tol': 1e-8, 'max_iter': 50,
+        }, 'application/json')
+        self.assertGreater(result['first_request'], 0)
+        self.assertEqual(result['loaded'], [])
+
+
+class WarmupTest(TestCase):
+    def setUp(self):
+        # gc.freeze() di warmup memindahkan semua objek proses test ke generasi permanen
+        self.addCleanup(gc.unfreeze)
+
+    def test_tidak_aktif_tanpa_setting(self):
+        self.assertIsNone(warm_app('newton_raphson', compilers=[self.fail]))
+
+    @override_settings(SOLVER_WARMUP=True, SOLVER_WARMUP_EXPRESSIONS=['x**5 -  3*x', 'x +* 1'])
+    def test_ready_mengompilasi_ekspresi(self):
+        expression_cache.clear()
+        with self.assertLogs('core.warmup', 'WARNING'):
+            apps.get_app_config('newton_raphson').ready()
+        # Ekspresi yang tidak valid hanya dicatat di log; yang valid sudah ada di cache dengan kunci ternormalisasi
+        self.assertIsNotNone(expression_cache.lookup('x**5 - 3*x'))
+
+    def test_request_pertama_setelah_warmup(self):
+        result = first_request('post', '/newton-raphson/', {
+            'f_expr': 'x**2 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50',
+        }, warm=True)
+        self.assertLessEqual({'sympy', 'plotly.graph_objs', 'scipy.linalg'}, set(result['loaded']))
+
+
+class ProfilingTest(TestCase):
+    data = {'f_expr': 'x**3 - 2', 'x': '1', 'tol': '1e-8', 'max_iter': '50'}
+
+    def setUp(self):
+        result_cache().clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(PROFILING_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.staff = User.objects.create_superuser('admin', 'admin@example.com', 'rahasia')
+
+    def test_profil_staff(self):
+        self.client.force_login(self.staff)
+        response = self.client.post('/newton-raphson/?profile=1', self.data)
+        record = ProfileRecord.objects.get(pk=response['X-Profile-Id'])
+        self.assertEqual(record.method, 'newton_raphson:index')
+        self.assertFalse(record.sampled)
+        self.assertTrue(record.profile_path.exists())
+        # Statistik dari worker pool solver ikut tergabung
+        self.assertIn('newton_rapshon', record.top_functions(limit=None))
+
+    def test_flag_diabaikan_untuk_non_staff(self):
+        response = self.client.post('/newton-raphson/', self.data, HTTP_X_PROFILE='1')
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertFalse(ProfileRecord.objects.exists())
+
+    def test_sampling(self):
+        with override_settings(PROFILING_SAMPLE_RATE=1.0):
+            self.client.post('/api/v1/secant/', json.dumps({
+                'f_expr': 'x**2 - 2', 'x0': 1, 'x1': 2, 'tol': 1e-8, 'max_iter': 50,
+            }), content_type='application/json')
+        record = ProfileRecord.objects.get()
+        self.assertTrue(record.sampled)
+        self.assertEqual(record.method, 'api:api-secant')
+
+    def test_hanya_yang_paling_lambat_disimpan(self):
+        self.client.force_login(self.staff)
+        with override_settings(PROFILING_MAX_RECORDS=2):
+            for _ in range(3):
+                self.client.post('/secant/?profile=1', {
+                    'f_expr': 'x**2 - 2', 'x0': '1', 'x1': '2', 'tol': '1e-8', 'max_iter': '50',
+                })
+        self.assertEqual(ProfileRecord.objects.count(), 2)
+        self.assertEqual(len(os.listdir(settings.PROFILING_DIR)), 2)
+
+    def test_admin(self):
+        self.client.force_login(self.staff)
+        record = ProfileRecord.objects.get(pk=self.client.post('/newton-raphson/?profile=1', self.data)['X-Profile-Id'])
+        response = self.client.get(reverse('admin:core_profilerecord_changelist'))
+        self.assertContains(response, record.input_hash[:12])
+        response = self.client.get(reverse('admin:core_profilerecord_change', args=[record.pk]))
+        self.assertContains(response, 'cumulative')
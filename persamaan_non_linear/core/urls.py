@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import metrics, plotly_js
+
+urlpatterns = [
+    path('assets/plotly-<str:digest>.min.js', plotly_js, name='plotly-js'),
+    path('metrics', metrics, name='metrics'),
+]
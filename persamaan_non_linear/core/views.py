@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseForbidden, HttpResponseNotModified
+from django.views.decorators.http import require_GET
+
+from .charts import PLOTLY_JS_PATH, plotly_js_digest
+from .instrumentation import PHASE_DURATION, REQUEST_DURATION
+
+# Satu tahun, file tidak pernah berubah selama hash-nya sama
+PLOTLY_JS_MAX_AGE = 60 * 60 * 24 * 365
+
+
+def plotly_js(req, digest):
+    """
+    Melayani plotly.min.js dari paket plotly dengan header cache jangka panjang.
+
+    Parameters:
+    req (HttpRequest): Objek permintaan dari pengguna.
+    digest (str): Hash isi file yang tertera di URL.
+
+    Returns:
+    FileResponse: Isi plotly.min.js.
+    """
+    if digest != plotly_js_digest():
+        raise Http404("Versi plotly.js tidak ditemukan.")
+
+    if req.headers.get('If-None-Match') == f'"{digest}"':
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(open(PLOTLY_JS_PATH, 'rb'), content_type='text/javascript')
+    response['ETag'] = f'"{digest}"'
+    response['Cache-Control'] = f'public, max-age={PLOTLY_JS_MAX_AGE}, immutable'
+    return response
+
+
+@require_GET
+def metrics(req):
+    """
+    GET /metrics
+
+    Histogram waktu request dan waktu setiap fase (parse, compile, solve, chart, render)
+    per metode, dalam format teks Prometheus.
+
+    Hanya untuk scraper dari alamat di settings.METRICS_ALLOWED_IPS (REMOTE_ADDR,
+    bukan header X-Forwarded-For yang bisa dipalsukan) atau pengguna staff.
+    """
+    allowed_ips = getattr(settings, 'METRICS_ALLOWED_IPS', ['127.0.0.1', '::1'])
+    if req.META.get('REMOTE_ADDR') not in allowed_ips and not req.user.is_staff:
+        return HttpResponseForbidden("Metrik hanya tersedia untuk alamat yang diizinkan atau pengguna staff.")
+    lines = REQUEST_DURATION.exposition() + PHASE_DURATION.exposition()
+    return HttpResponse('\n'.join(lines) + '\n', content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,109 @@
+"""
+Memanaskan proses web sebelum worker server di-fork.
+
+Dengan `gunicorn --preload`, aplikasi dimuat sekali di proses master lalu worker
+dibuat dengan fork. Semua yang sudah dimuat sebelum fork (modul SymPy, Plotly, dan
+SciPy, ekspresi yang sudah dikompilasi, template yang sudah di-parse) dipakai
+bersama oleh semua worker secara copy-on-write, sehingga request pertama di setiap
+worker tidak lagi dimulai dari proses dingin.
+
+Setiap app solver memanggil warm_app dari AppConfig.ready-nya. Setelah itu
+gc.freeze() memindahkan objek yang sudah ada ke generasi permanen, agar garbage
+collector di worker tidak menyentuh (dan menyalin) halaman memori bersama tersebut.
+
+Warmup hanya berjalan jika settings.SOLVER_WARMUP aktif. wsgi.py dan asgi.py
+mengaktifkannya lewat variabel lingkungan SOLVER_WARMUP, sehingga perintah
+manage.py dan test tetap memuat library berat secara lazy. Di worker pool solver
+(core.offload) yang mewarisi variabel tersebut hanya ekspresi yang dikompilasi;
+template dan grafik tidak dipakai di sana.
+
+Template hanya disimpan hasil parse-nya oleh loader cache Django (default saat
+DEBUG = False); dengan DEBUG = True warmup tetap memuat library template tag-nya.
+
+Pengaturan (settings):
+- SOLVER_WARMUP (bool): Menjalankan warmup saat aplikasi dimuat.
+- SOLVER_WARMUP_EXPRESSIONS (list): Ekspresi yang dikompilasi di awal.
+"""
+from functools import partial
+import gc
+import logging
+import time
+
+from django.conf import settings
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+# Template komponen grafik yang dipakai semua halaman solver
+CHART_TEMPLATE = 'core/chart.html'
+
+DEFAULT_EXPRESSIONS = ['x**2 - 2', 'x**3 - 2*x - 5', 'cos(x) - x', 'exp(-x) - x', 'sin(x) - x/2']
+
+
+def warmup_enabled():
+    return getattr(settings, 'SOLVER_WARMUP', False)
+
+
+def warmup_expressions():
+    return getattr(settings, 'SOLVER_WARMUP_EXPRESSIONS', DEFAULT_EXPRESSIONS)
+
+
+def warm_app(label, compilers=(), templates=(), chart=None, actions=()):
+    """
+    Memanaskan satu app solver: mengompilasi ekspresi umum, memuat template, dan membuat grafik contoh.
+
+    Error di salah satu langkah hanya dicatat di log; warmup tidak boleh menggagalkan start server.
+
+    Parameters:
+    label (str): Nama app, untuk log.
+    compilers (iterable): Fungsi kompilasi yang dipanggil untuk setiap ekspresi di SOLVER_WARMUP_EXPRESSIONS.
+    templates (iterable): Nama template yang dimuat di awal.
+    chart (callable): Fungsi tanpa argumen yang membuat figure contoh, untuk memuat Plotly.
+    actions (iterable): Fungsi tanpa argumen lain yang dijalankan sekali (misalnya memuat SciPy).
+
+    Returns:
+    dict: Jumlah ekspresi yang dikompilasi, langkah lain yang berhasil, dan durasi (detik), atau None jika warmup tidak aktif.
+    """
+    if not warmup_enabled():
+        return None
+    # Diimpor di sini karena core.offload mengimpor modul profiling dan instrumentation
+    from .offload import in_worker
+
+    start = time.perf_counter()
+    summary = {'expressions': 0, 'steps': 0}
+
+    for f_expr in (warmup_expressions() if compilers else ()):
+        try:
+            for compile_expression in compilers:
+                compile_expression(f_expr)
+        except Exception:
+            logger.warning("Warmup %s: ekspresi %r gagal dikompilasi.", label, f_expr, exc_info=True)
+        else:
+            summary['expressions'] += 1
+
+    steps = list(actions)
+    if not in_worker():
+        steps += [partial(get_template, name) for name in (*templates, CHART_TEMPLATE)]
+        if chart is not None:
+            steps.append(partial(_warm_chart, chart))
+    for step in steps:
+        try:
+            step()
+        except Exception:
+            logger.warning("Warmup %s: langkah %r gagal.", label, step, exc_info=True)
+        else:
+            summary['steps'] += 1
+
+    # Objek hasil warmup tidak pernah dibebaskan; dibekukan agar GC di worker hasil fork tidak menyalinnya
+    gc.freeze()
+    summary['duration'] = time.perf_counter() - start
+    logger.info("Warmup %s: %s", label, summary)
+    return summary
+
+
+def _warm_chart(chart):
+    # Membuat figure pertama memuat validator Plotly; hash plotly.js dibaca dari disk sekali saja
+    from .charts import figure_to_json, plotly_js_digest
+
+    figure_to_json(chart())
+    plotly_js_digest()
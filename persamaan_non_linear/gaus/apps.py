@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class GausConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'gaus'
+
+    def ready(self):
+        from core.warmup import warm_app, warmup_enabled
+        if not warmup_enabled():
+            return
+        # Tidak ada ekspresi di sini; yang dipanaskan template, grafik residual, dan SciPy (LU)
+        import numpy as np
+        from solvers.lu import solve_lu
+        from .views import grafik_residual
+        warm_app(
+            self.name,
+            templates=['gaus/pages/index.html', 'gaus/pages/stream.html'],
+            chart=lambda: grafik_residual([1.0, 1e-4, 1e-8], 'jacobi'),
+            actions=[lambda: solve_lu(np.eye(2), np.ones(2), use_cache=False)],
+        )
@@ -1,3 +1,264 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient, TestCase, override_settings
+
+from solvers.gauss import eliminasi_gauss
+from solvers.lu import factorization_cache, solve_lu
+from solvers.sparse import density
+from .views import STEPS_PER_PAGE, elimination_cache, pilih_engine, pilih_engine_matriks
+
+
+class LuEngineTest(TestCase):
+    def setUp(self):
+        factorization_cache.clear()
+
+    def test_faktorisasi_dipakai_ulang(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.random((50, 50)) + 50 * np.eye(50)
+        x1, cached1 = solve_lu(matrix, rng.random(50))
+        x2, cached2 = solve_lu(matrix.copy(), np.ones(50))
+        self.assertFalse(cached1)
+        self.assertTrue(cached2)
+        np.testing.assert_allclose(matrix @ x2, np.ones(50))
+
+    def test_sama_dengan_eliminasi_langkah(self):
+        matrix = [[1, 1, 1], [1, 2, -1], [2, 1, 2]]
+        _, _, expected, _ = eliminasi_gauss(matrix, [6, 2, 10])
+        np.testing.assert_allclose(solve_lu(matrix, [6, 2, 10])[0], expected)
+
+    def test_matriks_singular(self):
+        with self.assertRaises(np.linalg.LinAlgError):
+            solve_lu([[1, 2], [2, 4]], [1, 2])
+
+    def test_pilih_engine(self):
+        self.assertEqual(pilih_engine('auto', 3), 'langkah')
+        self.assertEqual(pilih_engine('auto', 50), 'lu')
+        self.assertEqual(pilih_engine('langkah', 50), 'langkah')
+        self.assertEqual(pilih_engine('auto', 50, 0.01), 'sparse')
+        self.assertEqual(pilih_engine('auto', 50, 0.5), 'lu')
+        dominant = np.ones((10, 10)) + 20 * np.eye(10)
+        self.assertEqual(pilih_engine('auto', 10, 1.0, dominant), 'cg')
+        self.assertEqual(pilih_engine('auto', 10, 1.0, np.ones((10, 10))), 'lu')
+
+    def test_engine_eksplisit_tanpa_pemindaian_matriks(self):
+        matrix, results = np.eye(50) * 4, np.ones(50)
+        with mock.patch('gaus.views.density', wraps=density) as scan:
+            self.assertEqual(pilih_engine_matriks('lu', matrix, results), 'lu')
+            self.assertEqual(pilih_engine_matriks('auto', matrix[:3, :3], results[:3]), 'langkah')
+            scan.assert_not_called()
+            self.assertEqual(pilih_engine_matriks('auto', matrix, results), 'sparse')
+            scan.assert_called_once()
+
+
+class GausViewTest(TestCase):
+    def test_mode_lu(self):
+        response = self.client.post('/gaus/', {
+            'matrix': '[[1, 1, 1], [1, 2, -1], [2, 1, 2]]', 'results': '[6, 2, 10]', 'engine': 'lu',
+        })
+        self.assertEqual([name for name, _ in response.context['solution']], ['x1', 'x2', 'x3'])
+        self.assertFalse(response.context['steps'])
+
+    def test_mode_sparse(self):
+        response = self.client.post('/gaus/', {
+            'matrix': str((np.eye(30) * 2).astype(int).tolist()), 'results': str([4] * 30),
+        })
+        self.assertEqual(response.context['engine_used'], 'sparse')
+        self.assertEqual([value for _, value in response.context['solution']], [2.0] * 30)
+
+    def test_mode_iteratif_dengan_grafik_residual(self):
+        data = {
+            'matrix': '[[4, 1, 0], [1, 4, 1], [0, 1, 4]]', 'results': '[5, 6, 5]',
+            'engine': 'sor', 'tol': '1e-12', 'max_iter': '200', 'omega': '1.1',
+        }
+        response = self.client.post('/gaus/', data)
+        self.assertTrue(response.context['iterative_solution'].converged)
+        np.testing.assert_allclose([value for _, value in response.context['solution']], [1, 1, 1])
+        self.assertIsNotNone(response.context['chart'])
+
+        figure = self.client.post('/gaus/?chart=json', data).json()
+        self.assertEqual(figure['layout']['yaxis']['type'], 'log')
+
+    def test_mode_langkah_default(self):
+        response = self.client.post('/gaus/', {'matrix': '[[2, 1], [1, 3]]', 'results': '[3, 5]'})
+        self.assertEqual(response.context['engine_used'], 'langkah')
+        self.assertTrue(response.context['steps'])
+
+    def test_upload_file_csv(self):
+        response = self.client.post('/gaus/', {
+            'matrix_file': SimpleUploadedFile('a.csv', b'1,1,1\n1,2,-1\n2,1,2\n'),
+            'results': '6 2 10',
+        })
+        np.testing.assert_allclose(response.context['result'], [1, 2, 3])
+
+    def test_input_tidak_valid(self):
+        response = self.client.post('/gaus/', {'matrix': '[[1, 2], [3]]', 'results': '[1, 2]'})
+        self.assertEqual(response.context['error_message'], "Matriks harus persegi.")
+
+    def test_tidak_ada_solusi_unik(self):
+        response = self.client.post('/gaus/', {'matrix': '[[0, 0], [0, 0]]', 'results': '[1, 2]'})
+        self.assertEqual(response.context['error_message'], "Tidak ada solusi unik.")
+
+
+class EliminationLogTest(TestCase):
+    matrix = [[0, 2, 1], [1, 1, 1], [2, 1, 3]]
+    results = [5, 6, 13]
+
+    def test_langkah_dibangun_ulang_dari_operasi(self):
+        steps, descriptions, x, _ = eliminasi_gauss(self.matrix, self.results)
+        all_steps = list(steps)
+        self.assertEqual(len(all_steps), len(steps))
+        # Langkah pertama adalah tukar baris karena pivot nol
+        self.assertIn('Menukar baris 1', descriptions[0])
+        np.testing.assert_array_equal(all_steps[0][0], [1, 1, 1, 6])
+        np.testing.assert_array_equal(steps[4], all_steps[4])
+        np.testing.assert_array_equal(steps[-1], all_steps[-1])
+        np.testing.assert_allclose(np.triu(steps[-1][:, :3]), steps[-1][:, :3])
+        np.testing.assert_allclose(np.array(self.matrix) @ x, self.results)
+
+    def test_pasangan_langkah_dan_deskripsi_sejajar(self):
+        steps, _, _, _ = eliminasi_gauss(self.matrix, self.results)
+        pairs = list(steps.pairs(2, 4))
+        self.assertEqual(len(steps.pairs(2, 4)), 2)
+        self.assertEqual([description for _, description in pairs], steps.descriptions[2:4])
+
+    def test_memori_tidak_menyimpan_salinan(self):
+        steps, _, _, _ = eliminasi_gauss(np.eye(40) * 2 + 1, np.ones(40))
+        self.assertEqual(steps.initial.shape, (40, 41))
+        self.assertFalse(any(isinstance(value, np.ndarray) for operation in steps.operations for value in operation))
+
+
+class PaginasiLangkahTest(TestCase):
+    # Matriks 8x8 menghasilkan 8 + 28 = 36 langkah, lebih dari satu halaman
+    data = {
+        'matrix': str((np.eye(8) * 4 + 1).astype(int).tolist()),
+        'results': str(list(range(1, 9))),
+        'engine': 'langkah',
+    }
+
+    def setUp(self):
+        elimination_cache.clear()
+
+    def test_halaman_pertama_dan_kedua(self):
+        response = self.client.post('/gaus/', self.data)
+        page = response.context['page_obj']
+        self.assertEqual(page.paginator.count, 36)
+        self.assertEqual(len(response.context['combined_steps']), STEPS_PER_PAGE)
+        self.assertContains(response, 'Step 20')
+        self.assertNotContains(response, 'Step 21<')
+
+        response = self.client.post('/gaus/', {**self.data, 'page': '2'})
+        self.assertEqual(response.context['step_offset'], STEPS_PER_PAGE)
+        self.assertContains(response, 'Step 36')
+        self.assertNotContains(response, 'Step 20<')
+
+    def test_halaman_berikutnya_dari_file_upload(self):
+        # Input dari file tidak ikut dikirim ulang; form paginasi memakai kunci cache eliminasi
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('a.npy', matrix=np.eye(6) * 4 + 1),
+            'results_file': npy_file('b.npy', results=np.arange(1.0, 7.0)),
+        })
+        self.assertEqual(response.context['page_obj'].paginator.count, 21)
+        key = response.context['elimination_key']
+        self.assertContains(response, f'name="elimination_key" value="{key}"')
+
+        response = self.client.post('/gaus/', {
+            'matrix': '', 'results': '', 'engine': 'auto', 'elimination_key': key, 'page': '2',
+        })
+        self.assertIsNone(response.context['error_message'])
+        self.assertContains(response, 'Step 21')
+
+        elimination_cache.clear()
+        response = self.client.post('/gaus/', {'matrix': '', 'results': '', 'elimination_key': key, 'page': '2'})
+        self.assertIn('kirim ulang input', response.context['error_message'])
+
+    def test_heatmap_hanya_halaman_ini(self):
+        response = self.client.post('/gaus/?chart=json', {**self.data, 'page': '2'})
+        names = [trace['name'] for trace in response.json()['data']]
+        self.assertEqual(names, [f'Step {k}' for k in range(21, 37)])
+
+    def test_endpoint_langkah_ke_k(self):
+        steps, descriptions, _, _ = eliminasi_gauss(np.eye(8) * 4 + 1, range(1, 9))
+        response = self.client.post('/gaus/langkah/25/', self.data)
+        payload = response.json()
+        self.assertEqual(payload['total'], 36)
+        self.assertEqual(payload['description'], descriptions[24])
+        np.testing.assert_array_equal(payload['matrix'], steps[24])
+
+        self.assertEqual(self.client.post('/gaus/langkah/37/', self.data).status_code, 404)
+        self.assertEqual(self.client.get('/gaus/langkah/1/').status_code, 405)
+
+    async def test_streaming(self):
+        # Konten berupa async iterator: bagian atas halaman sampai sebelum langkah selesai dikerjakan
+        response = await AsyncClient().post('/gaus/?stream=1', self.data)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response.is_async)
+        chunks = [chunk.decode() async for chunk in response.streaming_content]
+        self.assertNotIn('Step 1<', chunks[0])
+        self.assertIn('Step 1<', chunks[1])
+        self.assertIn('Langkah Substitusi Balik', chunks[-2])
+        content = ''.join(chunks)
+        self.assertEqual(content.count('Step '), 36)
+        self.assertLess(content.index('Step 1<'), content.index('Step 36<'))
+
+    async def test_streaming_matriks_singular(self):
+        response = await AsyncClient().post('/gaus/?stream=1', {'matrix': '[[0, 0], [0, 0]]', 'results': '[1, 2]'})
+        content = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        self.assertIn('Tidak ada solusi unik.', content)
+
+
+def npy_file(name, **arrays):
+    # File .npy (satu array) atau .npz (beberapa array) untuk diunggah
+    buffer = io.BytesIO()
+    if name.endswith('.npz'):
+        np.savez(buffer, **arrays)
+    else:
+        np.save(buffer, *arrays.values())
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+class BinaryUploadTest(TestCase):
+    matrix = np.array([[1.0, 1, 1], [1, 2, -1], [2, 1, 2]])
+    results = np.array([6.0, 2, 10])
+
+    def test_upload_npy_dan_unduh_solusi(self):
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('a.npy', matrix=self.matrix),
+            'results_file': npy_file('b.npy', results=self.results),
+        })
+        np.testing.assert_allclose(response.context['result'], [1, 2, 3])
+
+        download = self.client.get(f"/gaus/solusi/{response.context['solution_key']}.npy")
+        self.assertEqual(download['Content-Disposition'], 'attachment; filename="solusi.npy"')
+        np.testing.assert_allclose(np.load(io.BytesIO(download.content)), [1, 2, 3])
+        self.assertEqual(self.client.get('/gaus/solusi/tidak-ada.npy').status_code, 404)
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_upload_besar_dibaca_sebagai_memory_map(self):
+        # Dengan batas memori 0, Django menyimpan upload di file sementara
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('a.npy', matrix=self.matrix),
+            'results': '6 2 10',
+            'engine': 'lu',
+        })
+        np.testing.assert_allclose(response.context['result'], [1, 2, 3])
+
+    def test_upload_npz(self):
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('sistem.npz', A=self.matrix.astype(int), b=self.results),
+            'results_file': npy_file('sistem.npz', A=self.matrix, b=self.results),
+        })
+        np.testing.assert_allclose(response.context['result'], [1, 2, 3])
+
+    def test_upload_tidak_valid(self):
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('a.npy', matrix=np.ones((2, 3))), 'results': '1 2',
+        })
+        self.assertEqual(response.context['error_message'], "Matriks harus persegi.")
+        response = self.client.post('/gaus/', {
+            'matrix_file': npy_file('a.npy', matrix=np.array([[1, None], [2, 3]], dtype=object)),
+            'results': '1 2',
+        })
+        self.assertEqual(response.context['error_message'], "Array harus berisi angka real.")
@@ -1,6 +1,8 @@
 from django.urls import path;
-from .views import index;
+from .views import index, langkah, unduh_solusi;
 
 urlpatterns = [
-    path('', index, name='gaus-index')
+    path('', index, name='gaus-index'),
+    path('langkah/<int:k>/', langkah, name='gaus-langkah'),
+    path('solusi/<str:key>.npy', unduh_solusi, name='gaus-solusi'),
 ];
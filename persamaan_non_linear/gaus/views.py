@@ -1,129 +1,452 @@
+from django.core.paginator import Paginator
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
-import plotly.graph_objs as go
-import plotly.io as pio
+from django.template.loader import render_to_string
+from django.views.decorators.http import require_POST
+from core.charts import build_figure_json, chart_json_response, downsample, render_chart, wants_chart_json
+from core.instrumentation import phase
+from core.offload import SolverTimeout, run_in_pool, run_in_thread
+from core.result_cache import cached_result, solve_input
 import numpy as np
-import ast  # Digunakan untuk parsing input yang aman
-
-# Fungsi Metode Eliminasi Gauss
-def eliminasi_gauss(matrix, results):
-    # Mengubah matriks input dan hasil menjadi matriks augmented
-    augmented_matrix = np.array(matrix, dtype=float)
-    results_vector = np.array(results, dtype=float).reshape(-1, 1)
-    augmented_matrix = np.hstack((augmented_matrix, results_vector))
-    n = len(results)
-
-    steps = []  # Untuk menyimpan langkah-langkah eliminasi
-    descriptions = []  # Untuk menyimpan deskripsi langkah
-
-    # Forward Elimination
-    for i in range(n):
-        # Pivoting jika elemen diagonal utama adalah nol
-        if augmented_matrix[i, i] == 0:
-            for k in range(i + 1, n):
-                if augmented_matrix[k, i] != 0:
-                    augmented_matrix[[i, k]] = augmented_matrix[[k, i]]
-                    descriptions.append(f"Menukar baris {i + 1} dengan baris {k + 1} karena elemen pivot bernilai nol.")
-                    break
-            else:
-                return None, "Tidak ada solusi unik."
-        
-        # Normalisasi baris pivot
-        pivot_value = augmented_matrix[i, i]
-        augmented_matrix[i] = augmented_matrix[i] / pivot_value
-        descriptions.append(f"Normalisasi baris {i + 1} dengan membagi semua elemen dengan {int(pivot_value) if pivot_value.is_integer() else pivot_value}.")
-        steps.append(augmented_matrix.copy())
-
-        # Eliminasi untuk membuat nol di bawah elemen pivot
-        for j in range(i + 1, n):
-            factor = augmented_matrix[j, i]
-            augmented_matrix[j] = augmented_matrix[j] - factor * augmented_matrix[i]
-            descriptions.append(f"Mengurangi baris {j + 1} dengan baris {i + 1} dikalikan {int(factor) if factor.is_integer() else factor} untuk membuat elemen di bawah pivot menjadi nol.")
-            steps.append(augmented_matrix.copy())
-
-    # Back Substitution
-    x = np.zeros(n)
-    back_sub_steps = []  # Untuk menyimpan langkah back substitution dengan detail persamaan
-    for i in range(n - 1, -1, -1):
-        sum_ax = np.sum(augmented_matrix[i, i + 1:n] * x[i + 1:n])
-        x[i] = augmented_matrix[i, -1] - sum_ax
-        equation = " + ".join([f"{augmented_matrix[i, j]}*x{j + 1}" for j in range(i + 1, n) if augmented_matrix[i, j] != 0])
-        if equation:
-            equation = f"{augmented_matrix[i, i]}*x{i + 1} + {equation} = {augmented_matrix[i, -1]}"
-        else:
-            equation = f"{augmented_matrix[i, i]}*x{i + 1} = {augmented_matrix[i, -1]}"
-        variable_name = chr(120 + i)  # Menggunakan ASCII untuk mendapatkan nama variabel (x, y, z, dst.)
-        back_sub_steps.append(f"{equation}\n   {variable_name} = {x[i]}")
-        descriptions.append(f"Melakukan substitusi balik untuk menghitung nilai {variable_name}.")
+import io
+from solvers.elimination_log import EliminationLog
+from solvers.gauss import eliminasi_gauss, langkah_eliminasi, matriks_augmented, substitusi_balik
+from solvers.iterative import DEFAULT_OMEGA, ITERATIVE_METHODS, auto_method, solve_iterative
+from solvers.lru import LRUCache
+from solvers.lu import matrix_key, solve_lu
+from solvers.parsing import (
+    BINARY_EXTENSIONS, MAX_INPUT_LENGTH, MatrixParseError, load_binary, parse_matrix, parse_vector,
+)
+from solvers.sparse import SPARSE_MAX_DENSITY, density, solve_sparse
+
+# Pada mode 'auto', matriks sampai ukuran ini dikerjakan langkah demi langkah (mode pembelajaran),
+# matriks yang lebih besar langsung diselesaikan dengan faktorisasi LU, dengan scipy.sparse jika kepadatannya
+# tidak lebih dari SPARSE_MAX_DENSITY, atau dengan metode iteratif jika matriksnya dominan diagonal
+TEACHING_MAX_SIZE = 6
+ENGINES = ('auto', 'langkah', 'lu', 'sparse') + ITERATIVE_METHODS
+
+# Engine yang hasilnya disimpan di cache hasil; eliminasi langkah demi langkah memakai elimination_cache
+CACHED_ENGINES = ('lu', 'sparse') + ITERATIVE_METHODS
+
+# Jumlah tabel langkah (dan trace heatmap) per halaman
+STEPS_PER_PAGE = 20
+
+# Penanda di template halaman streaming tempat tabel langkah disisipkan
+STREAM_MARKER = '<!-- langkah-eliminasi -->'
+
+# Log eliminasi terakhir disimpan agar endpoint langkah ke-k tidak perlu mengulang eliminasi
+elimination_cache = LRUCache(maxsize=32)
+
+# Vektor solusi terakhir yang bisa diunduh sebagai .npy
+solution_cache = LRUCache(maxsize=64)
+
+
+async def eliminasi_gauss_cached(matrix, results):
+    """
+    Sama seperti eliminasi_gauss, tetapi hasilnya disimpan di cache dengan kunci isi matriks augmented.
+
+    Dipakai oleh halaman berpaginasi dan endpoint langkah ke-k, yang mengirim ulang input yang sama.
+    Eliminasinya (loop Python) dijalankan di pool proses solver tanpa memblokir event loop;
+    cache tetap di proses web.
+
+    Returns:
+    tuple: Kunci cache (dikirim ulang oleh form paginasi) dan hasil eliminasi_gauss.
+    """
+    key = matrix_key(matriks_augmented(matrix, results))
+    output = elimination_cache.lookup(key)
+    if output is None:
+        with phase('solve'):
+            output = await run_in_pool(eliminasi_gauss, matrix, results)
+        elimination_cache.store(key, output)
+    return key, output
+
+
+def pilih_engine_matriks(engine, matrix, results):
+    # pilih_engine dengan kepadatan dan dominansi diagonal yang dihitung dari matriksnya (O(n²)).
+    # Pemindaian itu hanya dibutuhkan mode 'auto' untuk sistem di atas batas mode langkah
+    if engine != 'auto' or len(results) <= TEACHING_MAX_SIZE:
+        return pilih_engine(engine, len(results))
+    return pilih_engine(engine, len(results), density(matrix), matrix)
+
+
+def pilih_engine(engine, n, matrix_density=None, matrix=None):
+    """
+    Menentukan engine yang dipakai untuk sistem berukuran n.
+
+    Parameters:
+    engine (str): 'auto', 'langkah' (eliminasi langkah demi langkah), 'lu' (faktorisasi LU), 'sparse' (scipy.sparse),
+        atau salah satu metode iteratif ('jacobi', 'gauss-seidel', 'sor', 'cg').
+    n (int): Jumlah persamaan.
+    matrix_density (float): Proporsi elemen bukan nol, dipakai mode 'auto' untuk memilih jalur sparse.
+    matrix (array_like): Matriks koefisien, dipakai mode 'auto' untuk memeriksa dominansi diagonal.
+
+    Returns:
+    str: Nama engine selain 'auto'.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Engine '{engine}' tidak dikenal.")
+    if engine == 'auto':
+        if n <= TEACHING_MAX_SIZE:
+            return 'langkah'
+        if matrix_density is not None and matrix_density <= SPARSE_MAX_DENSITY:
+            return 'sparse'
+        if matrix is not None:
+            return auto_method(matrix) or 'lu'
+        return 'lu'
+    return engine
+
+
+def baca_parameter_iteratif(post):
+    """
+    Mengambil toleransi, iterasi maksimum, dan omega untuk metode iteratif dari form.
+
+    Returns:
+    tuple: (tol, max_iter, omega), memakai nilai bawaan untuk field yang kosong.
+    """
+    tol = float(post.get('tol') or 1e-10)
+    max_iter = int(post.get('max_iter') or 1000)
+    omega = float(post.get('omega') or DEFAULT_OMEGA)
+    if tol <= 0 or max_iter < 1:
+        raise ValueError("Toleransi dan iterasi maksimum harus positif.")
+    return tol, max_iter, omega
+
+
+def grafik_residual(residuals, method):
+    # Grafik konvergensi residual relatif per iterasi dengan sumbu y logaritmik
+    import plotly.graph_objs as go
+
+    # Dicuplik pada skala log seperti yang ditampilkan; residual nol (log tak berhingga) dibuang
+    residuals = np.asarray(residuals, dtype=float)
+    with np.errstate(divide='ignore'):
+        shown = downsample(np.arange(len(residuals)), np.log10(residuals))
+
+    trace = go.Scatter(
+        x=shown,
+        y=residuals[shown],
+        mode='lines+markers',
+        name='Residual',
+        line=dict(color='royalblue', width=2),
+        marker=dict(size=4)
+    )
+    layout = go.Layout(
+        title=f'Grafik Konvergensi Metode {method.upper()}',
+        xaxis=dict(title='Iterasi'),
+        yaxis=dict(title='||b - Ax|| / ||b||', type='log'),
+        template='plotly_white'
+    )
+    return go.Figure(data=[trace], layout=layout)
+
+
+def grafik_eliminasi(steps, start, stop):
+    # Heatmap dari setiap langkah eliminasi pada rentang [start, stop) saja
+    import plotly.graph_objs as go
+
+    traces = [
+        go.Heatmap(z=step, coloraxis="coloraxis", name=f'Step {step_idx + 1}')
+        for step_idx, step in zip(range(start, stop), steps.iter_steps(start, stop))
+    ]
+    layout = go.Layout(
+        title='Proses Eliminasi Gauss',
+        xaxis=dict(title='Kolom'),
+        yaxis=dict(title='Baris'),
+        template='plotly_white',
+        coloraxis=dict(colorscale='Viridis')
+    )
+    return go.Figure(data=traces, layout=layout)
+
+
+def baca_upload(req, field, ndim):
+    """
+    Membaca isi field dari file yang diunggah (<field>_file), atau None jika tidak ada file.
+
+    File .npy/.npz dibaca sebagai array biner; file .npy yang disimpan Django di file
+    sementara (upload besar) dibuka sebagai memory map. File lain dibaca sebagai teks.
+    """
+    upload = req.FILES.get(f'{field}_file')
+    if upload is None:
+        return None
+    if upload.name.lower().endswith(BINARY_EXTENSIONS):
+        if hasattr(upload, 'temporary_file_path'):
+            return load_binary(upload.temporary_file_path(), ndim)
+        return load_binary(upload, ndim)
+    if upload.size > MAX_INPUT_LENGTH:
+        raise MatrixParseError(f"File terlalu besar (maksimal {MAX_INPUT_LENGTH // (1024 * 1024)} MB).")
+    try:
+        return upload.read().decode('utf-8')
+    except UnicodeDecodeError:
+        raise MatrixParseError("File harus berupa teks (CSV atau angka dipisah spasi), .npy, atau .npz.")
+
+
+def baca_input(req):
+    """
+    Mengambil dan mem-parse input matriks dan hasil dari form atau file yang diunggah.
+
+    Returns:
+    tuple: Matriks koefisien (ndarray n x n) dan vektor hasil (ndarray n).
+    """
+    # Parser numerik langsung mengisi buffer float64, tanpa ast.literal_eval dan list bersarang
+    matrix = baca_upload(req, 'matrix', 2)
+    if matrix is None or isinstance(matrix, str):
+        matrix = parse_matrix(req.POST.get('matrix') if matrix is None else matrix)
+    results = baca_upload(req, 'results', 1)
+    if results is None or isinstance(results, str):
+        results = parse_vector(req.POST.get('results') if results is None else results)
+    return matrix, results
 
-    # Mengganti nilai -0.0 dengan 0.0 untuk kejelasan di augmented matrix dan hasil
-    augmented_matrix[augmented_matrix == -0.0] = 0.0
-    x[x == -0.0] = 0.0
 
-    return steps, descriptions, x, back_sub_steps
+def simpan_solusi(x):
+    """
+    Menyimpan vektor solusi agar bisa diunduh sebagai .npy.
+
+    Returns:
+    str: Kunci untuk URL unduhan.
+    """
+    x = np.asarray(x, dtype=float)
+    key = matrix_key(x)
+    solution_cache.store(key, x)
+    return key
+
+
+def unduh_solusi(req, key):
+    """
+    Mengunduh vektor solusi dalam format .npy.
+
+    Solusi disimpan di cache memori proses, sehingga tautannya hanya berlaku
+    selama entri tersebut belum dikeluarkan dari cache.
+    """
+    x = solution_cache.lookup(key)
+    if x is None:
+        raise Http404("Solusi tidak ditemukan.")
+    buffer = io.BytesIO()
+    np.save(buffer, x, allow_pickle=False)
+    response = HttpResponse(buffer.getvalue(), content_type='application/octet-stream')
+    response['Content-Disposition'] = 'attachment; filename="solusi.npy"'
+    return response
 
 
-def index(req):
+async def hitung_sistem(engine, matrix, results, tol=None, max_iter=None, omega=None):
+    """
+    Menyelesaikan sistem dengan engine LU, sparse, atau iteratif untuk cache hasil.
+
+    Returns:
+    dict: Entri cache berisi result, lu_cached, sparse_solution, iterative_solution, dan chart (JSON atau None).
+    """
+    entry = {'result': None, 'lu_cached': False, 'sparse_solution': None, 'iterative_solution': None, 'chart': None}
+    with phase('solve'):
+        if engine == 'lu':
+            # Jalur cepat: faktorisasi LU (LAPACK) yang disimpan di cache untuk matriks yang sama
+            entry['result'], entry['lu_cached'] = await run_in_thread(solve_lu, matrix, results)
+        elif engine == 'sparse':
+            # Matriks yang hampir seluruhnya nol diselesaikan dalam format CSR
+            sparse_solution = await run_in_thread(solve_sparse, matrix, results)
+            entry.update(result=sparse_solution.x, sparse_solution=sparse_solution)
+        else:
+            # Metode iteratif: berhenti begitu residual relatif di bawah toleransi
+            iterative_solution = await run_in_thread(solve_iterative, engine, matrix, results, tol, max_iter, omega)
+            entry.update(result=iterative_solution.x, iterative_solution=iterative_solution)
+    if entry['iterative_solution']:
+        with phase('chart'):
+            entry['chart'] = await run_in_thread(
+                build_figure_json, grafik_residual, entry['iterative_solution'].residuals, engine
+            )
+    return entry
+
+
+async def index(req):
     """
     Fungsi view untuk menangani permintaan halaman utama dan menghitung sistem persamaan linear menggunakan metode eliminasi Gauss.
     
     Mengambil input dari pengguna, menjalankan metode eliminasi Gauss, dan mengembalikan hasil serta langkah-langkah perhitungan.
+    Langkah eliminasi ditampilkan per halaman (STEPS_PER_PAGE langkah), atau dikirim bertahap jika memakai ?stream=1.
+    Form paginasi mengirim kunci elimination_cache, sehingga halaman berikutnya tetap bisa dibuka
+    meskipun input berasal dari file yang diunggah (dan tidak ikut dikirim ulang).
+
+    View async: parsing, solver LAPACK/SciPy, dan rendering dijalankan di thread executor,
+    eliminasi langkah demi langkah di pool proses. Hasil engine LU, sparse, dan iteratif
+    disimpan di cache hasil (core.result_cache).
     """
     result = None
     error_message = None
     steps = []
     descriptions = []
-    plot_div = None
     combined_steps = []
     back_sub_steps = []
+    solution = None
+    engine_used = None
+    lu_cached = False
+    from_cache = False
+    sparse_solution = None
+    iterative_solution = None
+    chart = None
+    page_obj = None
+    elimination_key = req.POST.get('elimination_key')
 
     if req.method == 'POST':
         try:
-            # Mengambil input dari pengguna dan parsing menggunakan ast.literal_eval untuk keamanan
-            matrix = req.POST.get('matrix')  # Input matriks dalam bentuk string
-            results = req.POST.get('results')  # Input hasil dalam bentuk string
-
-            # Menggunakan ast.literal_eval untuk parsing input secara aman
-            matrix = ast.literal_eval(matrix)  # Menghindari penggunaan eval() yang tidak aman
-            results = ast.literal_eval(results)
-
-            # Jalankan metode eliminasi Gauss
-            steps, descriptions, result, back_sub_steps = eliminasi_gauss(matrix, results)
-            combined_steps = list(zip(steps, descriptions))
-
-            # Membuat grafik menggunakan Plotly jika terdapat langkah eliminasi
-            if steps:
-                traces = []
-                for step_idx, step in enumerate(steps):
-                    # Membuat heatmap dari setiap langkah eliminasi
-                    trace = go.Heatmap(z=step, coloraxis="coloraxis", name=f'Step {step_idx + 1}')
-                    traces.append(trace)
-
-                layout = go.Layout(
-                    title='Proses Eliminasi Gauss',
-                    xaxis=dict(title='Kolom'),
-                    yaxis=dict(title='Baris'),
-                    template='plotly_white',
-                    coloraxis=dict(colorscale='Viridis')
+            # Pindah halaman langkah: log eliminasi diambil dari cache tanpa membaca input lagi
+            output = elimination_cache.lookup(elimination_key) if elimination_key else None
+            if output is not None:
+                engine_used = 'langkah'
+            elif elimination_key and not req.POST.get('matrix'):
+                raise MatrixParseError("Langkah eliminasi sudah tidak tersimpan, kirim ulang input.")
+            else:
+                with phase('parse'):
+                    matrix, results = await run_in_thread(baca_input, req)
+                    engine_used = await run_in_thread(
+                        pilih_engine_matriks, req.POST.get('engine') or 'auto', matrix, results
+                    )
+            if engine_used in CACHED_ENGINES:
+                # Hasil engine LU, sparse, dan iteratif (beserta grafiknya) disimpan di cache hasil
+                params = baca_parameter_iteratif(req.POST) if engine_used in ITERATIVE_METHODS else (None, None, None)
+                with phase('cache'):
+                    key = await run_in_thread(
+                        solve_input, f'gauss-{engine_used}', matrix=matrix, results=results,
+                        tol=params[0], max_iter=params[1], omega=params[2],
+                    )
+                entry, from_cache = await cached_result(
+                    key, lambda: hitung_sistem(engine_used, matrix, results, *params)
                 )
-
-                fig = go.Figure(data=traces, layout=layout)
-                plot_div = pio.to_html(fig, full_html=False)
-
+                result, lu_cached = entry['result'], entry['lu_cached']
+                sparse_solution, iterative_solution = entry['sparse_solution'], entry['iterative_solution']
+                solution = [(f'x{i + 1}', value) for i, value in enumerate(result.tolist())]
+                if entry['chart']:
+                    if wants_chart_json(req):
+                        return chart_json_response(entry['chart'])
+                    with phase('chart'):
+                        chart = render_chart(entry['chart'])
+            elif req.GET.get('stream') == '1' and output is None:
+                # Mode streaming: tabel langkah dikirim ke browser segera setelah dikerjakan
+                return await stream_eliminasi(req, matrix, results)
+            else:
+                # Jalankan metode eliminasi Gauss langkah demi langkah
+                if output is None:
+                    elimination_key, output = await eliminasi_gauss_cached(matrix, results)
+                if output[0] is None:
+                    raise np.linalg.LinAlgError(output[1])
+                steps, descriptions, result, back_sub_steps = output
+
+                # Hanya langkah di halaman yang diminta yang dibangun ulang dan dirender
+                page_obj = Paginator(range(len(steps)), STEPS_PER_PAGE).get_page(req.POST.get('page'))
+                combined_steps = steps.pairs(page_obj.start_index() - 1, page_obj.end_index())
+
+            # Grafik heatmap hanya dibuat untuk mode JSON (?chart=json) karena halaman HTML tidak menampilkannya
+            if steps and wants_chart_json(req):
+                with phase('chart'):
+                    figure_json = await run_in_thread(
+                        build_figure_json, grafik_eliminasi, steps, page_obj.start_index() - 1, page_obj.end_index()
+                    )
+                return chart_json_response(figure_json)
+
+        except (np.linalg.LinAlgError, MatrixParseError, SolverTimeout) as exc:
+            error_message = str(exc)
         except ValueError:
             error_message = "Masukkan nilai numerik yang valid."
-        except (SyntaxError, NameError):
-            error_message = "Masukkan input matriks dan hasil yang valid."
-
-    return render(req, 'gaus/pages/index.html', {
-        'result': result,
-        'steps': steps,
-        'descriptions': descriptions,
-        'error_message': error_message,
-        'plot_div': plot_div,
+
+    with phase('render'):
+        return await run_in_thread(render, req, 'gaus/pages/index.html', {
+            'result': result,
+            'steps': steps,
+            'descriptions': descriptions,
+            'error_message': error_message,
+            'matrix': req.POST.get('matrix'),
+            'results': req.POST.get('results'),
+            'combined_steps': combined_steps,
+            'back_sub_steps': back_sub_steps,
+            'solution': solution,
+            'solution_key': simpan_solusi(result) if result is not None else None,
+            'engine': req.POST.get('engine') or 'auto',
+            'engine_used': engine_used,
+            'lu_cached': lu_cached,
+            'from_cache': from_cache,
+            'sparse_solution': sparse_solution,
+            'iterative_solution': iterative_solution,
+            'chart': chart,
+            'tol': req.POST.get('tol'),
+            'max_iter': req.POST.get('max_iter'),
+            'omega': req.POST.get('omega'),
+            'page_obj': page_obj,
+            'elimination_key': elimination_key,
+            'step_offset': page_obj.start_index() - 1 if page_obj else 0,
+        })
+
+
+async def stream_eliminasi(req, matrix, results):
+    """
+    Mengirim halaman eliminasi Gauss secara bertahap dengan StreamingHttpResponse.
+
+    Bagian atas halaman (form) dikirim lebih dulu, lalu setiap tabel langkah dirender
+    dan dikirim segera setelah langkahnya dikerjakan, sehingga server tidak pernah
+    menyimpan seluruh halaman sekaligus.
+
+    Kontennya berupa async generator agar ASGI mengirim setiap bagian langsung; setiap
+    langkah eliminasi dan rendering tabelnya dikerjakan di thread executor.
+    """
+    augmented_matrix = matriks_augmented(matrix, results)
+    page = await run_in_thread(render_to_string, 'gaus/pages/stream.html', {
         'matrix': req.POST.get('matrix'),
         'results': req.POST.get('results'),
-        'combined_steps': combined_steps,
-        'back_sub_steps': back_sub_steps,
+        'engine': req.POST.get('engine') or 'auto',
+    }, request=req)
+    page_head, page_tail = page.split(STREAM_MARKER)
+    descriptions = []
+    numbered_steps = enumerate(langkah_eliminasi(augmented_matrix, EliminationLog(augmented_matrix), descriptions), 1)
+
+    def render_next_step():
+        # Mengerjakan satu langkah eliminasi dan merender tabelnya, atau None jika eliminasi selesai
+        item = next(numbered_steps, None)
+        if item is None:
+            return None
+        number, (step, description) = item
+        return render_to_string('gaus/components/step.html', {
+            'step': step, 'description': description, 'number': number,
+        })
+
+    def render_back_substitution():
+        _, back_sub_steps = substitusi_balik(augmented_matrix, descriptions)
+        return render_to_string('gaus/components/back_substitution.html', {'back_sub_steps': back_sub_steps})
+
+    async def generate():
+        yield page_head
+        try:
+            while (chunk := await run_in_thread(render_next_step)) is not None:
+                yield chunk
+            yield await run_in_thread(render_back_substitution)
+        except np.linalg.LinAlgError as exc:
+            yield render_to_string('gaus/components/error.html', {'error_message': str(exc)})
+        yield page_tail
+
+    return StreamingHttpResponse(generate(), content_type='text/html; charset=utf-8')
+
+
+@require_POST
+async def langkah(req, k):
+    """
+    Mengembalikan satu langkah eliminasi (ke-k, dimulai dari 1) dalam bentuk JSON.
+
+    Input matriks dan hasil dikirim ulang lewat POST seperti pada form utama;
+    log eliminasinya diambil dari cache sehingga eliminasi tidak diulang.
+    """
+    try:
+        with phase('parse'):
+            matrix, results = await run_in_thread(baca_input, req)
+        _, output = await eliminasi_gauss_cached(matrix, results)
+    except MatrixParseError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+    except SolverTimeout as exc:
+        return JsonResponse({'error': str(exc)}, status=503)
+    except ValueError:
+        return JsonResponse({'error': "Masukkan nilai numerik yang valid."}, status=400)
+    if output[0] is None:
+        return JsonResponse({'error': output[1]}, status=422)
+
+    steps = output[0]
+    if not 1 <= k <= len(steps):
+        return JsonResponse({'error': "Langkah tidak ditemukan.", 'total': len(steps)}, status=404)
+    return JsonResponse({
+        'step': k,
+        'total': len(steps),
+        'description': steps.descriptions[k - 1],
+        'matrix': steps[k - 1].tolist(),
     })
 
 
@@ -138,8 +461,7 @@ def index(req):
 # import plotly.graph_objs as go
 # import plotly.io as pio
 # import numpy as np
-# import ast  # Digunakan untuk parsing input yang aman
-
+# 
 # # Fungsi Metode Eliminasi Gauss
 # def eliminasi_gauss(matrix, results):
 #     # Mengubah matriks input dan hasil menjadi matriks augmented
@@ -271,8 +593,7 @@ def index(req):
 # # import plotly.graph_objs as go
 # # import plotly.io as pio
 # # import numpy as np
-# # import ast  # Digunakan untuk parsing input yang aman
-
+# # 
 # # # Fungsi Metode Eliminasi Gauss
 # # def eliminasi_gauss(matrix, results):
 # #     # Mengubah matriks input dan hasil menjadi matriks augmented
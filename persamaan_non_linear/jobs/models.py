@@ -0,0 +1,43 @@
+import uuid
+
+from django.db import models
+
+
+class Job(models.Model):
+    """
+    Satu permintaan solve yang dijalankan di luar request HTTP.
+
+    Tabel ini sekaligus menjadi antrean: worker mengklaim job berstatus pending
+    secara atomik, menulis progres selama berjalan, lalu menyimpan hasilnya.
+    Selama berjalan worker memperbarui heartbeat_at; job running yang heartbeat-nya
+    melewati batas lease dianggap ditinggalkan worker yang mati.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Menunggu'),
+        (RUNNING, 'Berjalan'),
+        (DONE, 'Selesai'),
+        (FAILED, 'Gagal'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=32)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING, db_index=True)
+    payload = models.JSONField()
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    progress = models.FloatField(default=0.0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.kind} {self.id} ({self.status})'
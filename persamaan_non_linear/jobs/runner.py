@@ -0,0 +1,214 @@
+"""
+Worker lokal untuk menjalankan job solver di luar thread request.
+
+Job disimpan di tabel Job (SQLite), lalu id-nya dikirim ke ProcessPoolExecutor.
+Worker mengklaim job secara atomik (pending -> running), sehingga job yang
+terkirim dua kali tetap hanya dijalankan sekali, dan job pending yang tertinggal
+saat server berhenti dijadwalkan ulang ketika pool pertama kali dibuat.
+
+Selama job berjalan, thread heartbeat di worker memperbarui Job.heartbeat_at.
+Job running yang heartbeat-nya lebih lama dari JOB_LEASE_TIMEOUT (workernya mati
+atau dibunuh) dikembalikan ke pending oleh reclaim_expired_jobs, atau ditandai
+gagal jika sudah dicoba JOB_MAX_ATTEMPTS kali.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+import logging
+import multiprocessing
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Job
+from .worker import execute, init_worker
+
+logger = logging.getLogger(__name__)
+
+# Jeda minimum antar penulisan progres ke database (detik)
+PROGRESS_INTERVAL = 0.5
+
+# Nilai default pengaturan lease (lihat settings.JOB_*)
+DEFAULT_HEARTBEAT_INTERVAL = 10
+DEFAULT_LEASE_TIMEOUT = 60
+DEFAULT_MAX_ATTEMPTS = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Membuat (sekali) pool proses worker sebanyak settings.JOB_WORKERS.
+
+    Pool yang rusak karena salah satu workernya mati dibuat ulang. Job pending dari
+    proses server sebelumnya dan job running yang lease-nya habis dijadwalkan ulang.
+
+    Returns:
+    ProcessPoolExecutor: Pool yang dipakai bersama oleh semua request.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None and not getattr(_executor, '_broken', False):
+            return _executor
+        _executor = ProcessPoolExecutor(
+            max_workers=getattr(settings, 'JOB_WORKERS', 2),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker,
+        )
+        executor = _executor
+    reclaim_expired_jobs()
+    for job_id in Job.objects.filter(status=Job.PENDING).values_list('pk', flat=True):
+        executor.submit(execute, job_id)
+    return executor
+
+
+def lease_expiry():
+    # Heartbeat yang lebih lama dari waktu ini berarti workernya sudah tidak berjalan
+    return timezone.now() - timedelta(seconds=getattr(settings, 'JOB_LEASE_TIMEOUT', DEFAULT_LEASE_TIMEOUT))
+
+
+def reclaim_expired_jobs():
+    """
+    Mengembalikan job running yang lease-nya habis ke antrean, atau menandainya gagal.
+
+    Setiap update memakai filter lease yang sama, sehingga job yang heartbeat-nya
+    baru saja diperbarui tidak ikut diambil alih.
+
+    Returns:
+    list: Id job yang dikembalikan ke status pending (belum dijadwalkan ke worker).
+    """
+    expired = Q(status=Job.RUNNING) & (
+        Q(heartbeat_at__lt=lease_expiry()) | Q(heartbeat_at__isnull=True, started_at__lt=lease_expiry())
+    )
+    max_attempts = getattr(settings, 'JOB_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+    failed = Job.objects.filter(expired, attempts__gte=max_attempts).update(
+        status=Job.FAILED,
+        error="Worker berhenti saat menjalankan job.",
+        result={'error': "Worker berhenti saat menjalankan job."},
+        finished_at=timezone.now(),
+    )
+    if failed:
+        logger.warning("%d job ditandai gagal karena workernya berhenti", failed)
+    requeued = []
+    for job_id in Job.objects.filter(expired, attempts__lt=max_attempts).values_list('pk', flat=True):
+        if Job.objects.filter(expired, pk=job_id).update(status=Job.PENDING, heartbeat_at=None):
+            requeued.append(job_id)
+    if requeued:
+        logger.warning("%d job dengan lease habis dikembalikan ke antrean", len(requeued))
+    return requeued
+
+
+def schedule(job_id):
+    # Menjalankan job langsung (mode 'inline') atau mengirimnya ke pool worker
+    if getattr(settings, 'JOB_WORKER_MODE', 'process') == 'inline':
+        run_job(job_id)
+    else:
+        transaction.on_commit(lambda: get_executor().submit(execute, job_id))
+
+
+def submit_job(kind, payload):
+    """
+    Menyimpan job baru dan menjadwalkannya ke worker.
+
+    Dengan settings.JOB_WORKER_MODE = 'inline' job langsung dijalankan di proses
+    ini (dipakai saat testing, karena database test tidak terlihat oleh proses lain).
+    Job lain yang lease-nya habis ikut dijadwalkan ulang.
+
+    Returns:
+    Job: Job yang baru dibuat.
+    """
+    for job_id in reclaim_expired_jobs():
+        schedule(job_id)
+    job = Job.objects.create(kind=kind, payload=payload)
+    schedule(job.pk)
+    job.refresh_from_db()
+    return job
+
+
+class ProgressReporter:
+    """Callback progres (0..1) untuk solver yang menulis ke database paling sering setiap PROGRESS_INTERVAL detik."""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self.last_write = 0.0
+
+    def __call__(self, fraction):
+        now = time.monotonic()
+        if now - self.last_write >= PROGRESS_INTERVAL:
+            self.last_write = now
+            Job.objects.filter(pk=self.job_id).update(
+                progress=min(max(fraction, 0.0), 1.0), heartbeat_at=timezone.now(),
+            )
+
+
+@contextmanager
+def heartbeat(job_id):
+    """
+    Memperbarui heartbeat_at job setiap JOB_HEARTBEAT_INTERVAL detik dari thread terpisah.
+
+    Solver tidak selalu memanggil callback progres (misalnya LAPACK), jadi lease
+    diperpanjang oleh thread ini selama job masih berjalan.
+    """
+    interval = getattr(settings, 'JOB_HEARTBEAT_INTERVAL', DEFAULT_HEARTBEAT_INTERVAL)
+    stop = threading.Event()
+
+    def beat():
+        try:
+            while not stop.wait(interval):
+                Job.objects.filter(pk=job_id, status=Job.RUNNING).update(heartbeat_at=timezone.now())
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f'job-heartbeat-{job_id}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_job(job_id):
+    """
+    Menjalankan satu job di proses worker dan menyimpan hasil atau error-nya.
+
+    Parameters:
+    job_id (UUID): Id job yang akan dijalankan.
+    """
+    # Diimpor di sini karena modul api mengimpor modul ini
+    from api.validation import ValidationError
+    from api.views import SOLVERS
+
+    close_old_connections()
+    now = timezone.now()
+    claimed = Job.objects.filter(pk=job_id, status=Job.PENDING).update(
+        status=Job.RUNNING, started_at=now, heartbeat_at=now, attempts=F('attempts') + 1,
+    )
+    if not claimed:
+        return
+    job = Job.objects.get(pk=job_id)
+    read, solve = SOLVERS[job.kind]
+
+    try:
+        with heartbeat(job_id):
+            body, status = solve(read(job.payload), progress=ProgressReporter(job_id))
+    except ValidationError as exc:
+        body, status = {'error': exc.message, 'field': exc.field}, 400
+    except Exception as exc:
+        logger.exception("Job %s gagal", job_id)
+        body, status = {'error': str(exc) or exc.__class__.__name__}, 500
+
+    done = status < 400
+    Job.objects.filter(pk=job_id).update(
+        status=Job.DONE if done else Job.FAILED,
+        result=body,
+        error='' if done else body.get('error', ''),
+        progress=1.0 if done else job.progress,
+        finished_at=timezone.now(),
+    )
+    close_old_connections()
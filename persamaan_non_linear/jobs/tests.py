@@ -0,0 +1,105 @@
+from datetime import timedelta
+import json
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from solvers.roots import PROGRESS_EVERY, newton_rapshon
+from .models import Job
+from .runner import reclaim_expired_jobs, run_job, submit_job
+
+
+@override_settings(JOB_WORKER_MODE='inline')
+class JobApiTest(TestCase):
+    def submit(self, kind, payload):
+        return self.client.post('/api/v1/jobs/', json.dumps({'kind': kind, 'payload': payload}), content_type='application/json')
+
+    def test_submit_lalu_polling_hasil(self):
+        response = self.submit('secant', {'f_expr': 'x**2 - 2', 'x0': 1, 'x1': 2, 'tol': 1e-10, 'max_iter': 50})
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()['id']
+
+        body = self.client.get(f'/api/v1/jobs/{job_id}/').json()
+        self.assertEqual(body['status'], Job.DONE)
+        self.assertEqual(body['progress'], 1.0)
+        self.assertAlmostEqual(body['result']['root'], 2 ** 0.5)
+        self.assertIsNotNone(body['finished_at'])
+
+    def test_job_gauss_dan_batch(self):
+        response = self.submit('gauss', {'matrix': [[2, 1], [1, 3]], 'results': [3, 5], 'include_trace': False})
+        self.assertEqual([round(v, 9) for v in response.json()['result']['solution']], [0.8, 1.4])
+        response = self.submit('batch', {
+            'method': 'newton-raphson', 'problems': [{'f_expr': 'x - 3', 'x0': 0, 'tol': 1e-9, 'max_iter': 5}],
+        })
+        self.assertEqual(response.json()['result']['results'][0]['root'], 3.0)
+
+    def test_solver_gagal_disimpan_sebagai_failed(self):
+        response = self.submit('newton-raphson', {'f_expr': 'x**2 + 1', 'x0': 0, 'tol': 1e-8, 'max_iter': 50})
+        body = response.json()
+        self.assertEqual(body['status'], Job.FAILED)
+        self.assertIn('Turunan', body['error'])
+
+    def test_validasi_saat_submit(self):
+        self.assertEqual(self.submit('euler', {}).json()['field'], 'kind')
+        response = self.submit('newton-raphson', {'f_expr': 'x', 'x0': 'nol', 'tol': 1e-8, 'max_iter': 5})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['field'], 'payload.x0')
+        self.assertFalse(Job.objects.exists())
+
+    def test_job_tidak_ditemukan(self):
+        self.assertEqual(self.client.get('/api/v1/jobs/00000000-0000-0000-0000-000000000000/').status_code, 404)
+
+
+class RunJobTest(TestCase):
+    def test_job_hanya_dijalankan_sekali(self):
+        job = Job.objects.create(kind='secant', payload={'f_expr': 'x - 1', 'x0': 0, 'x1': 2, 'tol': 1e-9, 'max_iter': 5})
+        run_job(job.pk)
+        Job.objects.filter(pk=job.pk).update(result=None)
+        run_job(job.pk)  # Sudah diklaim, tidak dijalankan ulang
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertIsNone(job.result)
+
+    @override_settings(JOB_WORKER_MODE='inline')
+    def test_submit_job_inline(self):
+        job = submit_job('secant', {'f_expr': 'x - 1', 'x0': 0, 'x1': 2, 'tol': 1e-9, 'max_iter': 5})
+        self.assertEqual(job.status, Job.DONE)
+
+    def test_callback_progres(self):
+        fractions = []
+        newton_rapshon('x**2 + 1', 0.5, 1e-30, 3 * PROGRESS_EVERY, progress=fractions.append)
+        self.assertEqual(fractions, [0.0, 1 / 3, 2 / 3])
+
+
+@override_settings(JOB_WORKER_MODE='inline', JOB_LEASE_TIMEOUT=60, JOB_MAX_ATTEMPTS=2)
+class JobLeaseTest(TestCase):
+    payload = {'f_expr': 'x - 1', 'x0': 0, 'x1': 2, 'tol': 1e-9, 'max_iter': 5}
+
+    def running_job(self, attempts, heartbeat_age):
+        # Job yang diklaim worker yang kemudian mati: status running dengan heartbeat lama
+        started = timezone.now() - timedelta(seconds=heartbeat_age)
+        return Job.objects.create(
+            kind='secant', payload=self.payload, status=Job.RUNNING,
+            started_at=started, heartbeat_at=started, attempts=attempts,
+        )
+
+    def test_lease_habis_dijalankan_ulang(self):
+        job = self.running_job(attempts=1, heartbeat_age=120)
+        submit_job('secant', self.payload)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.result['root'], 1.0)
+
+    def test_gagal_setelah_batas_percobaan(self):
+        job = self.running_job(attempts=2, heartbeat_age=120)
+        self.assertEqual(reclaim_expired_jobs(), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIn('Worker berhenti', job.error)
+
+    def test_lease_aktif_tidak_diambil_alih(self):
+        job = self.running_job(attempts=1, heartbeat_age=5)
+        self.assertEqual(reclaim_expired_jobs(), [])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.RUNNING)
@@ -0,0 +1,22 @@
+"""
+Titik masuk untuk proses worker job.
+
+Modul ini sengaja tidak mengimpor model di level modul: fungsi di sini di-unpickle
+oleh proses worker sebelum Django di-setup oleh init_worker.
+"""
+
+
+def init_worker():
+    # Solver di dalam job langsung dijalankan di proses ini, tidak dikirim lagi ke pool solver.
+    # Ditandai sebelum setup agar warmup di AppConfig.ready tahu ia berjalan di worker
+    from core.offload import mark_worker
+    mark_worker()
+
+    # Proses worker dibuat dengan 'spawn', jadi Django perlu di-setup ulang di dalamnya
+    import django
+    django.setup()
+
+
+def execute(job_id):
+    from .runner import run_job
+    run_job(job_id)
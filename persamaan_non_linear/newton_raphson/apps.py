@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class NewtonRaphsonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'newton_raphson'
+
+    def ready(self):
+        from core.warmup import warm_app, warmup_enabled
+        if not warmup_enabled():
+            return
+        # Ekspresi umum, halaman form, dan Plotly dimuat sebelum worker server di-fork (lihat core.warmup)
+        from solvers.expression import get_compiled
+        from .views import grafik_konvergensi
+        warm_app(
+            self.name,
+            compilers=[get_compiled],
+            templates=['pages/index.html'],
+            chart=lambda: grafik_konvergensi([{'iteration': 1, 'f_x': 1.0}, {'iteration': 2, 'f_x': 0.0}]),
+        )
@@ -1,126 +1,125 @@
 from django.shortcuts import render
-import plotly.graph_objs as go
-import plotly.io as pio
+from core.charts import build_figure_json, chart_json_response, convergence_figure, figure_to_json, render_chart, wants_chart_json
+from core.instrumentation import phase
+from core.multistart import solve_all_roots
+from core.offload import SolverTimeout, run_in_pool, run_in_thread
+from core.result_cache import cached_result, solve_input
 import math
-import sympy as sp
 import json
+from solvers.roots import newton_rapshon
 
-# Fungsi Newton Rapshon
-def newton_rapshon(f_expr, x0, tol, max_iter):
+def grafik_konvergensi(result):
     """
-    Fungsi untuk menghitung akar dari sebuah fungsi menggunakan metode Newton Raphson.
+    Membuat grafik konvergensi f(x) per iterasi, dengan tampilan log |f(x)|.
 
     Parameters:
-    f_expr (str): Ekspresi fungsi sebagai string.
-    x0 (float): Pendekatan awal.
-    tol (float): Toleransi error yang diizinkan.
-    max_iter (int): Jumlah iterasi maksimum.
+    result (list): Riwayat iterasi dari newton_rapshon.
 
     Returns:
-    tuple: List dari setiap iterasi yang mencakup nilai x, f(x), f'(x), serta pesan error jika ada.
+    go.Figure: Grafik f(x) terhadap iterasi, dicuplik jika iterasinya melebihi settings.CHART_MAX_POINTS.
     """
-    x = sp.symbols('x')
-    f = sp.sympify(f_expr, locals={'e': sp.exp(1)}) # Mengubah string menjadi ekspresi
-    f_prime = sp.diff(f, x)  # Menghitung turuan pertama dari f
-
-    # Mendefenisikan fungsi f(x) dan f'(x)
-    f_lambdified = sp.lambdify(x,f)
-    f_prime_lambdified = sp.lambdify(x, f_prime) 
-
-    interatios = []
-    xi = x0
-    for i in range(max_iter):
-        fxi = f_lambdified(xi)
-        f_prime_xi = f_prime_lambdified(xi)
-
-        # Cek apakah f'(x) = 0
-        if f_prime_xi == 0:
-            return None, "Turunan mendekati nol, metode Newton-Raphson gagal."
-            
-        # menyimpan informasi itersi ke dalam iterations
-        status = "Lanjut" if abs(fxi) >= tol else "Berhenti"
-        interatios.append({
-            'iteration': i + 1,
-            'x': xi,
-            'f_x': fxi,
-            'f_prime_x': f_prime_xi,
-            'status': status,
-        })
+    return convergence_figure(result, 'f_x', 'Grafik Konvergensi Metode Newton Raphson', 'f(x)')
 
-        # Memerisa apakah nilai f(xi) sudah mendekati nol dalam teleransi error yang ditentukan
-        if abs(fxi) < tol:
-            break
 
-        # Mencari akar berikutnya menggunakan metode Newton-Raphson
-        xi = xi - fxi / f_prime_xi
-    return interatios, None, f_prime
+def kunci_cache(post, f_expr, tol, max_iter):
+    # Kunci cache hasil dari input form yang sudah dinormalisasi
+    if post.get('mode') == 'all':
+        return solve_input(
+            'newton-raphson-all', f_expr=f_expr, tol=tol, max_iter=max_iter,
+            lo=float(post.get('lo')), hi=float(post.get('hi')), n_starts=post.get('n_starts') or '',
+        )
+    return solve_input('newton-raphson', f_expr=f_expr, tol=tol, max_iter=max_iter, x0=float(post.get('x')))
 
 
+async def hitung(post, f_expr, tol, max_iter):
+    """
+    Menjalankan solver dan membuat grafiknya untuk satu input form.
 
-def index(req):
+    Returns:
+    dict: Entri cache hasil berisi result, roots, f_prime, error_message, dan chart (JSON figure atau None).
+    """
+    entry = {'result': None, 'roots': None, 'f_prime': None, 'error_message': None, 'chart': None}
+    if post.get('mode') == 'all':
+        # Mode cari semua akar: grid titik awal di [lo, hi] diiterasi bersamaan
+        roots, compiled, fig = await solve_all_roots(
+            post, 'newton-raphson', f_expr, tol, max_iter, 'Akar-akar f(x) Metode Newton Raphson'
+        )
+        entry.update(roots=roots, f_prime=str(compiled.f_prime))
+        if fig:
+            with phase('chart'):
+                entry['chart'] = await run_in_thread(figure_to_json, fig)
+    else:
+        x0 = float(post.get('x'))
+
+        # Jalankan method Newton Rapshon
+        with phase('solve'):
+            result, error_message, f_prime = await run_in_pool(newton_rapshon, f_expr, x0, tol, max_iter)
+        entry.update(result=result, error_message=error_message, f_prime=str(f_prime) if f_prime is not None else None)
+
+        # Membuat grafik menggunkan Ploty jika hasil ada hasil
+        if result:
+            with phase('chart'):
+                entry['chart'] = await run_in_thread(build_figure_json, grafik_konvergensi, result)
+    return entry
+
+
+async def index(req):
     """
     Fungsi view untuk menangani permintaan halaman utama dan menghitung akar menggunakan metode Newton Raphson.
 
+    View async: solver dijalankan di pool proses dan grafik serta template dirender
+    di thread executor, sehingga event loop ASGI tetap melayani request lain.
+    Hasil dan JSON grafiknya disimpan di cache hasil (core.result_cache), sehingga
+    input yang sama tidak dihitung ulang.
+
     Parameters:
     request (HttpRequest): Objek permintaan dari pengguna.
 
     Returns:
     HttpResponse: Halaman HTML yang dirender.
     """
-    result = None
+    entry = {}
     error_message = None
-    plot_div = None
-    f_prime_res = None
+    chart = None
 
     if req.method == 'POST':
         try:
             # Mengambil input dari pengguna
-            f_expr = req.POST.get('f_expr')
-            x0 = float(req.POST.get('x'))
-            tol = float(req.POST.get('tol'))
-            max_iter = int(req.POST.get('max_iter'))
-
-            # Jalankan method Newton Rapshon
-            result, error_message, f_prime_res = newton_rapshon(f_expr, x0, tol, max_iter)
-
-            # Membuat grafik menggunkan Ploty jika hasil ada hasil
-            if result:
-                # Membuat data yang akan digunakan untuk membuat plot
-                x_values = [info['iteration'] for info in result]
-                y_values = [info['f_x'] for info in result]
-
-                trace = go.Scatter(
-                    x=x_values,
-                    y=y_values,
-                    mode='lines+markers',
-                    name='f(x)',
-                    line=dict(color='royalblue', width=2),
-                    marker=dict(size=6)
-                )
-
-                layout = go.Layout(
-                    title='Grafik Konvergensi Metode Newton Raphson',
-                    xaxis=dict(title='Iterasi'),
-                    yaxis=dict(title='f(x)'),
-                    template='plotly_white'
-                )
-
-                fig = go.Figure(data=[trace], layout=layout)
-                plot_div = pio.to_html(fig, full_html=False)
+            with phase('parse'):
+                f_expr = req.POST.get('f_expr')
+                tol = float(req.POST.get('tol'))
+                max_iter = int(req.POST.get('max_iter'))
+                key = kunci_cache(req.POST, f_expr, tol, max_iter)
+            entry, _ = await cached_result(key, lambda: hitung(req.POST, f_expr, tol, max_iter))
+            error_message = entry['error_message']
+
+            if entry['chart']:
+                # Mode JSON saja: klien merender grafiknya sendiri
+                if wants_chart_json(req):
+                    return chart_json_response(entry['chart'])
+                with phase('chart'):
+                    chart = render_chart(entry['chart'])
             
         except ValueError:
             error_message = "Masukan nilai numerik yang valid"
         except(SyntaxError, NameError):
             error_message = "Masukan fungsi ekpsresi yang valid"
-
-    return render(req, 'pages/index.html', {
-        'result': result,
-        'error_message': error_message,
-        'plot_div': plot_div,
-        'f_prime': f_prime_res,
-        'f_expr': req.POST.get('f_expr'),
-        'x' : req.POST.get('x'),
-        'tol' : req.POST.get('tol'),
-        'max_iter' : req.POST.get('max_iter')
-    })
+        except SolverTimeout as exc:
+            error_message = str(exc)
+
+    with phase('render'):
+        return await run_in_thread(render, req, 'pages/index.html', {
+            'result': entry.get('result'),
+            'roots': entry.get('roots'),
+            'error_message': error_message,
+            'chart': chart,
+            'f_prime': entry.get('f_prime'),
+            'f_expr': req.POST.get('f_expr'),
+            'x' : req.POST.get('x'),
+            'tol' : req.POST.get('tol'),
+            'max_iter' : req.POST.get('max_iter'),
+            'lo' : req.POST.get('lo'),
+            'hi' : req.POST.get('hi'),
+            'n_starts' : req.POST.get('n_starts'),
+        })
 
@@ -10,7 +10,9 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
+import tempfile
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -39,15 +41,21 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'newton_raphson',
     'secant',
-    'gaus'
+    'gaus',
+    'regula_falsi',
+    'core',
+    'api',
+    'jobs',
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.profiling.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -133,6 +141,106 @@ STATICFILES_DIRS = [
 ]
 
 
+# Job solver asinkron (app jobs): jumlah proses worker, dan 'inline' untuk menjalankan job langsung di proses web
+JOB_WORKERS = 2
+JOB_WORKER_MODE = 'process'
+
+# Lease job yang sedang berjalan: worker memperbarui heartbeat setiap JOB_HEARTBEAT_INTERVAL detik.
+# Job running tanpa heartbeat selama JOB_LEASE_TIMEOUT detik (workernya mati) dijadwalkan ulang,
+# atau ditandai gagal setelah dicoba JOB_MAX_ATTEMPTS kali.
+JOB_HEARTBEAT_INTERVAL = 10
+JOB_LEASE_TIMEOUT = 60
+JOB_MAX_ATTEMPTS = 2
+
+# Pool proses untuk solver interaktif (core.offload): aktif/tidak, jumlah proses (None = min(4, jumlah CPU)),
+# dan batas waktu per pemanggilan dalam detik
+SOLVER_OFFLOAD = True
+SOLVER_POOL_SIZE = None
+SOLVER_TIMEOUT = 30
+
+# Warmup saat aplikasi dimuat (core.warmup): ekspresi di SOLVER_WARMUP_EXPRESSIONS dikompilasi dan
+# template serta Plotly dimuat sebelum worker server di-fork (gunicorn --preload), sehingga semua
+# worker memakainya bersama. Diaktifkan oleh wsgi.py/asgi.py lewat variabel lingkungan SOLVER_WARMUP=1;
+# perintah manage.py dan test tetap memuat library berat secara lazy.
+SOLVER_WARMUP = os.environ.get('SOLVER_WARMUP') == '1'
+SOLVER_WARMUP_EXPRESSIONS = ['x**2 - 2', 'x**3 - 2*x - 5', 'cos(x) - x', 'exp(-x) - x', 'sin(x) - x/2']
+
+# Cache hasil solve (core.result_cache). Backend: 'locmem' (per proses), 'file', atau 'db'
+# (tabel di SQLite, buat dulu dengan `python manage.py createcachetable`).
+# TIMEOUT dalam detik; MAX_ENTRIES membatasi jumlah entri sebelum entri lama dibuang.
+RESULT_CACHE_BACKEND = 'locmem'
+RESULT_CACHE_TIMEOUT = 60 * 60
+RESULT_CACHE_MAX_ENTRIES = 1000
+
+RESULT_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'solver-results',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': Path(tempfile.gettempdir()) / 'persamaan_non_linear' / 'results',
+    },
+    'db': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'solver_result_cache',
+    },
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'results': {
+        **RESULT_CACHE_BACKENDS[RESULT_CACHE_BACKEND],
+        'TIMEOUT': RESULT_CACHE_TIMEOUT,
+        'OPTIONS': {'MAX_ENTRIES': RESULT_CACHE_MAX_ENTRIES},
+    },
+}
+
+# Riwayat solve (core.history): setiap solve baru dicatat di tabel SolveRecord, yang juga
+# dipakai sebagai cache hasil tingkat kedua. Catatan ditulis dengan bulk insert setelah
+# response, saat buffer berisi SOLVE_HISTORY_BATCH_SIZE catatan atau sudah
+# SOLVE_HISTORY_FLUSH_INTERVAL detik sejak penulisan terakhir.
+SOLVE_HISTORY = True
+SOLVE_HISTORY_BATCH_SIZE = 100
+SOLVE_HISTORY_FLUSH_INTERVAL = 5.0
+
+# Grafik konvergensi (core.charts): riwayat iterasi yang lebih panjang dicuplik dengan LTTB
+# menjadi paling banyak CHART_MAX_POINTS titik per trace, agar ukuran JSON figure tetap terbatas.
+CHART_MAX_POINTS = 2000
+
+# Pengukuran waktu per request (core.instrumentation). Request yang lebih lama dari
+# TIMING_SLOW_REQUEST detik dicatat sebagai WARNING; ubah level logger ke 'INFO'
+# untuk mencatat satu baris JSON untuk setiap request.
+TIMING_SLOW_REQUEST = 1.0
+
+# Endpoint /metrics (format Prometheus) hanya bisa diakses dari alamat berikut (REMOTE_ADDR)
+# atau oleh pengguna staff. Tambahkan alamat server Prometheus di sini.
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+
+# Profiling cProfile (core.profiling): staff dapat memprofil request dengan ?profile=1 atau
+# header X-Profile: 1; PROFILING_SAMPLE_RATE > 0 memprofil sebagian request POST secara acak.
+# Hanya PROFILING_MAX_RECORDS profil paling lambat yang disimpan (lihat admin ProfileRecord).
+PROFILING_SAMPLE_RATE = 0.0
+PROFILING_DIR = Path(tempfile.gettempdir()) / 'persamaan_non_linear' / 'profiles'
+PROFILING_MAX_RECORDS = 500
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(asctime)s %(name)s %(levelname)s %(message)s'},
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'message'},
+    },
+    'loggers': {
+        'core.instrumentation': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -22,4 +22,7 @@ urlpatterns = [
     path('newton-raphson/', include('newton_raphson.urls')), 
     path('secant/', include('secant.urls')), 
     path('gaus/', include('gaus.urls')), 
+    path('regula-falsi/', include('regula_falsi.urls')),
+    path('api/v1/', include('api.urls')),
+    path('', include('core.urls')),
 ]
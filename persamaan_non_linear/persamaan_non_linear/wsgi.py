@@ -12,5 +12,7 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'persamaan_non_linear.settings')
+# Server produksi memanaskan cache solver sebelum fork (core.warmup); set SOLVER_WARMUP=0 untuk mematikannya
+os.environ.setdefault('SOLVER_WARMUP', '1')
 
 application = get_wsgi_application()
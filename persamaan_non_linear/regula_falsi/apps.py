@@ -0,0 +1,20 @@
+from django.apps import AppConfig
+
+
+class RegulaFalsiConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'regula_falsi'
+
+    def ready(self):
+        from core.warmup import warm_app, warmup_enabled
+        if not warmup_enabled():
+            return
+        # Regula Falsi memakai compiler whitelist AST (skalar untuk form/API, vektor untuk batch)
+        from solvers.math_expression import compile_expression, compile_vectorized
+        from .views import grafik_konvergensi
+        warm_app(
+            self.name,
+            compilers=[compile_expression, compile_vectorized],
+            templates=['regula_falsi/pages/index.html'],
+            chart=lambda: grafik_konvergensi([{'iteration': 1, 'f_xr': 1.0}, {'iteration': 2, 'f_xr': 0.0}]),
+        )
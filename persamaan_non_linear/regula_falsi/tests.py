@@ -0,0 +1,33 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from core.charts import plotly_js_url
+from core.result_cache import result_cache
+
+
+class RegulaFalsiViewTest(TestCase):
+    data = {'a': '0', 'b': '2', 'tol': '1e-6', 'max_iter': '50', 'f_expr': 'x**2 - 2'}
+
+    def test_halaman_hasil_dan_grafik(self):
+        response = self.client.post('/regula-falsi/', self.data)
+        self.assertContains(response, plotly_js_url())
+        self.assertAlmostEqual(response.context['result'][-1]['xr'], 2 ** 0.5, places=5)
+
+    def test_mode_json(self):
+        response = self.client.post('/regula-falsi/?chart=json', self.data)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    def test_pesan_error(self):
+        response = self.client.post('/regula-falsi/', {**self.data, 'f_expr': 'x**2 + 1'})
+        self.assertEqual(response.context['error_message'], "Interval [a, b] tidak mengandung akar.")
+        response = self.client.post('/regula-falsi/', {**self.data, 'f_expr': '__import__("os")'})
+        self.assertEqual(response.context['error_message'], "Masukkan ekspresi fungsi yang valid.")
+
+    def test_cache_hasil(self):
+        result_cache().clear()
+        first = self.client.post('/regula-falsi/', self.data)
+        with mock.patch('regula_falsi.views.hitung') as hitung:
+            second = self.client.post('/regula-falsi/', {**self.data, 'a': '0.0', 'f_expr': '  x**2  -  2 '})
+        hitung.assert_not_called()
+        self.assertEqual(second.context['result'], first.context['result'])
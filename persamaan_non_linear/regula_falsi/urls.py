@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import index
+
+urlpatterns = [
+    path('', index, name='index'),
+]
@@ -0,0 +1,108 @@
+from django.shortcuts import render
+from core.charts import build_figure_json, chart_json_response, convergence_figure, render_chart, wants_chart_json
+from core.instrumentation import phase
+from core.offload import SolverTimeout, run_in_pool, run_in_thread
+from core.result_cache import cached_result, solve_input
+from solvers.roots import metode_regula_falsi
+
+
+def grafik_konvergensi(result):
+    """
+    Membuat grafik konvergensi f(xr) per iterasi, dengan tampilan log |f(xr)|.
+
+    Parameters:
+    result (list): Riwayat iterasi dari metode_regula_falsi.
+
+    Returns:
+    go.Figure: Grafik f(xr) terhadap iterasi, dicuplik jika iterasinya melebihi settings.CHART_MAX_POINTS.
+    """
+    return convergence_figure(result, 'f_xr', 'Grafik Konvergensi Metode Regula Falsi', 'f(xr)')
+
+
+def kunci_cache(post, f_expr, tol, max_iter):
+    # Kunci cache hasil dari input form yang sudah dinormalisasi
+    return solve_input(
+        'regula-falsi', f_expr=f_expr, tol=tol, max_iter=max_iter,
+        a=float(post.get('a')), b=float(post.get('b')),
+    )
+
+
+async def hitung(post, f_expr, tol, max_iter):
+    """
+    Menjalankan metode Regula Falsi dan membuat grafiknya untuk satu input form.
+
+    Returns:
+    dict: Entri cache hasil berisi result, error_message, dan chart (JSON figure atau None).
+    """
+    entry = {'result': None, 'error_message': None, 'chart': None}
+    a = float(post.get('a'))
+    b = float(post.get('b'))
+
+    # Jalankan metode Regula Falsi; ekspresinya dikompilasi di worker lewat whitelist AST
+    with phase('solve'):
+        result, entry['error_message'] = await run_in_pool(metode_regula_falsi, f_expr, a, b, tol, max_iter)
+    entry['result'] = result
+
+    # Membuat grafik menggunakan Plotly jika ada hasil
+    if result:
+        with phase('chart'):
+            entry['chart'] = await run_in_thread(build_figure_json, grafik_konvergensi, result)
+    return entry
+
+
+async def index(req):
+    """
+    Fungsi view untuk menangani permintaan halaman utama dan menghitung akar menggunakan metode Regula Falsi.
+
+    View async: solver dijalankan di pool proses dan grafik serta template dirender
+    di thread executor, sehingga event loop ASGI tetap melayani request lain.
+    Hasil dan JSON grafiknya disimpan di cache hasil (core.result_cache).
+
+    Parameters:
+    request (HttpRequest): Objek permintaan dari pengguna.
+
+    Returns:
+    HttpResponse: Halaman HTML yang dirender.
+    """
+    entry = {}
+    error_message = None
+    chart = None
+
+    if req.method == 'POST':
+        try:
+            # Mengambil input dari pengguna
+            with phase('parse'):
+                f_expr = req.POST.get('f_expr')
+                tol = float(req.POST.get('tol'))
+                max_iter = int(req.POST.get('max_iter'))
+                key = kunci_cache(req.POST, f_expr, tol, max_iter)
+            entry, _ = await cached_result(key, lambda: hitung(req.POST, f_expr, tol, max_iter))
+            error_message = entry['error_message']
+
+            if entry['chart']:
+                # Mode JSON saja: klien merender grafiknya sendiri
+                if wants_chart_json(req):
+                    return chart_json_response(entry['chart'])
+                with phase('chart'):
+                    chart = render_chart(entry['chart'])
+
+        except (SyntaxError, NameError):
+            error_message = "Masukkan ekspresi fungsi yang valid."
+        except (ValueError, TypeError):
+            error_message = "Masukkan nilai numerik yang valid."
+        except ArithmeticError:
+            error_message = "Fungsi tidak dapat dihitung pada interval tersebut."
+        except SolverTimeout as exc:
+            error_message = str(exc)
+
+    with phase('render'):
+        return await run_in_thread(render, req, 'regula_falsi/pages/index.html', {
+            'result': entry.get('result'),
+            'error_message': error_message,
+            'chart': chart,
+            'f_expr': req.POST.get('f_expr'),
+            'a': req.POST.get('a'),
+            'b': req.POST.get('b'),
+            'tol': req.POST.get('tol'),
+            'max_iter': req.POST.get('max_iter'),
+        })
@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class SecantConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'secant'
+
+    def ready(self):
+        from core.warmup import warm_app, warmup_enabled
+        if not warmup_enabled():
+            return
+        # Cache ekspresi dipakai bersama dengan Newton Raphson, jadi di sini sebagian besar berupa hit
+        from solvers.expression import get_compiled
+        from .views import grafik_konvergensi
+        warm_app(
+            self.name,
+            compilers=[get_compiled],
+            templates=['secant/pages/index.html'],
+            chart=lambda: grafik_konvergensi([{'iteration': 1, 'f_x1': 1.0}, {'iteration': 2, 'f_x1': 0.0}]),
+        )
@@ -1,121 +1,123 @@
 from django.shortcuts import render
-import plotly.graph_objs as go
-import plotly.io as pio
-import sympy as sp
-
-# Fungsi Metode Secant
-def metode_secant(f_expr, x0, x1, tol, max_iter):
+from core.charts import build_figure_json, chart_json_response, convergence_figure, figure_to_json, render_chart, wants_chart_json
+from core.instrumentation import phase
+from core.multistart import solve_all_roots
+from core.offload import SolverTimeout, run_in_pool, run_in_thread
+from core.result_cache import cached_result, solve_input
+from solvers.roots import metode_secant
+
+def grafik_konvergensi(result):
     """
-    Fungsi untuk menghitung akar dari sebuah fungsi menggunakan metode secant.
+    Membuat grafik konvergensi f(x1) per iterasi, dengan tampilan log |f(x1)|.
 
     Parameters:
-    f_expr (str): Ekspresi fungsi sebagai string.
-    x0, x1 (float): Pendekatan awal.
-    tol (float): Toleransi error yang diizinkan.
-    max_iter (int): Jumlah iterasi maksimum.
+    result (list): Riwayat iterasi dari metode_secant.
 
     Returns:
-    tuple: List dari setiap iterasi yang mencakup nilai x, f(x), serta pesan error jika ada.
+    go.Figure: Grafik f(x) terhadap iterasi, dicuplik jika iterasinya melebihi settings.CHART_MAX_POINTS.
     """
-    x = sp.symbols('x')
-    f = sp.sympify(f_expr, locals={'e': sp.exp(1)})  # Mengubah string menjadi ekspresi
-    f_lambdified = sp.lambdify(x, f)
-
-    iterations = []
-    for i in range(max_iter):
-        f_x0 = f_lambdified(x0)
-        f_x1 = f_lambdified(x1)
-
-        # Cek apakah denominasi nol untuk menghindari error pembagian dengan nol
-        if (f_x1 - f_x0) == 0:
-            return None, "Pembagian dengan nol, metode secant gagal."
-
-        # Mencari nilai baru untuk x menggunakan rumus metode secant
-        x2 = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
-
-        # Menyimpan hasil iterasi
-        status = "Lanjut" if abs(f_x1) >= tol else "Berhenti"
-        iterations.append({
-            'iteration': i + 1,
-            'x0': x0,
-            'x1': x1,
-            'f_x0': f_x0,
-            'f_x1': f_x1,
-            'status': status,
-        })
+    return convergence_figure(result, 'f_x1', 'Grafik Konvergensi Metode Secant', 'f(x)')
+
 
-         # Cek apakah nilai f_x1 mendekati nol
-        if abs(f_x1) < tol:
-            break
+def kunci_cache(post, f_expr, tol, max_iter):
+    # Kunci cache hasil dari input form yang sudah dinormalisasi
+    if post.get('mode') == 'all':
+        return solve_input(
+            'secant-all', f_expr=f_expr, tol=tol, max_iter=max_iter,
+            lo=float(post.get('lo')), hi=float(post.get('hi')), n_starts=post.get('n_starts') or '',
+        )
+    return solve_input(
+        'secant', f_expr=f_expr, tol=tol, max_iter=max_iter, x0=float(post.get('x0')), x1=float(post.get('x1')),
+    )
 
-        # Update nilai untuk iterasi berikutnya
-        x0, x1 = x1, x2
-    print(iterations)
-    return iterations, None
 
-def index(req):
+async def hitung(post, f_expr, tol, max_iter):
+    """
+    Menjalankan solver dan membuat grafiknya untuk satu input form.
+
+    Returns:
+    dict: Entri cache hasil berisi result, roots, error_message, dan chart (JSON figure atau None).
+    """
+    entry = {'result': None, 'roots': None, 'error_message': None, 'chart': None}
+    if post.get('mode') == 'all':
+        # Mode cari semua akar: grid titik awal di [lo, hi] diiterasi bersamaan
+        entry['roots'], _, fig = await solve_all_roots(
+            post, 'secant', f_expr, tol, max_iter, 'Akar-akar f(x) Metode Secant'
+        )
+        if fig:
+            with phase('chart'):
+                entry['chart'] = await run_in_thread(figure_to_json, fig)
+    else:
+        x0 = float(post.get('x0'))
+        x1 = float(post.get('x1'))
+
+        # Jalankan metode Secant
+        with phase('solve'):
+            result, entry['error_message'] = await run_in_pool(metode_secant, f_expr, x0, x1, tol, max_iter)
+        entry['result'] = result
+
+        # Membuat grafik menggunakan Plotly jika hasil ada hasil
+        if result:
+            with phase('chart'):
+                entry['chart'] = await run_in_thread(build_figure_json, grafik_konvergensi, result)
+    return entry
+
+
+async def index(req):
     """
     Fungsi view untuk menangani permintaan halaman utama dan menghitung akar menggunakan metode secant.
 
+    View async: solver dijalankan di pool proses dan grafik serta template dirender
+    di thread executor, sehingga event loop ASGI tetap melayani request lain.
+    Hasil dan JSON grafiknya disimpan di cache hasil (core.result_cache).
+
     Parameters:
     request (HttpRequest): Objek permintaan dari pengguna.
 
     Returns:
     HttpResponse: Halaman HTML yang dirender.
     """
-    result = None
+    entry = {}
     error_message = None
-    plot_div = None
+    chart = None
 
     if req.method == 'POST':
         try:
             # Mengambil input dari pengguna
-            f_expr = req.POST.get('f_expr')
-            x0 = float(req.POST.get('x0'))
-            x1 = float(req.POST.get('x1'))
-            tol = float(req.POST.get('tol'))
-            max_iter = int(req.POST.get('max_iter'))
-
-            # Jalankan metode Secant
-            result, error_message = metode_secant(f_expr, x0, x1, tol, max_iter)
-
-            # Membuat grafik menggunakan Plotly jika hasil ada hasil
-            if result:
-                # Membuat data yang akan digunakan untuk membuat plot
-                x_values = [info['iteration'] for info in result]
-                y_values = [info['f_x1'] for info in result]
-
-                trace = go.Scatter(
-                    x=x_values,
-                    y=y_values,
-                    mode='lines+markers',
-                    name='f(x)',
-                    line=dict(color='royalblue', width=2),
-                    marker=dict(size=6)
-                )
-
-                layout = go.Layout(
-                    title='Grafik Konvergensi Metode Secant',
-                    xaxis=dict(title='Iterasi'),
-                    yaxis=dict(title='f(x)'),
-                    template='plotly_white'
-                )
-
-                fig = go.Figure(data=[trace], layout=layout)
-                plot_div = pio.to_html(fig, full_html=False)
+            with phase('parse'):
+                f_expr = req.POST.get('f_expr')
+                tol = float(req.POST.get('tol'))
+                max_iter = int(req.POST.get('max_iter'))
+                key = kunci_cache(req.POST, f_expr, tol, max_iter)
+            entry, _ = await cached_result(key, lambda: hitung(req.POST, f_expr, tol, max_iter))
+            error_message = entry['error_message']
+
+            if entry['chart']:
+                # Mode JSON saja: klien merender grafiknya sendiri
+                if wants_chart_json(req):
+                    return chart_json_response(entry['chart'])
+                with phase('chart'):
+                    chart = render_chart(entry['chart'])
 
         except ValueError:
             error_message = "Masukan nilai numerik yang valid kkk."
         except (SyntaxError, NameError):
             error_message = "Masukan fungsi ekspresi yang valid."
-
-    return render(req, 'secant/pages/index.html', {
-        'result': result,
-        'error_message': error_message,
-        'plot_div': plot_div,
-        'f_expr': req.POST.get('f_expr'),
-        'x0': req.POST.get('x0'),
-        'x1': req.POST.get('x1'),
-        'tol': req.POST.get('tol'),
-        'max_iter': req.POST.get('max_iter')
-    })
+        except SolverTimeout as exc:
+            error_message = str(exc)
+
+    with phase('render'):
+        return await run_in_thread(render, req, 'secant/pages/index.html', {
+            'result': entry.get('result'),
+            'roots': entry.get('roots'),
+            'error_message': error_message,
+            'chart': chart,
+            'f_expr': req.POST.get('f_expr'),
+            'x0': req.POST.get('x0'),
+            'x1': req.POST.get('x1'),
+            'tol': req.POST.get('tol'),
+            'max_iter': req.POST.get('max_iter'),
+            'lo': req.POST.get('lo'),
+            'hi': req.POST.get('hi'),
+            'n_starts': req.POST.get('n_starts'),
+        })
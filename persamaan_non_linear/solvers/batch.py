@@ -0,0 +1,87 @@
+"""
+Penyelesaian banyak soal pencarian akar dalam satu panggilan.
+
+Soal-soal dikelompokkan berdasarkan ekspresi yang sudah dinormalisasi. Setiap
+kelompok cukup dikompilasi sekali (lewat cache ekspresi) lalu semua titik
+awalnya diiterasi bersamaan dengan mesin tervektorisasi.
+
+Regula Falsi memakai compiler ekspresinya sendiri (solvers.math_expression),
+dan soalnya berisi interval a dan b sebagai ganti titik awal.
+"""
+import math
+from collections import defaultdict
+
+import numpy as np
+
+from .expression import get_compiled, normalize_expression
+from .math_expression import compile_vectorized
+from .vectorized import CONVERGED, STATUS_NAMES, newton_vectorized, regula_falsi_vectorized, secant_vectorized
+
+METHODS = ('newton-raphson', 'secant', 'regula-falsi')
+
+# Error yang mungkin muncul saat mem-parse ekspresi dari pengguna
+EXPRESSION_ERRORS = (SyntaxError, NameError, TypeError, ValueError)
+
+
+def _to_json_numbers(values):
+    # NaN/inf tidak valid di JSON, diganti None
+    return [value if math.isfinite(value) else None for value in values.tolist()]
+
+
+def solve_batch(method, problems):
+    """
+    Menyelesaikan daftar soal dengan metode yang sama.
+
+    Parameters:
+    method (str): 'newton-raphson', 'secant', atau 'regula-falsi'.
+    problems (list): Dict per soal berisi f_expr, x0 (dan x1 untuk secant) atau a dan b (regula-falsi),
+        tol, dan max_iter.
+
+    Returns:
+    list: Hasil per soal sesuai urutan input, berisi root, iterations, status, dan converged.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Metode '{method}' tidak dikenal.")
+
+    groups = defaultdict(list)
+    for index, problem in enumerate(problems):
+        groups[normalize_expression(problem['f_expr'])].append(index)
+
+    results = [None] * len(problems)
+    for f_expr, indices in groups.items():
+        try:
+            compiled = compile_vectorized(f_expr) if method == 'regula-falsi' else get_compiled(f_expr)
+        except EXPRESSION_ERRORS:
+            for index in indices:
+                results[index] = {'status': 'invalid_expression', 'converged': False}
+            continue
+
+        group = [problems[index] for index in indices]
+        tol = np.array([problem['tol'] for problem in group], dtype=float)
+        max_iter = np.array([problem['max_iter'] for problem in group], dtype=np.int64)
+
+        if method == 'regula-falsi':
+            a = np.array([problem['a'] for problem in group], dtype=float)
+            b = np.array([problem['b'] for problem in group], dtype=float)
+            output = regula_falsi_vectorized(compiled, a, b, tol, max_iter)
+        elif method == 'newton-raphson':
+            x0 = np.array([problem['x0'] for problem in group], dtype=float)
+            output = newton_vectorized(compiled.f, compiled.f_prime_fn, x0, tol, max_iter)
+        else:
+            x0 = np.array([problem['x0'] for problem in group], dtype=float)
+            x1 = np.array([problem['x1'] for problem in group], dtype=float)
+            output = secant_vectorized(compiled.f, x0, x1, tol, max_iter)
+
+        lanes = zip(
+            indices, _to_json_numbers(output.root), _to_json_numbers(output.f_root),
+            output.iterations.tolist(), output.status.tolist(),
+        )
+        for index, root, f_root, iterations, status in lanes:
+            results[index] = {
+                'root': root,
+                'f_root': f_root,
+                'iterations': iterations,
+                'status': STATUS_NAMES[status],
+                'converged': status == CONVERGED,
+            }
+    return results
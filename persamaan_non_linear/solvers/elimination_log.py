@@ -0,0 +1,115 @@
+"""
+Log operasi baris untuk langkah-langkah eliminasi Gauss.
+
+Alih-alih menyalin seluruh matriks augmented setelah setiap operasi baris,
+yang disimpan hanya matriks awal dan daftar operasinya (tukar baris,
+normalisasi, eliminasi). Matriks untuk langkah ke-k dibangun ulang saat
+dibutuhkan dengan memutar ulang operasi, sehingga memori trace tumbuh sesuai
+jumlah operasi, bukan ukuran matriks dikali jumlah langkah.
+"""
+import numpy as np
+
+SWAP = 'swap'
+NORMALIZE = 'normalize'
+ELIMINATE = 'eliminate'
+
+
+def apply_operation(matrix, operation):
+    """
+    Menerapkan satu operasi baris ke matriks secara in-place.
+
+    Operasi dihitung dengan ekspresi yang sama seperti saat eliminasi berjalan,
+    sehingga hasil pemutaran ulang identik bit demi bit.
+    """
+    kind, row, other, value = operation
+    if kind == SWAP:
+        matrix[[row, other]] = matrix[[other, row]]
+    elif kind == NORMALIZE:
+        matrix[row] = matrix[row] / value
+    else:
+        matrix[row] = matrix[row] - value * matrix[other]
+
+
+class EliminationLog:
+    """
+    Urutan langkah eliminasi yang disimpan sebagai operasi baris.
+
+    Objek ini berperilaku seperti list matriks: mendukung len(), iterasi, dan
+    indeks/slice, tetapi setiap matriks baru dibuat saat diminta.
+    """
+
+    def __init__(self, initial):
+        self.initial = np.array(initial, dtype=float)
+        self.operations = []
+        self.descriptions = []
+
+    def record(self, kind, row, other, value, description):
+        """Mencatat satu operasi baris beserta deskripsinya."""
+        self.operations.append((kind, row, other, value))
+        self.descriptions.append(description)
+
+    def swap(self, row, other, description):
+        self.record(SWAP, row, other, None, description)
+
+    def normalize(self, row, pivot, description):
+        self.record(NORMALIZE, row, None, pivot, description)
+
+    def eliminate(self, row, pivot_row, factor, description):
+        self.record(ELIMINATE, row, pivot_row, factor, description)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __bool__(self):
+        return bool(self.operations)
+
+    def iter_steps(self, start=0, stop=None):
+        """
+        Menghasilkan matriks setelah operasi ke-start sampai sebelum stop.
+
+        Operasi sebelum start diputar ulang tanpa disalin, lalu setiap langkah
+        di rentang yang diminta dikembalikan sebagai salinan tersendiri.
+        """
+        stop = len(self.operations) if stop is None else min(stop, len(self.operations))
+        matrix = self.initial.copy()
+        for index in range(stop):
+            apply_operation(matrix, self.operations[index])
+            if index >= start:
+                yield matrix.copy()
+
+    def __iter__(self):
+        return self.iter_steps()
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return list(self.iter_steps(start, stop))[::step]
+        index = key + len(self) if key < 0 else key
+        if not 0 <= index < len(self):
+            raise IndexError("Langkah eliminasi di luar jangkauan.")
+        return next(self.iter_steps(index, index + 1))
+
+    def pairs(self, start=0, stop=None):
+        """
+        Pasangan (matriks, deskripsi) yang dibuat saat diiterasi.
+
+        Returns:
+        StepPairs: Iterable berukuran tetap, aman dipakai di tag {% for %} tanpa membuat semua matriks sekaligus.
+        """
+        return StepPairs(self, start, stop)
+
+
+class StepPairs:
+    """Pasangan (matriks, deskripsi) untuk rentang langkah tertentu dari EliminationLog."""
+
+    def __init__(self, log, start=0, stop=None):
+        self.log = log
+        self.start = max(start, 0)
+        self.stop = len(log) if stop is None else min(stop, len(log))
+
+    def __len__(self):
+        return max(self.stop - self.start, 0)
+
+    def __iter__(self):
+        descriptions = self.log.descriptions[self.start:self.stop]
+        return zip(self.log.iter_steps(self.start, self.stop), descriptions)
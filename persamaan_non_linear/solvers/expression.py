@@ -0,0 +1,77 @@
+"""
+Cache ekspresi terkompilasi yang dipakai bersama oleh metode Newton Raphson dan Secant.
+
+Proses sympify, diff, dan lambdify jauh lebih mahal daripada iterasinya sendiri,
+sehingga hasilnya disimpan di cache LRU per proses dengan kunci string ekspresi
+yang sudah dinormalisasi.
+
+SymPy baru diimpor saat ekspresi pertama dikompilasi. Import-nya memakan
+sekitar setengah detik, dan tidak perlu dibayar oleh proses yang hanya
+melayani Gauss, Regula Falsi, atau request dari cache.
+"""
+from collections import namedtuple
+
+from .lru import LRUCache
+
+# Hasil kompilasi sebuah ekspresi: ekspresi sympy, turunannya, dan fungsi Python-nya
+CompiledExpression = namedtuple('CompiledExpression', ['expr', 'f_prime', 'f', 'f_prime_fn'])
+
+
+def normalize_expression(f_expr):
+    """
+    Menormalisasi string ekspresi agar penulisan yang hanya berbeda spasi memakai entri cache yang sama.
+
+    Parameters:
+    f_expr (str): Ekspresi fungsi sebagai string.
+
+    Returns:
+    str: Ekspresi tanpa spasi di awal/akhir dan dengan spasi berulang diringkas.
+    """
+    if f_expr is None:
+        raise SyntaxError("Ekspresi fungsi kosong.")
+    return ' '.join(f_expr.split())
+
+
+def compile_expression(f_expr):
+    """
+    Mengubah string ekspresi menjadi ekspresi sympy beserta turunan dan fungsi lambdify-nya.
+
+    Parameters:
+    f_expr (str): Ekspresi fungsi yang sudah dinormalisasi.
+
+    Returns:
+    CompiledExpression: Ekspresi, turunan pertama, f(x), dan f'(x).
+    """
+    import sympy as sp
+
+    x = sp.Symbol('x')  # Simbol variabel yang dipakai di semua ekspresi
+    f = sp.sympify(f_expr, locals={'e': sp.exp(1)})  # Mengubah string menjadi ekspresi
+    f_prime = sp.diff(f, x)  # Menghitung turunan pertama dari f
+    return CompiledExpression(f, f_prime, sp.lambdify(x, f), sp.lambdify(x, f_prime))
+
+
+class ExpressionCache(LRUCache):
+    """Cache LRU untuk ekspresi terkompilasi dengan kunci string ekspresi yang sudah dinormalisasi."""
+
+    def get(self, f_expr):
+        """
+        Mengambil ekspresi terkompilasi dari cache, atau mengompilasinya jika belum ada.
+
+        Parameters:
+        f_expr (str): Ekspresi fungsi sebagai string.
+
+        Returns:
+        CompiledExpression: Hasil kompilasi ekspresi.
+        """
+        # Ekspresi yang gagal di-parse tidak disimpan, error diteruskan ke pemanggil
+        compiled, _ = self.get_or_create(normalize_expression(f_expr), compile_expression)
+        return compiled
+
+
+# Cache bersama untuk seluruh proses
+expression_cache = ExpressionCache()
+
+
+def get_compiled(f_expr):
+    """Shortcut untuk mengambil ekspresi terkompilasi dari cache bersama."""
+    return expression_cache.get(f_expr)
@@ -0,0 +1,110 @@
+"""
+Eliminasi Gauss langkah demi langkah dengan substitusi balik.
+
+Setiap operasi baris dicatat di EliminationLog dan diberi deskripsi teks agar
+bisa ditampilkan sebagai materi pembelajaran. Modul ini tidak bergantung pada
+Django; cache log dan halamannya ada di gaus.views.
+"""
+import numpy as np
+
+from .elimination_log import EliminationLog
+
+
+def matriks_augmented(matrix, results):
+    # Mengubah matriks input dan hasil menjadi matriks augmented
+    augmented_matrix = np.array(matrix, dtype=float)
+    results_vector = np.array(results, dtype=float).reshape(-1, 1)
+    return np.hstack((augmented_matrix, results_vector))
+
+
+def langkah_eliminasi(augmented_matrix, steps, descriptions):
+    """
+    Eliminasi maju secara in-place yang menghasilkan setiap langkah segera setelah dikerjakan.
+
+    Parameters:
+    augmented_matrix (ndarray): Matriks augmented yang akan dieliminasi.
+    steps (EliminationLog): Log tempat operasi baris dicatat.
+    descriptions (list): List tempat deskripsi langkah ditambahkan.
+
+    Yields:
+    tuple: Matriks augmented saat ini (bukan salinan) dan deskripsi langkahnya.
+    """
+    n = augmented_matrix.shape[0]
+
+    # Forward Elimination
+    for i in range(n):
+        # Pivoting jika elemen diagonal utama adalah nol
+        if augmented_matrix[i, i] == 0:
+            for k in range(i + 1, n):
+                if augmented_matrix[k, i] != 0:
+                    augmented_matrix[[i, k]] = augmented_matrix[[k, i]]
+                    descriptions.append(f"Menukar baris {i + 1} dengan baris {k + 1} karena elemen pivot bernilai nol.")
+                    steps.swap(i, k, descriptions[-1])
+                    yield augmented_matrix, descriptions[-1]
+                    break
+            else:
+                raise np.linalg.LinAlgError("Tidak ada solusi unik.")
+        
+        # Normalisasi baris pivot
+        pivot_value = augmented_matrix[i, i]
+        augmented_matrix[i] = augmented_matrix[i] / pivot_value
+        descriptions.append(f"Normalisasi baris {i + 1} dengan membagi semua elemen dengan {int(pivot_value) if pivot_value.is_integer() else pivot_value}.")
+        steps.normalize(i, pivot_value, descriptions[-1])
+        yield augmented_matrix, descriptions[-1]
+
+        # Eliminasi untuk membuat nol di bawah elemen pivot
+        for j in range(i + 1, n):
+            factor = augmented_matrix[j, i]
+            augmented_matrix[j] = augmented_matrix[j] - factor * augmented_matrix[i]
+            descriptions.append(f"Mengurangi baris {j + 1} dengan baris {i + 1} dikalikan {int(factor) if factor.is_integer() else factor} untuk membuat elemen di bawah pivot menjadi nol.")
+            steps.eliminate(j, i, factor, descriptions[-1])
+            yield augmented_matrix, descriptions[-1]
+
+
+def substitusi_balik(augmented_matrix, descriptions):
+    """
+    Substitusi balik pada matriks augmented yang sudah berbentuk segitiga atas.
+
+    Returns:
+    tuple: Vektor solusi x dan langkah-langkah substitusi balik dengan detail persamaan.
+    """
+    n = augmented_matrix.shape[0]
+
+    # Back Substitution
+    x = np.zeros(n)
+    back_sub_steps = []  # Untuk menyimpan langkah back substitution dengan detail persamaan
+    for i in range(n - 1, -1, -1):
+        sum_ax = np.sum(augmented_matrix[i, i + 1:n] * x[i + 1:n])
+        x[i] = augmented_matrix[i, -1] - sum_ax
+        equation = " + ".join([f"{augmented_matrix[i, j]}*x{j + 1}" for j in range(i + 1, n) if augmented_matrix[i, j] != 0])
+        if equation:
+            equation = f"{augmented_matrix[i, i]}*x{i + 1} + {equation} = {augmented_matrix[i, -1]}"
+        else:
+            equation = f"{augmented_matrix[i, i]}*x{i + 1} = {augmented_matrix[i, -1]}"
+        variable_name = chr(120 + i)  # Menggunakan ASCII untuk mendapatkan nama variabel (x, y, z, dst.)
+        back_sub_steps.append(f"{equation}\n   {variable_name} = {x[i]}")
+        descriptions.append(f"Melakukan substitusi balik untuk menghitung nilai {variable_name}.")
+
+    # Mengganti nilai -0.0 dengan 0.0 untuk kejelasan di augmented matrix dan hasil
+    augmented_matrix[augmented_matrix == -0.0] = 0.0
+    x[x == -0.0] = 0.0
+
+    return x, back_sub_steps
+
+
+# Fungsi Metode Eliminasi Gauss
+def eliminasi_gauss(matrix, results):
+    augmented_matrix = matriks_augmented(matrix, results)
+
+    # Langkah eliminasi dicatat sebagai operasi baris, matriksnya dibangun ulang saat ditampilkan
+    steps = EliminationLog(augmented_matrix)
+    descriptions = []  # Untuk menyimpan deskripsi langkah
+
+    try:
+        for _ in langkah_eliminasi(augmented_matrix, steps, descriptions):
+            pass
+    except np.linalg.LinAlgError as exc:
+        return None, str(exc)
+
+    x, back_sub_steps = substitusi_balik(augmented_matrix, descriptions)
+    return steps, descriptions, x, back_sub_steps
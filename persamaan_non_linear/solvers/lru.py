@@ -0,0 +1,83 @@
+"""
+Cache LRU sederhana per proses yang dipakai oleh cache ekspresi dan cache faktorisasi LU.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU dengan batas jumlah entri dan penghitung hit/miss.
+
+    Aman dipakai dari beberapa thread; nilai baru dibuat di luar lock sehingga
+    pembuatan yang lambat tidak menahan permintaan lain.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """
+        Mengambil nilai dari cache tanpa membuatnya.
+
+        Returns:
+        object: Nilai yang tersimpan, atau None jika belum ada (dihitung sebagai miss).
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def store(self, key, value):
+        """Menyimpan nilai dan membuang entri yang paling lama tidak dipakai jika cache penuh."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """
+        Mengambil nilai dari cache, atau membuatnya dengan factory(key) jika belum ada.
+
+        Nilai yang gagal dibuat (factory melempar error) tidak disimpan.
+
+        Returns:
+        tuple: Nilai dan boolean apakah nilai berasal dari cache.
+        """
+        value = self.lookup(key)
+        if value is not None:
+            return value, True
+        value = factory(key)
+        self.store(key, value)
+        return value, False
+
+    def clear(self):
+        """Mengosongkan cache dan mereset penghitung."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Mengembalikan statistik cache.
+
+        Returns:
+        dict: Jumlah hit, miss, ukuran saat ini, dan ukuran maksimum.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
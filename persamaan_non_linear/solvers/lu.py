@@ -0,0 +1,88 @@
+"""
+Penyelesaian sistem persamaan linear lewat faktorisasi LU dengan pivoting parsial (LAPACK).
+
+Faktorisasi disimpan di cache dengan kunci hash isi matriks, sehingga
+menyelesaikan ulang matriks A yang sama dengan vektor hasil baru hanya butuh
+substitusi maju/mundur O(n²), bukan faktorisasi ulang O(n³).
+
+scipy.linalg diimpor saat faktorisasi pertama, bukan saat modul dimuat:
+matrix_key dipakai oleh cache hasil di setiap request dan hanya butuh NumPy.
+"""
+import hashlib
+import warnings
+
+import numpy as np
+
+from .lru import LRUCache
+
+# Faktorisasi matriks besar memakan memori n² float, jadi jumlah entrinya dibatasi kecil
+factorization_cache = LRUCache(maxsize=16)
+
+
+def matrix_key(matrix):
+    """
+    Menghitung kunci cache dari bentuk dan isi matriks.
+
+    Parameters:
+    matrix (ndarray): Matriks koefisien float64.
+
+    Returns:
+    str: Hash BLAKE2b dari ukuran dan byte matriks.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+    digest = hashlib.blake2b(str(matrix.shape).encode(), digest_size=16)
+    # Buffer matriks di-hash langsung tanpa disalin (tobytes membuat salinan sebesar matriks)
+    digest.update(memoryview(matrix).cast('B'))
+    return digest.hexdigest()
+
+
+def factorize(matrix):
+    """
+    Menghitung faktorisasi LU dari matriks persegi.
+
+    Parameters:
+    matrix (ndarray): Matriks koefisien.
+
+    Returns:
+    tuple: (lu, piv) seperti yang dikembalikan scipy.linalg.lu_factor.
+    """
+    from scipy.linalg import LinAlgWarning, lu_factor
+
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Matriks koefisien harus persegi.")
+    with warnings.catch_warnings():
+        # Matriks singular dilaporkan lewat LinAlgError di bawah, bukan warning
+        warnings.simplefilter('ignore', LinAlgWarning)
+        lu, piv = lu_factor(matrix, check_finite=True)
+    if not np.all(np.diag(lu)):
+        raise np.linalg.LinAlgError("Tidak ada solusi unik.")
+    return lu, piv
+
+
+def solve_lu(matrix, results, use_cache=True):
+    """
+    Menyelesaikan Ax = b dengan faktorisasi LU, memakai ulang faktorisasi dari cache jika ada.
+
+    Parameters:
+    matrix (array_like): Matriks koefisien A berukuran n x n.
+    results (array_like): Vektor hasil b berukuran n, atau matriks n x k untuk k ruas kanan sekaligus.
+    use_cache (bool): Simpan dan pakai ulang faktorisasi dari cache.
+
+    Returns:
+    tuple: Solusi x dan boolean apakah faktorisasi berasal dari cache.
+    """
+    from scipy.linalg import lu_solve
+
+    matrix = np.asarray(matrix, dtype=float)
+    results = np.asarray(results, dtype=float)
+    if results.shape[0] != matrix.shape[0]:
+        raise ValueError("Ukuran vektor hasil tidak sesuai dengan matriks.")
+
+    if use_cache:
+        factors, cached = factorization_cache.get_or_create(
+            matrix_key(matrix), lambda key: factorize(matrix)
+        )
+    else:
+        factors, cached = factorize(matrix), False
+    return lu_solve(factors, results, check_finite=False), cached
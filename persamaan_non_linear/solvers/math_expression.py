@@ -0,0 +1,186 @@
+"""
+Kompilasi ekspresi berbasis whitelist AST untuk metode Regula Falsi.
+
+String fungsi dari pengguna di-parse sekali menjadi AST, diperiksa terhadap
+whitelist (angka, variabel x, operator aritmatika, dan fungsi matematika),
+lalu dikompilasi menjadi fungsi Python biasa. Fungsi yang sama juga tersedia
+dalam versi NumPy sehingga bisa dievaluasi langsung pada array.
+
+Berbeda dengan solvers.expression (sympy), compiler ini tidak membentuk turunan;
+Regula Falsi tidak memerlukannya dan tetap memakai sintaks aslinya (math.sin, ^).
+"""
+import ast
+import io
+import math
+import tokenize
+from functools import lru_cache
+
+import numpy as np
+
+# Fungsi dan konstanta yang boleh dipakai, untuk evaluasi skalar (math) dan array (NumPy)
+MATH_NAMESPACE = {
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
+    'sinh': math.sinh, 'cosh': math.cosh, 'tanh': math.tanh,
+    'exp': math.exp, 'log': math.log, 'log10': math.log10, 'log2': math.log2,
+    'sqrt': math.sqrt, 'fabs': math.fabs, 'abs': abs,
+    'pi': math.pi, 'e': math.e,
+}
+
+NUMPY_NAMESPACE = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'exp': np.exp, 'log': np.log, 'log10': np.log10, 'log2': np.log2,
+    'sqrt': np.sqrt, 'fabs': np.fabs, 'abs': np.abs,
+    'pi': np.pi, 'e': np.e,
+}
+
+FUNCTIONS = {name for name, value in MATH_NAMESPACE.items() if callable(value)}
+CONSTANTS = {name for name, value in MATH_NAMESPACE.items() if not callable(value)}
+VARIABLE = 'x'
+
+ALLOWED_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod)
+ALLOWED_UNARYOPS = (ast.UAdd, ast.USub)
+
+
+class _ExpressionValidator(ast.NodeTransformer):
+    """
+    Memeriksa setiap node AST terhadap whitelist dan menormalkan penulisannya.
+
+    `math.sin(x)` diubah menjadi `sin(x)` dan bilangan bulat diubah menjadi float agar pangkat besar berakhir
+    dengan OverflowError, bukan perhitungan bilangan bulat raksasa.
+    """
+
+    def visit_Expression(self, node):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_BinOp(self, node):
+        if not isinstance(node.op, ALLOWED_BINOPS):
+            raise SyntaxError(f"Operator {type(node.op).__name__} tidak diizinkan.")
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_UnaryOp(self, node):
+        if not isinstance(node.op, ALLOWED_UNARYOPS):
+            raise SyntaxError(f"Operator {type(node.op).__name__} tidak diizinkan.")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise SyntaxError("Hanya konstanta numerik yang diizinkan.")
+        try:
+            value = float(node.value)
+        except OverflowError:
+            raise SyntaxError("Konstanta terlalu besar.") from None
+        return ast.copy_location(ast.Constant(value), node)
+
+    def visit_Name(self, node):
+        if node.id != VARIABLE and node.id not in CONSTANTS:
+            raise NameError(f"Nama '{node.id}' tidak dikenal.")
+        return node
+
+    def visit_Attribute(self, node):
+        # Mendukung penulisan lama seperti math.pi
+        name = self._math_attribute(node)
+        if name not in CONSTANTS:
+            raise NameError(f"Nama 'math.{name}' tidak dikenal.")
+        return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+
+    def visit_Call(self, node):
+        # Mendukung sin(x) maupun math.sin(x)
+        if isinstance(node.func, ast.Attribute):
+            name = self._math_attribute(node.func)
+        elif isinstance(node.func, ast.Name):
+            name = node.func.id
+        else:
+            raise SyntaxError("Hanya fungsi matematika yang boleh dipanggil.")
+        if name not in FUNCTIONS:
+            raise NameError(f"Fungsi '{name}' tidak dikenal.")
+        if node.keywords:
+            raise SyntaxError("Argumen keyword tidak diizinkan.")
+        node.func = ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node.func)
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    @staticmethod
+    def _math_attribute(node):
+        if not (isinstance(node.value, ast.Name) and node.value.id == 'math'):
+            raise SyntaxError("Atribut hanya diizinkan untuk modul math.")
+        return node.attr
+
+    def generic_visit(self, node):
+        raise SyntaxError(f"Bagian ekspresi '{type(node).__name__}' tidak diizinkan.")
+
+
+def _caret_to_pow(f_expression):
+    # `^` diganti `**` per token sebelum parse, agar ikut presedensi pangkat (x^2-2 = x**2 - 2);
+    # menukar BitXor setelah parse akan mempertahankan presedensi XOR yang rendah
+    try:
+        tokens = [
+            (tokenize.OP, '**') if tok.type == tokenize.OP and tok.string == '^' else tok[:2]
+            for tok in tokenize.generate_tokens(io.StringIO(f_expression).readline)
+        ]
+    except tokenize.TokenError as exc:
+        raise SyntaxError(f"Ekspresi tidak lengkap: {exc.args[0]}") from exc
+    return tokenize.untokenize(tokens)
+
+
+def parse_expression(f_expression):
+    """
+    Mem-parse dan memvalidasi string ekspresi menjadi AST.
+
+    Parameters:
+    f_expression (str): Ekspresi fungsi sebagai string, misalnya 'math.exp(-x) - x'.
+
+    Returns:
+    ast.Expression: AST yang sudah divalidasi.
+    """
+    if not f_expression or not f_expression.strip():
+        raise SyntaxError("Ekspresi fungsi kosong.")
+    tree = ast.parse(_caret_to_pow(f_expression.strip()), mode='eval')
+    return ast.fix_missing_locations(_ExpressionValidator().visit(tree))
+
+
+def _build_function(tree, namespace):
+    # Membungkus ekspresi menjadi `lambda x: <ekspresi>` lalu mengompilasinya sekali
+    func = ast.Expression(body=ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=VARIABLE)], kwonlyargs=[],
+            kw_defaults=[], defaults=[],
+        ),
+        body=tree.body,
+    ))
+    code = compile(ast.fix_missing_locations(func), '<f(x)>', 'eval')
+    return eval(code, {'__builtins__': {}, **namespace})
+
+
+@lru_cache(maxsize=256)
+def compile_expression(f_expression):
+    """
+    Mengompilasi ekspresi menjadi fungsi skalar f(x).
+
+    Parameters:
+    f_expression (str): Ekspresi fungsi sebagai string.
+
+    Returns:
+    function: Fungsi f(x) yang menerima dan mengembalikan float.
+    """
+    return _build_function(parse_expression(f_expression), MATH_NAMESPACE)
+
+
+@lru_cache(maxsize=256)
+def compile_vectorized(f_expression):
+    """
+    Mengompilasi ekspresi menjadi fungsi yang bekerja pada array NumPy.
+
+    Parameters:
+    f_expression (str): Ekspresi fungsi sebagai string.
+
+    Returns:
+    function: Fungsi f(x) yang menerima ndarray dan mengembalikan ndarray.
+    """
+    return _build_function(parse_expression(f_expression), NUMPY_NAMESPACE)
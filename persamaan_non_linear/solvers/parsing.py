@@ -0,0 +1,225 @@
+"""
+Parser cepat untuk input matriks dan vektor berupa teks.
+
+Menerima list bersarang ([[1, 2], [3, 4]]), teks CSV/whitespace dengan satu baris
+matriks per baris teks (atau dipisah ';'), dan isi file teks yang diunggah.
+Setiap baris di-parse langsung oleh NumPy ke dalam buffer float64 yang sudah
+dialokasikan, tanpa membangun AST Python atau list bersarang lebih dulu.
+Ukuran matriks diperiksa sebelum buffer dialokasikan.
+
+File biner NumPy (.npy/.npz) dibaca tanpa parsing teks sama sekali. File .npy
+yang sudah tersimpan di disk dibuka sebagai memory map, sehingga isinya tidak
+disalin ke RAM.
+"""
+import re
+
+import numpy as np
+
+# Batas ukuran sistem (n x n) yang boleh di-parse dari input teks
+MAX_DIMENSION = 2000
+
+# Batas panjang teks input (karakter), diperiksa sebelum parsing dimulai
+MAX_INPUT_LENGTH = 128 * 1024 * 1024
+
+# Batas ukuran untuk file .npy/.npz; lebih longgar dari input teks karena tidak ada parsing teks
+MAX_BINARY_DIMENSION = 10000
+
+# Ekstensi file yang dibaca sebagai array biner NumPy
+BINARY_EXTENSIONS = ('.npy', '.npz')
+
+# Nama array yang dicari di dalam file .npz, sesuai jumlah dimensinya
+NPZ_KEYS = {2: ('matrix', 'A', 'a'), 1: ('results', 'b', 'B')}
+
+# Baris di dalam list bersarang: isi di antara '[' dan ']' tanpa kurung lain di dalamnya.
+# Setiap percobaan berhenti di kurung berikutnya, sehingga pencariannya linear terhadap panjang teks.
+_NESTED_ROW = re.compile(r'\[([^\[\]]*)\]')
+# Nilai kosong: koma di awal, dua koma berturut-turut, atau koma di akhir
+_EMPTY_VALUE = re.compile(r'^\s*,|,\s*(?:,|$)')
+_ROW_SEPARATOR = re.compile(r'[\n;]')
+# Koma dan tab diperlakukan sama seperti spasi
+_VALUE_SEPARATORS = str.maketrans(',\t\r', '   ')
+
+
+class MatrixParseError(ValueError):
+    """Input matriks/vektor tidak dapat di-parse; pesannya aman ditampilkan ke pengguna."""
+
+
+def _check_length(text):
+    if text is None or not text.strip():
+        raise MatrixParseError("Input matriks dan hasil wajib diisi.")
+    if len(text) > MAX_INPUT_LENGTH:
+        raise MatrixParseError(f"Input terlalu besar (maksimal {MAX_INPUT_LENGTH // (1024 * 1024)} MB).")
+    return text.strip().replace('(', '[').replace(')', ']')
+
+
+def _check_dimension(n):
+    if n > MAX_DIMENSION:
+        raise MatrixParseError(f"Ukuran matriks maksimal {MAX_DIMENSION} x {MAX_DIMENSION}.")
+
+
+def _parse_values(text, out=None):
+    # Mem-parse satu baris angka; teks kosong ditolak karena np.fromstring mengembalikan [-1.] untuknya.
+    # Koma berturut-turut juga ditolak: setelah koma diganti spasi, nilai kosong akan hilang tanpa error
+    if _EMPTY_VALUE.search(text):
+        raise MatrixParseError("Input tidak boleh berisi nilai kosong di antara koma.")
+    text = text.translate(_VALUE_SEPARATORS)
+    if not text.strip():
+        raise MatrixParseError("Baris matriks tidak boleh kosong.")
+    try:
+        values = np.fromstring(text, dtype=np.float64, sep=' ')
+    except ValueError:
+        raise MatrixParseError("Input hanya boleh berisi angka.")
+    if not np.all(np.isfinite(values)):
+        raise MatrixParseError("Input hanya boleh berisi angka berhingga.")
+    if out is None:
+        return values
+    if values.size != out.size:
+        raise MatrixParseError("Matriks harus persegi.")
+    out[:] = values
+    return out
+
+
+def split_rows(text):
+    """
+    Memecah teks matriks menjadi teks per baris tanpa mem-parse angkanya.
+
+    Returns:
+    list: Teks setiap baris matriks.
+    """
+    text = _check_length(text)
+    if text.startswith('['):
+        return _split_nested(text)
+    return [row for row in _ROW_SEPARATOR.split(text) if row.strip()]
+
+
+def _split_nested(text):
+    # List bersarang [[...], [...]]: isi baris dan teks di antaranya dipisah dalam satu pass.
+    # Di antara baris hanya boleh ada spasi dan paling banyak satu koma.
+    if not text.endswith(']'):
+        raise MatrixParseError("Format list matriks tidak valid.")
+    parts = _NESTED_ROW.split(text[1:-1])
+    rows, separators = parts[1::2], parts[0::2]
+    if separators[0].strip() or any(separator.strip() not in ('', ',') for separator in separators[1:]):
+        raise MatrixParseError("Format list matriks tidak valid.")
+    return rows
+
+
+def parse_matrix(text):
+    """
+    Mem-parse matriks persegi dari teks.
+
+    Parameters:
+    text (str): List bersarang, atau teks CSV/whitespace dengan satu baris matriks per baris.
+
+    Returns:
+    ndarray: Matriks float64 berukuran n x n.
+    """
+    rows = split_rows(text)
+    n = len(rows)
+    if not n:
+        raise MatrixParseError("Matriks tidak boleh kosong.")
+    _check_dimension(n)
+    matrix = np.empty((n, n), dtype=np.float64)
+    for row, out in zip(rows, matrix):
+        _parse_values(row, out)
+    return matrix
+
+
+def parse_vector(text):
+    """
+    Mem-parse vektor dari teks: list ([1, 2, 3]), angka dipisah koma/spasi, atau satu angka per baris.
+
+    Returns:
+    ndarray: Vektor float64.
+    """
+    text = _check_length(text)
+    if text.startswith('['):
+        if text.count('[') != 1 or not text.endswith(']'):
+            raise MatrixParseError("Format list vektor tidak valid.")
+        text = text[1:-1]
+    values = _parse_values(text.replace('\n', ' ').replace(';', ' '))
+    _check_dimension(values.size)
+    return values
+
+
+def _read_header(fileobj):
+    # Membaca bentuk dan dtype dari header .npy tanpa membaca isi array
+    try:
+        version = np.lib.format.read_magic(fileobj)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(fileobj)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(fileobj)
+    except ValueError:
+        raise MatrixParseError("File bukan file .npy yang valid.")
+    return shape, dtype
+
+
+def _check_header(shape, dtype, ndim):
+    if dtype.hasobject or dtype.kind not in 'biuf':
+        raise MatrixParseError("Array harus berisi angka real.")
+    if len(shape) != ndim:
+        raise MatrixParseError("Matriks harus 2 dimensi." if ndim == 2 else "Vektor hasil harus 1 dimensi.")
+    if ndim == 2 and shape[0] != shape[1]:
+        raise MatrixParseError("Matriks harus persegi.")
+    if not shape[0]:
+        raise MatrixParseError("Array tidak boleh kosong.")
+    if shape[0] > MAX_BINARY_DIMENSION:
+        raise MatrixParseError(f"Ukuran matriks maksimal {MAX_BINARY_DIMENSION} x {MAX_BINARY_DIMENSION}.")
+
+
+def _as_float(array):
+    # Array float64 (termasuk memory map) dipakai apa adanya; dtype lain dikonversi sekali
+    if array.dtype != np.float64:
+        array = array.astype(np.float64)
+    if not np.isfinite(array).all():
+        raise MatrixParseError("Input hanya boleh berisi angka berhingga.")
+    return array
+
+
+def _load_npz(fileobj, ndim):
+    archive = np.load(fileobj, allow_pickle=False)
+    with archive:
+        keys = [key for key in NPZ_KEYS[ndim] if key in archive.files]
+        if not keys and len(archive.files) == 1:
+            keys = archive.files
+        if not keys:
+            raise MatrixParseError(f"File .npz harus berisi array bernama {' atau '.join(NPZ_KEYS[ndim])}.")
+        with archive.zip.open(f'{keys[0]}.npy') as member:
+            _check_header(*_read_header(member), ndim)
+        return archive[keys[0]]
+
+
+def load_binary(source, ndim):
+    """
+    Membaca matriks (ndim=2) atau vektor (ndim=1) dari file .npy/.npz.
+
+    Ukuran dan dtype diperiksa dari header sebelum isi array dibaca. Jika source
+    berupa path file .npy, array dibuka sebagai memory map read-only.
+
+    Parameters:
+    source (str atau file): Path file di disk, atau file object yang bisa di-seek.
+    ndim (int): 2 untuk matriks koefisien, 1 untuk vektor hasil.
+
+    Returns:
+    ndarray: Array float64 (np.memmap untuk file .npy float64 di disk).
+    """
+    is_path = isinstance(source, str)
+    fileobj = open(source, 'rb') if is_path else source
+    try:
+        fileobj.seek(0)
+        if fileobj.read(2) == b'PK':
+            # File .npz (arsip zip) tidak bisa di-memory map, array dibaca ke memori
+            fileobj.seek(0)
+            return _as_float(_load_npz(fileobj, ndim))
+        fileobj.seek(0)
+        _check_header(*_read_header(fileobj), ndim)
+        fileobj.seek(0)
+        if is_path:
+            array = np.load(source, mmap_mode='r', allow_pickle=False)
+        else:
+            array = np.load(fileobj, allow_pickle=False)
+    finally:
+        if is_path:
+            fileobj.close()
+    return _as_float(array)
@@ -0,0 +1,190 @@
+"""
+Metode pencarian akar satu variabel: Newton Raphson, Secant, dan Regula Falsi.
+
+Modul ini tidak bergantung pada Django sehingga dipakai bersama oleh view,
+API JSON, job asinkron, dan benchmark. Fungsinya dijalankan di pool proses
+solver (core.offload) dan karena itu harus tetap berada di level modul.
+"""
+from .expression import get_compiled
+from .math_expression import compile_expression
+from .timing import phase
+
+# Callback progres dipanggil sekali setiap sekian iterasi agar tidak memperlambat loop
+PROGRESS_EVERY = 10000
+
+# Fungsi Newton Rapshon
+def newton_rapshon(f_expr, x0, tol, max_iter, progress=None):
+    """
+    Fungsi untuk menghitung akar dari sebuah fungsi menggunakan metode Newton Raphson.
+
+    Parameters:
+    f_expr (str): Ekspresi fungsi sebagai string.
+    x0 (float): Pendekatan awal.
+    tol (float): Toleransi error yang diizinkan.
+    max_iter (int): Jumlah iterasi maksimum.
+    progress (function): Callback opsional yang dipanggil dengan fraksi iterasi yang sudah berjalan.
+
+    Returns:
+    tuple: List dari setiap iterasi yang mencakup nilai x, f(x), f'(x), serta pesan error jika ada.
+    """
+    # Mengambil f(x), f'(x) dan fungsi lambdify-nya dari cache ekspresi
+    with phase('compile'):
+        compiled = get_compiled(f_expr)
+    f_prime = compiled.f_prime
+    f_lambdified = compiled.f
+    f_prime_lambdified = compiled.f_prime_fn
+
+    interatios = []
+    xi = x0
+    for i in range(max_iter):
+        # Melaporkan progres (fraksi dari max_iter) untuk job asinkron
+        if progress and i % PROGRESS_EVERY == 0:
+            progress(i / max_iter)
+        fxi = f_lambdified(xi)
+        f_prime_xi = f_prime_lambdified(xi)
+
+        # Cek apakah f'(x) = 0
+        if f_prime_xi == 0:
+            return None, "Turunan mendekati nol, metode Newton-Raphson gagal.", f_prime
+            
+        # menyimpan informasi itersi ke dalam iterations
+        status = "Lanjut" if abs(fxi) >= tol else "Berhenti"
+        interatios.append({
+            'iteration': i + 1,
+            'x': xi,
+            'f_x': fxi,
+            'f_prime_x': f_prime_xi,
+            'status': status,
+        })
+
+        # Memerisa apakah nilai f(xi) sudah mendekati nol dalam teleransi error yang ditentukan
+        if abs(fxi) < tol:
+            break
+
+        # Mencari akar berikutnya menggunakan metode Newton-Raphson
+        xi = xi - fxi / f_prime_xi
+    return interatios, None, f_prime
+
+
+# Fungsi Metode Secant
+def metode_secant(f_expr, x0, x1, tol, max_iter, progress=None):
+    """
+    Fungsi untuk menghitung akar dari sebuah fungsi menggunakan metode secant.
+
+    Parameters:
+    f_expr (str): Ekspresi fungsi sebagai string.
+    x0, x1 (float): Pendekatan awal.
+    tol (float): Toleransi error yang diizinkan.
+    max_iter (int): Jumlah iterasi maksimum.
+    progress (function): Callback opsional yang dipanggil dengan fraksi iterasi yang sudah berjalan.
+
+    Returns:
+    tuple: List dari setiap iterasi yang mencakup nilai x, f(x), serta pesan error jika ada.
+    """
+    with phase('compile'):
+        f_lambdified = get_compiled(f_expr).f  # Mengambil fungsi terkompilasi dari cache ekspresi
+
+    iterations = []
+    for i in range(max_iter):
+        # Melaporkan progres (fraksi dari max_iter) untuk job asinkron
+        if progress and i % PROGRESS_EVERY == 0:
+            progress(i / max_iter)
+        f_x0 = f_lambdified(x0)
+        f_x1 = f_lambdified(x1)
+
+        # Cek apakah denominasi nol untuk menghindari error pembagian dengan nol
+        if (f_x1 - f_x0) == 0:
+            return None, "Pembagian dengan nol, metode secant gagal."
+
+        # Mencari nilai baru untuk x menggunakan rumus metode secant
+        x2 = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
+
+        # Menyimpan hasil iterasi
+        status = "Lanjut" if abs(f_x1) >= tol else "Berhenti"
+        iterations.append({
+            'iteration': i + 1,
+            'x0': x0,
+            'x1': x1,
+            'f_x0': f_x0,
+            'f_x1': f_x1,
+            'status': status,
+        })
+
+         # Cek apakah nilai f_x1 mendekati nol
+        if abs(f_x1) < tol:
+            break
+
+        # Update nilai untuk iterasi berikutnya
+        x0, x1 = x1, x2
+    return iterations, None
+
+
+# Fungsi Regula Falsi
+def regula_falsi(f, a, b, tol, max_iter, progress=None):
+    """
+    Fungsi untuk menghitung akar dari sebuah fungsi menggunakan metode Regula Falsi.
+
+    Parameters:
+    f (function): Fungsi yang akan dicari akarnya.
+    a (float): Batas bawah interval.
+    b (float): Batas atas interval.
+    tol (float): Toleransi error yang diizinkan.
+    max_iter (int): Jumlah iterasi maksimum.
+    progress (function): Callback opsional yang dipanggil dengan fraksi iterasi yang sudah berjalan.
+
+    Returns:
+    tuple: List dari setiap iterasi yang mencakup nilai a, b, xr, dan f(xr), serta pesan error jika ada.
+    """
+    # Nilai f di titik ujung interval disimpan agar tidak dihitung ulang setiap iterasi
+    fa = f(a)
+    fb = f(b)
+
+    # Jika f(a) dan f(b) memiliki tanda yang sama, akar tidak mungkin ada di interval tersebut
+    if fa * fb >= 0:
+        return None, "Interval [a, b] tidak mengandung akar."
+
+    iterations = []
+    for i in range(max_iter):
+        # Melaporkan progres (fraksi dari max_iter) untuk job asinkron
+        if progress and i % PROGRESS_EVERY == 0:
+            progress(i / max_iter)
+
+        # Menghitung nilai xr menggunakan rumus Regula Falsi
+        xr = b - (fb * (a - b)) / (fa - fb)
+        fxr = f(xr)  # Menghitung nilai f(xr), satu-satunya evaluasi f per iterasi
+
+        # Menyimpan informasi iterasi ke dalam list iterations
+        iterations.append({
+            'iteration': i + 1,
+            'a': a,
+            'b': b,
+            'xr': xr,
+            'f_xr': fxr,
+        })
+
+        # Memeriksa apakah nilai f(xr) sudah mendekati nol dalam toleransi error yang ditentukan
+        if abs(fxr) < tol:
+            break
+
+        # Menentukan interval baru berdasarkan tanda dari f(a) dan f(xr)
+        if fa * fxr < 0:
+            b, fb = xr, fxr  # Akar berada di interval [a, xr]
+        else:
+            a, fa = xr, fxr  # Akar berada di interval [xr, b]
+
+    return iterations, None
+
+
+def metode_regula_falsi(f_expr, a, b, tol, max_iter, progress=None):
+    """
+    Sama seperti regula_falsi, tetapi menerima ekspresi fungsi sebagai string.
+
+    Ekspresinya dikompilasi melalui whitelist AST (solvers.math_expression) sehingga fungsi ini
+    bisa dikirim ke pool proses solver seperti newton_rapshon dan metode_secant.
+
+    Returns:
+    tuple: List dari setiap iterasi dan pesan error jika ada.
+    """
+    with phase('compile'):
+        f = compile_expression(f_expr)
+    return regula_falsi(f, a, b, tol, max_iter, progress)
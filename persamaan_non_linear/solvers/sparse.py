@@ -0,0 +1,154 @@
+"""
+Penyelesaian sistem persamaan linear dengan matriks sparse (scipy.sparse).
+
+Sistem besar dari diskretisasi PDE atau jaringan aliran hampir seluruhnya berisi
+nol. Matriks seperti itu disimpan dalam format CSR sehingga memori dan waktu
+sebanding dengan jumlah elemen bukan nol (nnz), bukan n².
+
+scipy.sparse (yang ikut memuat scipy.linalg) baru diimpor saat matriks sparse
+pertama dibuat atau diselesaikan, agar tidak membebani start-up proses web.
+"""
+from collections import namedtuple
+import sys
+import warnings
+
+import numpy as np
+
+SPARSE_METHODS = ('auto', 'spsolve', 'cg', 'gmres')
+
+# Pada mode 'auto', matriks dengan kepadatan (nnz / n²) sampai nilai ini diselesaikan lewat jalur sparse
+SPARSE_MAX_DENSITY = 0.05
+
+# Hasil solver sparse: solusi, metode yang dipakai, jumlah iterasi (0 untuk spsolve), dan residual relatif
+SparseSolution = namedtuple('SparseSolution', ['x', 'method', 'iterations', 'residual'])
+
+
+def issparse(matrix):
+    """
+    Sama seperti scipy.sparse.issparse, tanpa memuat scipy.sparse.
+
+    Matriks sparse tidak mungkin ada sebelum modul itu diimpor, jadi jika belum dimuat jawabannya pasti False.
+    """
+    sparse = sys.modules.get('scipy.sparse')
+    return sparse is not None and sparse.issparse(matrix)
+
+
+def density(matrix):
+    """
+    Menghitung proporsi elemen bukan nol dari matriks persegi (dense atau sparse).
+
+    Returns:
+    float: nnz / n².
+    """
+    if issparse(matrix):
+        nnz, size = matrix.count_nonzero(), matrix.shape[0] * matrix.shape[1]
+    else:
+        matrix = np.asarray(matrix)
+        nnz, size = np.count_nonzero(matrix), matrix.size
+    return nnz / size if size else 1.0
+
+
+def from_coo(n, rows, cols, values):
+    """
+    Membangun matriks CSR n x n dari triplet COO (baris, kolom, nilai).
+
+    Elemen dengan posisi yang sama dijumlahkan, seperti konvensi format COO.
+    """
+    from scipy.sparse import coo_array
+
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    values = np.asarray(values, dtype=float)
+    if not rows.shape == cols.shape == values.shape or rows.ndim != 1:
+        raise ValueError("Panjang rows, cols, dan values harus sama.")
+    if rows.size and (min(rows.min(), cols.min()) < 0 or max(rows.max(), cols.max()) >= n):
+        raise ValueError("Indeks baris/kolom di luar ukuran matriks.")
+    return coo_array((values, (rows, cols)), shape=(n, n)).tocsr()
+
+
+def from_csr(n, data, indices, indptr):
+    """
+    Membangun matriks CSR n x n dari array data, indices, dan indptr.
+    """
+    from scipy.sparse import csr_array
+
+    matrix = csr_array(
+        (np.asarray(data, dtype=float), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(n, n),
+    )
+    matrix.check_format(full_check=True)
+    return matrix
+
+
+def _is_symmetric_positive_diagonal(matrix):
+    # Syarat murah untuk mencoba CG; jika ternyata tidak definit positif, CG gagal dan spsolve dipakai
+    return (abs(matrix - matrix.T)).count_nonzero() == 0 and bool(np.all(matrix.diagonal() > 0))
+
+
+def _iterative(method, matrix, results, tol, maxiter):
+    from scipy.sparse.linalg import cg, gmres
+
+    iterations = 0
+
+    def count(_):
+        nonlocal iterations
+        iterations += 1
+
+    if method == 'gmres':
+        x, info = gmres(matrix, results, rtol=tol, atol=0.0, maxiter=maxiter, callback=count, callback_type='pr_norm')
+    else:
+        x, info = cg(matrix, results, rtol=tol, atol=0.0, maxiter=maxiter, callback=count)
+    return x, info, iterations
+
+
+def solve_sparse(matrix, results, method='auto', tol=1e-10, maxiter=None):
+    """
+    Menyelesaikan Ax = b untuk matriks sparse.
+
+    Parameters:
+    matrix (sparse array atau array_like): Matriks koefisien A berukuran n x n.
+    results (array_like): Vektor hasil b berukuran n.
+    method (str): 'spsolve' (langsung, SuperLU), 'cg' (untuk matriks simetris definit positif),
+        'gmres' (iteratif umum), atau 'auto' (CG jika A simetris dengan diagonal positif, selain itu spsolve).
+    tol (float): Toleransi residual relatif untuk solver iteratif.
+    maxiter (int): Batas iterasi solver iteratif (None = bawaan SciPy).
+
+    Returns:
+    SparseSolution: Solusi x, metode yang dipakai, jumlah iterasi, dan ||b - Ax|| / ||b||.
+    """
+    from scipy.sparse import csr_array
+    from scipy.sparse.linalg import MatrixRankWarning, spsolve
+
+    if method not in SPARSE_METHODS:
+        raise ValueError(f"Metode sparse '{method}' tidak dikenal.")
+    matrix = csr_array(matrix, dtype=float)
+    results = np.asarray(results, dtype=float)
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Matriks koefisien harus persegi.")
+    if results.shape != (matrix.shape[0],):
+        raise ValueError("Ukuran vektor hasil tidak sesuai dengan matriks.")
+
+    iterations = 0
+    if method == 'auto':
+        method = 'spsolve'
+        if _is_symmetric_positive_diagonal(matrix):
+            x, info, iterations = _iterative('cg', matrix, results, tol, maxiter)
+            if info == 0:
+                method = 'cg'
+
+    if method == 'spsolve':
+        with warnings.catch_warnings():
+            # Matriks singular dilaporkan lewat LinAlgError di bawah, bukan warning
+            warnings.simplefilter('ignore', MatrixRankWarning)
+            x = np.atleast_1d(spsolve(matrix.tocsc(), results))
+        iterations = 0
+        if not np.all(np.isfinite(x)):
+            raise np.linalg.LinAlgError("Tidak ada solusi unik.")
+    elif iterations == 0:
+        x, info, iterations = _iterative(method, matrix, results, tol, maxiter)
+        if info != 0:
+            raise np.linalg.LinAlgError(f"Solver {method.upper()} tidak konvergen setelah {iterations} iterasi.")
+
+    norm = np.linalg.norm(results)
+    residual = np.linalg.norm(results - matrix @ x) / norm if norm else float(np.linalg.norm(matrix @ x))
+    return SparseSolution(x, method, iterations, float(residual))
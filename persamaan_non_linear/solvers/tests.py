@@ -0,0 +1,291 @@
+import os
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+
+import numpy as np
+import scipy.sparse as sp
+
+from .expression import ExpressionCache
+from .math_expression import compile_expression, compile_vectorized
+from .parsing import MAX_BINARY_DIMENSION, MAX_DIMENSION, MatrixParseError, load_binary, parse_matrix, parse_vector
+from .iterative import ITERATIVE_METHODS, auto_method, is_diagonally_dominant, is_two_colourable, solve_iterative
+from .roots import metode_regula_falsi, regula_falsi
+from .sparse import density, from_coo, from_csr, solve_sparse
+from .vectorized import (
+    CONVERGED, NO_SIGN_CHANGE, dedupe_roots, find_all_roots, newton_vectorized, regula_falsi_vectorized,
+    secant_vectorized,
+)
+
+
+class ExpressionCacheTest(SimpleTestCase):
+    def test_hit_setelah_normalisasi(self):
+        cache = ExpressionCache(maxsize=4)
+        first = cache.get('x**2 - 4')
+        second = cache.get('  x**2  -   4 ')
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(first.f_prime_fn(3), 6)
+
+    def test_eviksi_lru(self):
+        cache = ExpressionCache(maxsize=2)
+        cache.get('x')
+        cache.get('x + 1')
+        cache.get('x')  # 'x' menjadi entri terbaru
+        cache.get('x + 2')  # 'x + 1' dikeluarkan
+        self.assertEqual(cache.stats()['size'], 2)
+        cache.get('x + 1')
+        self.assertEqual(cache.stats()['misses'], 4)
+
+    def test_ekspresi_tidak_valid_tidak_disimpan(self):
+        cache = ExpressionCache()
+        with self.assertRaises((SyntaxError, ValueError)):
+            cache.get('x +* (')
+        self.assertEqual(cache.stats()['size'], 0)
+
+
+class CompileExpressionTest(SimpleTestCase):
+    def test_fungsi_math_dan_konstanta(self):
+        f = compile_expression('math.exp(-x) - x')
+        self.assertAlmostEqual(f(0.5), np.exp(-0.5) - 0.5)
+        self.assertAlmostEqual(compile_expression('sin(pi * x) + x^2')(1.0), 1.0)
+
+    def test_caret_mengikuti_presedensi_pangkat(self):
+        self.assertEqual(compile_expression('x^2-2')(3.0), 7.0)
+        self.assertEqual(compile_expression('2*x^2')(3.0), 18.0)
+        np.testing.assert_allclose(compile_vectorized('x^2-2')(np.array([0.0, 2.0])), [-2.0, 2.0])
+        result, error = metode_regula_falsi('x^2-2', 0.0, 2.0, 1e-8, 100)
+        self.assertIsNone(error)
+        self.assertAlmostEqual(result[-1]['xr'], 2 ** 0.5, places=6)
+
+    def test_versi_vektor(self):
+        f = compile_vectorized('exp(-x) - x')
+        np.testing.assert_allclose(f(np.array([0.0, 1.0])), [1.0, np.exp(-1.0) - 1.0])
+
+    def test_menolak_ekspresi_berbahaya(self):
+        for expr in ['__import__("os")', 'x.__class__', '(lambda: 1)()', 'open("f")', '"a" * 3']:
+            with self.assertRaises((SyntaxError, NameError)):
+                compile_expression(expr)
+
+    def test_konstanta_terlalu_besar(self):
+        with self.assertRaisesMessage(SyntaxError, 'Konstanta terlalu besar'):
+            compile_expression('1' + '0' * 400 + '*x - 1')
+
+
+class RegulaFalsiTest(SimpleTestCase):
+    def test_satu_evaluasi_per_iterasi(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x ** 2 - 2
+
+        result, error = regula_falsi(f, 0.0, 2.0, 1e-8, 100)
+        self.assertIsNone(error)
+        self.assertAlmostEqual(result[-1]['xr'], 2 ** 0.5, places=6)
+        self.assertEqual(len(calls), len(result) + 2)
+
+    def test_interval_tanpa_akar(self):
+        result, error = metode_regula_falsi('x**2 + 1', 0.0, 2.0, 1e-6, 10)
+        self.assertIsNone(result)
+        self.assertIsNotNone(error)
+
+    def test_versi_vektor_sama_dengan_skalar(self):
+        f = compile_vectorized('exp(-x) - x')
+        output = regula_falsi_vectorized(f, [0.0, 2.0], [1.0, 3.0], 1e-10, 100)
+        expected, _ = metode_regula_falsi('exp(-x) - x', 0.0, 1.0, 1e-10, 100)
+        self.assertAlmostEqual(output.root[0], expected[-1]['xr'])
+        self.assertEqual(output.iterations[0], len(expected))
+        self.assertEqual(output.status.tolist(), [CONVERGED, NO_SIGN_CHANGE])
+
+
+class VectorizedSolverTest(SimpleTestCase):
+    def test_newton_banyak_lane(self):
+        compiled = ExpressionCache().get('x**3 - x')
+        result = newton_vectorized(compiled.f, compiled.f_prime_fn, [2.0, -2.0, 0.1], 1e-12, 100)
+        np.testing.assert_allclose(result.root, [1.0, -1.0, 0.0], atol=1e-9)
+        self.assertTrue((result.status == CONVERGED).all())
+
+    def test_secant_satu_evaluasi_per_iterasi(self):
+        calls = []
+
+        def f(x):
+            calls.append(x.size)
+            return x ** 2 - 2
+
+        result = secant_vectorized(f, [1.0], [2.0], 1e-10, 50)
+        self.assertAlmostEqual(result.root[0], 2 ** 0.5)
+        # Dua evaluasi awal, lalu satu per iterasi kecuali iterasi terakhir
+        self.assertEqual(len(calls), int(result.iterations[0]) + 1)
+
+    def test_cari_semua_akar(self):
+        compiled = ExpressionCache().get('sin(x)')
+        for method in ('newton-raphson', 'secant'):
+            found = find_all_roots(compiled.f, compiled.f_prime_fn, -1, 10, 1e-12, 50, n_starts=100, method=method)
+            np.testing.assert_allclose(found.roots, [0, np.pi, 2 * np.pi, 3 * np.pi], atol=1e-9)
+            self.assertEqual(len(found.counts), 4)
+
+    def test_dedupe_memilih_f_terkecil(self):
+        found = dedupe_roots(np.array([1.0 + 1e-9, 2.0, 1.0]), np.array([1e-8, 0.0, 1e-12]))
+        np.testing.assert_array_equal(found.roots, [1.0, 2.0])
+        np.testing.assert_array_equal(found.counts, [2, 1])
+
+
+class SparseSolverTest(SimpleTestCase):
+    def setUp(self):
+        # Stensil Poisson 1D: simetris definit positif, tiga diagonal
+        n = 2000
+        self.matrix = sp.diags([-1.0, 2.5, -1.0], [-1, 0, 1], shape=(n, n), format='csr')
+        self.results = np.ones(n)
+
+    def test_semua_metode_sama(self):
+        expected = solve_sparse(self.matrix, self.results, 'spsolve').x
+        for method in ('cg', 'gmres', 'auto'):
+            output = solve_sparse(self.matrix, self.results, method, tol=1e-12)
+            np.testing.assert_allclose(output.x, expected, rtol=1e-8)
+            self.assertGreater(output.iterations, 0)
+        self.assertEqual(solve_sparse(self.matrix, self.results).method, 'cg')
+
+    def test_auto_tidak_simetris_memakai_spsolve(self):
+        matrix = self.matrix.tolil()
+        matrix[0, 5] = 1.0
+        output = solve_sparse(matrix.tocsr(), self.results)
+        self.assertEqual(output.method, 'spsolve')
+        self.assertLess(output.residual, 1e-12)
+
+    def test_format_coo_dan_csr(self):
+        coo = self.matrix.tocoo()
+        from_triplets = from_coo(2000, coo.row, coo.col, coo.data)
+        from_arrays = from_csr(2000, self.matrix.data, self.matrix.indices, self.matrix.indptr)
+        self.assertEqual((from_triplets != self.matrix).nnz, 0)
+        self.assertEqual((from_arrays != self.matrix).nnz, 0)
+        self.assertAlmostEqual(density(from_triplets), (3 * 2000 - 2) / 2000 ** 2)
+        with self.assertRaises(ValueError):
+            from_coo(2, [0, 2], [0, 1], [1.0, 1.0])
+        with self.assertRaises(ValueError):
+            from_csr(2, [1.0], [5], [0, 1, 1])
+
+    def test_matriks_singular(self):
+        with self.assertRaises(np.linalg.LinAlgError):
+            solve_sparse([[1, 2], [2, 4]], [1, 2], 'spsolve')
+
+
+class IterativeSolverTest(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        matrix = rng.random((60, 60))
+        self.matrix = matrix + matrix.T + 150 * np.eye(60)
+        self.results = rng.random(60)
+        self.expected = np.linalg.solve(self.matrix, self.results)
+
+    def test_semua_metode_konvergen(self):
+        for method in ITERATIVE_METHODS:
+            output = solve_iterative(method, self.matrix, self.results, tol=1e-12, max_iter=500)
+            self.assertTrue(output.converged, method)
+            np.testing.assert_allclose(output.x, self.expected, rtol=1e-9)
+            # Riwayat residual: nilai awal ditambah satu nilai per iterasi, berhenti begitu di bawah toleransi
+            self.assertEqual(len(output.residuals), output.iterations + 1)
+            self.assertLess(output.residuals[-1], 1e-12)
+            self.assertGreaterEqual(output.residuals[-2], 1e-12)
+
+    def test_red_black_sama_dengan_gauss_seidel_urutan_genap_ganjil(self):
+        n = 9
+        matrix = sp.diags([-1.0, 3.0, -1.0], [-1, 0, 1], shape=(n, n), format='csr')
+        results = np.arange(1.0, n + 1)
+        output = solve_iterative('gauss-seidel', matrix, results, max_iter=1)
+
+        # Gauss-Seidel klasik dengan urutan indeks genap lalu ganjil
+        dense = matrix.toarray()
+        x = np.zeros(n)
+        for i in list(range(0, n, 2)) + list(range(1, n, 2)):
+            x[i] = (results[i] - dense[i] @ x + dense[i, i] * x[i]) / dense[i, i]
+        np.testing.assert_allclose(output.x, x)
+
+    def test_urutan_alami_jika_tidak_dua_warna(self):
+        tridiagonal = sp.diags([-1.0, 3.0, -1.0], [-1, 0, 1], shape=(9, 9), format='csr')
+        self.assertTrue(is_two_colourable(tridiagonal))
+        self.assertTrue(is_two_colourable(tridiagonal.toarray()))
+        self.assertFalse(is_two_colourable(self.matrix))
+        self.assertFalse(is_two_colourable(sp.csr_array(self.matrix)))
+
+        # Satu sweep SOR klasik dengan urutan indeks 0, 1, ..., n - 1
+        omega = 1.25
+        x = np.zeros(60)
+        for i in range(60):
+            gs = (self.results[i] - self.matrix[i] @ x + self.matrix[i, i] * x[i]) / self.matrix[i, i]
+            x[i] += omega * (gs - x[i])
+        for matrix in (self.matrix, sp.csr_array(self.matrix)):
+            output = solve_iterative('sor', matrix, self.results, max_iter=1, omega=omega)
+            np.testing.assert_allclose(output.x, x)
+
+    def test_tidak_konvergen_dilaporkan(self):
+        output = solve_iterative('jacobi', [[1, 3], [2, 1]], [1, 1], max_iter=20)
+        self.assertFalse(output.converged)
+        self.assertEqual(output.iterations, 20)
+
+    def test_pemilihan_otomatis(self):
+        self.assertEqual(auto_method(self.matrix), 'cg')
+        nonsymmetric = self.matrix.copy()
+        nonsymmetric[0, 1] += 1
+        self.assertEqual(auto_method(nonsymmetric), 'gauss-seidel')
+        self.assertFalse(is_diagonally_dominant([[1, 2], [2, 1]]))
+        self.assertIsNone(auto_method([[1, 2], [2, 1]]))
+
+
+class MatrixParserTest(SimpleTestCase):
+    def test_format_list_dan_teks(self):
+        expected = [[1, 2], [3, -4.5]]
+        for text in ('[[1, 2], [3, -4.5]]', '((1, 2), (3, -4.5))', '1,2\n3,-4.5\n', '1 2; 3 -4.5', '1\t2\r\n3\t-4.5'):
+            np.testing.assert_array_equal(parse_matrix(text), expected)
+        np.testing.assert_array_equal(parse_vector('[6, 2, 10]'), [6, 2, 10])
+        np.testing.assert_array_equal(parse_vector('6\n2\n1e1'), [6, 2, 10])
+
+    def test_sama_dengan_literal_eval(self):
+        matrix = np.random.default_rng(2).normal(size=(40, 40))
+        np.testing.assert_array_equal(parse_matrix(str(matrix.tolist())), matrix)
+
+    def test_input_tidak_valid(self):
+        for text in ('[[1, 2], [3]]', '[[1, 2], [3, x]]', '[[1, 2], 3]', '', '[[1, [2]]]', '1 2\n3', '__import__("os")', '1 nan\n2 3'):
+            with self.assertRaises(MatrixParseError, msg=text):
+                parse_matrix(text)
+
+    def test_nilai_kosong_ditolak(self):
+        for text in ('1,,2\n3,4', '[[1,,2],[3,4]]', '[[1, 2,], [3, 4]]', '[[, 1], [2, 3]]'):
+            with self.assertRaisesMessage(MatrixParseError, 'nilai kosong', msg=text):
+                parse_matrix(text)
+        for text in ('1,,2', '[1, , 2]', '1,2,'):
+            with self.assertRaisesMessage(MatrixParseError, 'nilai kosong', msg=text):
+                parse_vector(text)
+
+    def test_input_panjang_tidak_valid_ditolak_cepat(self):
+        # Validasi list bersarang linear terhadap panjang input (tanpa backtracking regex)
+        started = time.perf_counter()
+        for text in ('[[1]' + ' ' * 200_000 + 'x', '[[1]' + ' ' * 200_000 + 'x]', '[' + '[1] ' * 50_000 + '[2'):
+            with self.assertRaises(MatrixParseError):
+                parse_matrix(text)
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+    def test_batas_ukuran_sebelum_alokasi(self):
+        text = '\n'.join(['1'] * (MAX_DIMENSION + 1))
+        with self.assertRaisesMessage(MatrixParseError, 'maksimal'):
+            parse_matrix(text)
+
+    def test_file_npy_dibuka_sebagai_memory_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.npy')
+            np.save(path, np.eye(4))
+            matrix = load_binary(path, 2)
+            self.assertIsInstance(matrix, np.memmap)
+            np.testing.assert_array_equal(matrix, np.eye(4))
+
+    def test_ukuran_npy_diperiksa_dari_header(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.npy')
+            n = MAX_BINARY_DIMENSION + 1
+            # File hanya berisi header; isi array tidak pernah dibaca karena ukurannya ditolak lebih dulu
+            with open(path, 'wb') as fileobj:
+                np.lib.format.write_array_header_1_0(fileobj, {'descr': '<f8', 'fortran_order': False, 'shape': (n, n)})
+            with self.assertRaisesMessage(MatrixParseError, 'maksimal'):
+                load_binary(path, 2)
@@ -0,0 +1,53 @@
+"""
+Pengukuran waktu per fase perhitungan, tanpa ketergantungan pada Django.
+
+Solver menandai fasenya dengan `with phase('compile'):`. Di luar collect() blok
+ini tidak melakukan apa-apa, sehingga solver tetap bisa dipakai langsung dari
+skrip atau notebook. Pengumpulan per request dan histogramnya ada di
+core.instrumentation.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# Waktu fase untuk pekerjaan yang sedang diukur: dict nama fase -> detik, atau None di luar collect()
+_timings = ContextVar('instrumentation_timings', default=None)
+
+
+@contextmanager
+def collect():
+    """
+    Mengumpulkan waktu semua fase yang dijalankan di dalam blok ini.
+
+    Returns:
+    dict: Nama fase -> total detik, terisi setelah blok selesai.
+    """
+    timings = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def phase(name):
+    """Mengukur waktu blok sebagai fase `name`; tidak melakukan apa-apa di luar collect()."""
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + perf_counter() - start
+
+
+def record(timings):
+    """Menambahkan waktu fase yang diukur di tempat lain (misalnya di proses worker) ke pengukuran ini."""
+    current = _timings.get()
+    if current is None:
+        return
+    for name, seconds in timings.items():
+        current[name] = current.get(name, 0.0) + seconds
@@ -0,0 +1,285 @@
+"""
+Mesin pencarian akar tervektorisasi untuk banyak titik awal sekaligus.
+
+Setiap titik awal adalah satu "lane" pada array NumPy. Semua lane yang masih
+aktif diperbarui bersamaan dalam satu langkah iterasi, dan lane yang sudah
+selesai (konvergen, turunan/penyebut nol, divergen, atau mencapai max_iter)
+dibekukan sehingga fungsi tidak lagi dievaluasi untuknya.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# Kode status per lane
+CONVERGED = 0
+MAX_ITER = 1
+ZERO_DERIVATIVE = 2
+DIVERGED = 3
+NO_SIGN_CHANGE = 4
+
+STATUS_NAMES = {
+    CONVERGED: 'converged',
+    MAX_ITER: 'max_iter',
+    ZERO_DERIVATIVE: 'zero_derivative',
+    DIVERGED: 'diverged',
+    NO_SIGN_CHANGE: 'no_sign_change',
+}
+
+# Hasil ringkas: akar, jumlah iterasi, kode status, dan f(akar) untuk setiap lane
+VectorResult = namedtuple('VectorResult', ['root', 'iterations', 'status', 'f_root'])
+
+
+def evaluate(func, x):
+    """
+    Mengevaluasi fungsi hasil lambdify pada array dan selalu mengembalikan array float seukuran x.
+
+    Ekspresi konstan (misalnya '2') menghasilkan skalar sehingga perlu di-broadcast,
+    dan hasil kompleks (misalnya sqrt dari bilangan negatif) dianggap NaN.
+    """
+    with np.errstate(all='ignore'):
+        values = np.asarray(func(x))
+    if np.iscomplexobj(values):
+        values = np.where(values.imag == 0, values.real, np.nan)
+    return np.broadcast_to(values.astype(float, copy=False), x.shape)
+
+
+def _prepare(x0, tol, max_iter):
+    x = np.array(x0, dtype=float).ravel()
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), x.shape)
+    max_iter = np.broadcast_to(np.asarray(max_iter, dtype=np.int64), x.shape)
+    return x, tol, max_iter
+
+
+def newton_vectorized(f, f_prime, x0, tol, max_iter):
+    """
+    Metode Newton Raphson untuk banyak titik awal secara bersamaan.
+
+    Urutan pemeriksaan per lane sama dengan newton_rapshon: turunan nol diperiksa
+    lebih dulu, lalu toleransi |f(x)| < tol, lalu batas iterasi.
+
+    Parameters:
+    f, f_prime (function): f(x) dan f'(x) yang menerima array NumPy.
+    x0 (array_like): Titik awal untuk setiap lane.
+    tol (float atau array_like): Toleransi error, per lane atau sama untuk semua.
+    max_iter (int atau array_like): Jumlah iterasi maksimum, per lane atau sama untuk semua.
+
+    Returns:
+    VectorResult: Array akar, jumlah iterasi, kode status, dan f(akar) per lane.
+    """
+    x, tol, max_iter = _prepare(x0, tol, max_iter)
+    n = x.size
+    root = np.full(n, np.nan)
+    f_root = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+
+    active = np.flatnonzero(max_iter > 0)
+    while active.size:
+        xa = x[active]
+        fx = evaluate(f, xa)
+        fpx = evaluate(f_prime, xa)
+        iterations[active] += 1
+
+        zero = fpx == 0
+        converged = ~zero & (np.abs(fx) < tol[active])
+        diverged = ~zero & ~converged & ~(np.isfinite(fx) & np.isfinite(fpx))
+        exhausted = iterations[active] >= max_iter[active]
+        done = zero | converged | diverged | exhausted
+
+        status[active[zero]] = ZERO_DERIVATIVE
+        status[active[converged]] = CONVERGED
+        status[active[diverged]] = DIVERGED
+        root[active[done]] = xa[done]
+        f_root[active[done]] = fx[done]
+
+        # Lane yang belum selesai maju satu langkah Newton
+        running = ~done
+        if not running.any():
+            break
+        x[active[running]] = xa[running] - fx[running] / fpx[running]
+        active = active[running]
+
+    return VectorResult(root, iterations, status, f_root)
+
+
+def secant_vectorized(f, x0, x1, tol, max_iter):
+    """
+    Metode Secant untuk banyak pasangan titik awal secara bersamaan.
+
+    Nilai f(x1) dari langkah sebelumnya dipakai ulang sebagai f(x0) di langkah
+    berikutnya, sehingga setiap lane hanya butuh satu evaluasi f per iterasi.
+
+    Parameters:
+    f (function): f(x) yang menerima array NumPy.
+    x0, x1 (array_like): Pasangan titik awal untuk setiap lane.
+    tol (float atau array_like): Toleransi error, per lane atau sama untuk semua.
+    max_iter (int atau array_like): Jumlah iterasi maksimum, per lane atau sama untuk semua.
+
+    Returns:
+    VectorResult: Array akar, jumlah iterasi, kode status, dan f(akar) per lane.
+        Status ZERO_DERIVATIVE berarti penyebut f(x1) - f(x0) bernilai nol.
+    """
+    x0, tol, max_iter = _prepare(x0, tol, max_iter)
+    x1 = np.broadcast_to(np.asarray(x1, dtype=float).ravel(), x0.shape).copy()
+    n = x0.size
+    root = np.full(n, np.nan)
+    f_root = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+
+    f0 = evaluate(f, x0).copy()
+    f1 = evaluate(f, x1).copy()
+    active = np.flatnonzero(max_iter > 0)
+    while active.size:
+        fa0 = f0[active]
+        fa1 = f1[active]
+        iterations[active] += 1
+
+        denominator = fa1 - fa0
+        zero = denominator == 0
+        converged = ~zero & (np.abs(fa1) < tol[active])
+        diverged = ~zero & ~converged & ~(np.isfinite(fa0) & np.isfinite(fa1))
+        exhausted = iterations[active] >= max_iter[active]
+        done = zero | converged | diverged | exhausted
+
+        status[active[zero]] = ZERO_DERIVATIVE
+        status[active[converged]] = CONVERGED
+        status[active[diverged]] = DIVERGED
+        root[active[done]] = x1[active[done]]
+        f_root[active[done]] = fa1[done]
+
+        # Lane yang belum selesai maju satu langkah Secant
+        running = active[~done]
+        if not running.size:
+            break
+        xa0 = x0[running]
+        xa1 = x1[running]
+        x2 = xa1 - f1[running] * (xa1 - xa0) / denominator[~done]
+        x0[running] = xa1
+        f0[running] = f1[running]
+        x1[running] = x2
+        f1[running] = evaluate(f, x2)
+        active = running
+
+    return VectorResult(root, iterations, status, f_root)
+
+
+def regula_falsi_vectorized(f, a, b, tol, max_iter):
+    """
+    Metode Regula Falsi untuk banyak interval secara bersamaan.
+
+    Seperti regula_falsi, f(a) dan f(b) disimpan sehingga setiap lane hanya butuh
+    satu evaluasi f per iterasi. Lane dengan f(a) * f(b) >= 0 langsung selesai
+    dengan status NO_SIGN_CHANGE tanpa iterasi.
+
+    Parameters:
+    f (function): f(x) yang menerima array NumPy.
+    a, b (array_like): Batas bawah dan atas interval untuk setiap lane.
+    tol (float atau array_like): Toleransi error, per lane atau sama untuk semua.
+    max_iter (int atau array_like): Jumlah iterasi maksimum, per lane atau sama untuk semua.
+
+    Returns:
+    VectorResult: Array akar, jumlah iterasi, kode status, dan f(akar) per lane.
+    """
+    a, tol, max_iter = _prepare(a, tol, max_iter)
+    b = np.broadcast_to(np.asarray(b, dtype=float).ravel(), a.shape).copy()
+    n = a.size
+    root = np.full(n, np.nan)
+    f_root = np.full(n, np.nan)
+    iterations = np.zeros(n, dtype=np.int64)
+    status = np.full(n, MAX_ITER, dtype=np.int8)
+
+    fa = evaluate(f, a).copy()
+    fb = evaluate(f, b).copy()
+    no_sign_change = ~(fa * fb < 0)
+    status[no_sign_change] = NO_SIGN_CHANGE
+    active = np.flatnonzero(~no_sign_change & (max_iter > 0))
+    while active.size:
+        aa, ba, faa, fba = a[active], b[active], fa[active], fb[active]
+        xr = ba - fba * (aa - ba) / (faa - fba)
+        fxr = evaluate(f, xr)
+        iterations[active] += 1
+
+        converged = np.abs(fxr) < tol[active]
+        diverged = ~converged & ~np.isfinite(fxr)
+        exhausted = iterations[active] >= max_iter[active]
+        done = converged | diverged | exhausted
+
+        status[active[converged]] = CONVERGED
+        status[active[diverged]] = DIVERGED
+        root[active[done]] = xr[done]
+        f_root[active[done]] = fxr[done]
+
+        # Lane yang belum selesai mempersempit intervalnya ke sisi yang masih mengandung akar
+        running = ~done
+        if not running.any():
+            break
+        left = running & (faa * fxr < 0)
+        right = running & ~left
+        b[active[left]] = xr[left]
+        fb[active[left]] = fxr[left]
+        a[active[right]] = xr[right]
+        fa[active[right]] = fxr[right]
+        active = active[running]
+
+    return VectorResult(root, iterations, status, f_root)
+
+
+# Akar-akar unik hasil pencarian multi-start: nilai akar, f(akar), dan jumlah titik awal yang menuju ke sana
+RootSet = namedtuple('RootSet', ['roots', 'f_roots', 'counts'])
+
+
+def dedupe_roots(roots, f_roots, atol=1e-6):
+    """
+    Menggabungkan akar-akar yang berdekatan menjadi satu.
+
+    Dua akar dianggap sama jika selisihnya tidak lebih dari atol * max(1, |akar|).
+    Dari setiap kelompok dipilih akar dengan |f(akar)| terkecil.
+
+    Parameters:
+    roots (ndarray): Akar-akar yang sudah konvergen.
+    f_roots (ndarray): Nilai f di setiap akar.
+    atol (float): Toleransi jarak antar akar.
+
+    Returns:
+    RootSet: Akar unik yang terurut naik.
+    """
+    order = np.argsort(roots, kind='stable')
+    roots = roots[order]
+    f_roots = f_roots[order]
+    if not roots.size:
+        return RootSet(roots, f_roots, np.zeros(0, dtype=np.int64))
+
+    gaps = np.diff(roots) > atol * np.maximum(1.0, np.abs(roots[1:]))
+    cluster = np.concatenate(([0], np.cumsum(gaps)))
+    best = np.lexsort((np.abs(f_roots), cluster))
+    first = np.concatenate(([True], cluster[best][1:] != cluster[best][:-1]))
+    chosen = best[first]
+    return RootSet(roots[chosen], f_roots[chosen], np.bincount(cluster))
+
+
+def find_all_roots(f, f_prime, lo, hi, tol, max_iter, n_starts=200, method='newton-raphson'):
+    """
+    Mencari semua akar di interval [lo, hi] dengan menjalankan solver dari grid titik awal.
+
+    Parameters:
+    f, f_prime (function): f(x) dan f'(x) yang menerima array NumPy (f_prime tidak dipakai untuk secant).
+    lo, hi (float): Batas interval pencarian.
+    tol (float): Toleransi error.
+    max_iter (int): Jumlah iterasi maksimum per titik awal.
+    n_starts (int): Jumlah titik awal yang disebar merata di [lo, hi].
+    method (str): 'newton-raphson' atau 'secant'.
+
+    Returns:
+    RootSet: Akar unik di dalam [lo, hi] yang ditemukan.
+    """
+    starts = np.linspace(lo, hi, n_starts)
+    if method == 'secant':
+        # Titik awal kedua diletakkan setengah jarak grid di sebelah kanan titik pertama
+        step = (hi - lo) / max(n_starts - 1, 1) / 2 or 1e-3
+        result = secant_vectorized(f, starts, starts + step, tol, max_iter)
+    else:
+        result = newton_vectorized(f, f_prime, starts, tol, max_iter)
+
+    found = (result.status == CONVERGED) & (result.root >= lo) & (result.root <= hi)
+    return dedupe_roots(result.root[found], result.f_root[found])
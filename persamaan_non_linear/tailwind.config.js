@@ -8,6 +8,8 @@ module.exports = {
     './secant/templates/**/*.html', // all HTML files in folder templates
     './secant/**/*.py', // all python fiiles in application Django
     './gaus/**/*.py',
+    './regula_falsi/templates/**/*.html',
+    './regula_falsi/**/*.py',
   ],
   theme: {
     extend: {},